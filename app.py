@@ -5,53 +5,375 @@ import os
 import json
 import logging
 import glob
+import time
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Blueprint, Response, render_template, jsonify, request, url_for, g
+from flask.json.provider import DefaultJSONProvider
+from book_store import get_book_store
+from atomic_io import data_dir_lock
+from manifest import load_manifest, manifest_path, weeks_by_year, week_filenames, week_checksums
+from book_query import BookQuery, WeekIndex, query_positions
+from book_record import BookRecord, records_from_json
+from book_registry import BookRegistry, registry_path, is_week_refs
+from book_export import FORMATS as EXPORT_FORMATS, export_lines, parse_week_spec
+from week_archive import WeekArchive, archive_paths, list_archived_weeks
+from search_index import SearchIndex, load_index, save_index
+from jobs import ScrapeJobQueue
+from response_cache import ResponseBodyCache, file_version, make_cached_response
+from metrics import REGISTRY, CONTENT_TYPE as METRICS_CONTENT_TYPE, ROUTE_SECONDS, FILE_READ_SECONDS, timer
+
+logger = logging.getLogger("aladin_app")
 
 # Vercel 환경 감지
 IS_VERCEL = os.environ.get('VERCEL', False) or os.environ.get('VERCEL_ENV', False)
 
-# Vercel이 아닐 때만 scraper 함수 import
-if not IS_VERCEL:
-    try:
-        from scraper import scrape_aladin_new_books, get_latest_books, get_latest_interesting_books
-    except ImportError:
-        logger.warning("scraper 모듈을 import할 수 없습니다. 읽기 전용 모드로 실행됩니다.")
-        IS_VERCEL = True
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("app.log"),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger("aladin_app")
+# 로그 파일 (빈 값이면 파일에 쓰지 않음, Vercel에서는 항상 콘솔만 사용)
+APP_LOG_FILE = os.environ.get("ALADIN_APP_LOG", "app.log")
 
 # 데이터 디렉토리
 DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
-os.makedirs(DATA_DIR, exist_ok=True)
 
-# Flask 앱 초기화
-app = Flask(__name__)
+# 메모리에 유지할 최대 주차 수 (주차당 week/interesting 파일 2개)
+CACHE_MAX_WEEKS = int(os.environ.get("ALADIN_CACHE_WEEKS", "8"))
+
+# 라우트는 블루프린트에 등록하고 create_app()에서 앱에 붙입니다
+bp = Blueprint("main", __name__)
+
+_scraper = None
+_scraper_lock = threading.Lock()
+
+def load_scraper():
+    """
+    scraper 모듈을 처음 필요할 때 import합니다. (requests, bs4 등 스크래핑 의존성은 페이지 조회에 필요 없음)
+    Vercel이거나 import할 수 없으면 None을 돌려줍니다. (읽기 전용 모드)
+    """
+    global _scraper, IS_VERCEL
+    if IS_VERCEL:
+        return None
+    with _scraper_lock:
+        if _scraper is None:
+            try:
+                import scraper
+            except ImportError as e:
+                logger.warning("scraper 모듈을 import할 수 없습니다. 읽기 전용 모드로 실행됩니다. (%s)", e)
+                IS_VERCEL = True
+                return None
+            _scraper = scraper
+    return _scraper
+
+def configure_logging():
+    """
+    루트 로거에 콘솔(+ 로컬이면 APP_LOG_FILE) 핸들러를 붙입니다. 이미 설정되어 있으면 그대로 둡니다.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    handlers = [logging.StreamHandler()]
+    if APP_LOG_FILE and not IS_VERCEL:
+        try:
+            handlers.insert(0, logging.FileHandler(APP_LOG_FILE))
+        except OSError as e:
+            print(f"로그 파일을 열 수 없어 콘솔에만 기록합니다: {e}")
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=handlers
+    )
+
+class BookJSONProvider(DefaultJSONProvider):
+    """
+    jsonify가 BookRecord를 원래 JSON 형식의 딕셔너리로 직렬화하도록 합니다.
+    """
+    @staticmethod
+    def default(o):
+        if isinstance(o, BookRecord):
+            return o.to_dict()
+        return DefaultJSONProvider.default(o)
+
+def create_app():
+    """
+    Flask 앱을 만듭니다. 로깅과 데이터 디렉토리 준비는 import가 아니라 여기서 합니다.
+    """
+    configure_logging()
+    if not IS_VERCEL:
+        os.makedirs(DATA_DIR, exist_ok=True)
+
+    flask_app = Flask(__name__)
+    flask_app.json = BookJSONProvider(flask_app)
+    flask_app.register_blueprint(bp)
+    return flask_app
+
+@bp.before_app_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@bp.after_app_request
+def record_request_time(response):
+    """
+    라우트별 응답 시간을 기록합니다. (라우트는 URL 규칙 단위, 매칭되지 않은 요청은 "unmatched")
+    """
+    started = g.pop("request_started", None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        ROUTE_SECONDS.observe(time.perf_counter() - started,
+                              route=route, method=request.method, status=response.status_code)
+    return response
+
+class JsonFileCache:
+    """
+    파일 경로를 키로 하는 JSON 데이터 캐시입니다.
+    파일의 mtime/크기가 바뀌면 다시 읽고, max_entries를 넘으면 가장 오래 쓰지 않은 항목부터 버립니다.
+    돌려준 데이터는 여러 요청이 공유하므로 호출하는 쪽에서 수정하면 안 됩니다.
+    """
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # 경로 → ((mtime_ns, size), 데이터)
+        self._lock = threading.Lock()
+
+    def load(self, path, convert=None):
+        """
+        path의 JSON 데이터를 돌려줍니다. 파일이 없으면 FileNotFoundError가 발생합니다.
+        convert를 주면 읽은 데이터를 convert(data)로 바꿔 캐시합니다. (같은 경로는 항상 같은 convert로 읽어야 합니다)
+        """
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+
+        with timer(FILE_READ_SECONDS), open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if convert is not None:
+            data = convert(data)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[path] = (version, data)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return data
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+# 주차 파일 + 매니페스트 + 레지스트리
+data_cache = JsonFileCache(max_entries=CACHE_MAX_WEEKS * 2 + 2)
+
+def get_registry():
+    """
+    참조 목록 형식의 주차 파일을 푸는 데 쓰는 도서 레지스트리 (data/registry.json, 캐시 공유)
+    """
+    return data_cache.load(registry_path(DATA_DIR), convert=BookRegistry.from_dict)
+
+def week_books_from_json(data):
+    """
+    주차 파일 JSON(책 목록 또는 레지스트리 참조 목록) → BookRecord 목록
+    """
+    if is_week_refs(data):
+        data = get_registry().resolve(data["refs"])
+    return records_from_json(data)
+
+def load_books(path):
+    """
+    주차 JSON 파일의 책 목록을 BookRecord 목록으로 읽습니다. (캐시 공유, 수정 금지)
+    """
+    return data_cache.load(path, convert=week_books_from_json)
+
+# 주차별 렌더링 페이지 + 최신 페이지 + API 응답 2개
+response_cache = ResponseBodyCache(max_entries=CACHE_MAX_WEEKS + 3)
+
+class ManifestView:
+    """
+    매니페스트 한 버전에서 미리 계산한 조회용 데이터 (주차 선택기, 주차별 항목)
+    """
+    def __init__(self, manifest):
+        self.manifest = manifest
+        self.weeks_by_year = weeks_by_year(manifest)
+        self.entries = {(entry["year"], entry["week"]): entry for entry in manifest["weeks"]}
+        latest = manifest.get("latest")
+        self.latest = self.entries.get((latest["year"], latest["week"])) if latest else None
+
+_manifest_view = None
+_manifest_view_lock = threading.Lock()
+
+def get_manifest_view():
+    """
+    스크래퍼가 관리하는 data/manifest.json을 읽어 ManifestView로 돌려줍니다.
+    매니페스트가 없으면 None을 돌려줍니다. (이 경우 파일 목록을 직접 훑습니다)
+    """
+    global _manifest_view
+    path = manifest_path(DATA_DIR)
+    try:
+        manifest = data_cache.load(path)
+    except (OSError, ValueError):
+        return None
+
+    with _manifest_view_lock:
+        if _manifest_view is None or _manifest_view.manifest is not manifest:
+            _manifest_view = ManifestView(manifest)
+        return _manifest_view
+
+class WeekIndexCache:
+    """
+    주차별 WeekIndex 캐시입니다. 색인을 만든 도서 목록 객체가 그대로이면(JsonFileCache 적중) 재사용합니다.
+    """
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # (연도, 주차) → (도서 목록, WeekIndex)
+        self._lock = threading.Lock()
+
+    def get(self, key, books):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is books:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        index = WeekIndex(books)
+        with self._lock:
+            self._entries[key] = (books, index)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return index
+
+week_indexes = WeekIndexCache(max_entries=CACHE_MAX_WEEKS)
+
+class WeekArchiveCache:
+    """
+    아카이브된 주차의 WeekArchive 캐시입니다. 오프셋 색인 파일의 mtime/크기가 바뀌면 다시 엽니다.
+    전체 목록이 필요할 때만 모든 블록을 풀고, 그 결과도 같은 버전 동안 재사용합니다.
+    """
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # (연도, 주차) → (버전, WeekArchive, {"books", "featured"})
+        self._lock = threading.Lock()
+
+    def _entry(self, year, week):
+        version = file_version(archive_paths(DATA_DIR, year, week)[1])[0]
+        if version is None:
+            return None
+        key = (year, week)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                return entry
+
+        entry = (version, WeekArchive(DATA_DIR, year, week), {})
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def archive(self, year, week):
+        """
+        주차의 WeekArchive. 아카이브가 없으면 None
+        """
+        entry = self._entry(year, week)
+        return entry[1] if entry is not None else None
+
+    def load(self, year, week):
+        """
+        주차의 (전체 도서, 주목할만한 책). 아카이브가 없으면 None
+        """
+        entry = self._entry(year, week)
+        if entry is None:
+            return None
+        _, archive, loaded = entry
+        if "books" not in loaded:
+            loaded["featured"] = records_from_json(archive.featured())
+            loaded["books"] = records_from_json(archive.books())
+        return loaded["books"], loaded["featured"]
+
+week_archives = WeekArchiveCache(max_entries=CACHE_MAX_WEEKS)
+
+_search_index = None  # (색인을 맞춘 ManifestView, SearchIndex)
+_search_index_lock = threading.Lock()
+
+def get_search_index():
+    """
+    data/search_index.json을 불러와 돌려줍니다. 매니페스트가 바뀌면 체크섬이 달라진 주차만
+    다시 색인하고, 쓰기 가능한 환경이면 저장합니다. (매니페스트가 없으면 처음 한 번만 맞춥니다)
+    검색 요청은 잠금 없이 색인을 읽으므로, 갱신은 사본에 한 뒤 참조를 한 번에 바꿉니다.
+    """
+    global _search_index
+    view = get_manifest_view()
+    with _search_index_lock:
+        if _search_index is not None and (view is None or _search_index[0] is view):
+            return _search_index[1]
+
+        index = _search_index[1].copy() if _search_index is not None else (load_index(DATA_DIR) or SearchIndex())
+        checksums = week_checksums(view.manifest) if view is not None else None
+        if index.sync(DATA_DIR, checksums) and not IS_VERCEL:
+            save_search_index(index, checksums)
+        _search_index = (view, index)
+        return index
+
+def save_search_index(index, checksums):
+    """
+    스크래퍼와 같은 data 쓰기 잠금 안에서 색인을 저장합니다. 그 사이 스크래퍼가 매니페스트를 바꿨다면
+    (스크래퍼가 더 새로운 색인을 이미 저장했으므로) 덮어쓰지 않습니다.
+    """
+    try:
+        with data_dir_lock(DATA_DIR):
+            if checksums is not None:
+                manifest = load_manifest(DATA_DIR)
+                if manifest is None or week_checksums(manifest) != checksums:
+                    return
+            save_index(index, DATA_DIR)
+    except OSError as e:
+        logger.warning("검색 색인을 저장할 수 없습니다: %s", e)
+
+def get_latest_data_file(prefix):
+    """
+    data 디렉토리에서 prefix로 시작하는 가장 최근 주차 파일의 경로를 돌려줍니다.
+    """
+    view = get_manifest_view()
+    if view is not None:
+        if not view.latest:
+            return None
+        filename = view.latest["featured_file"] if prefix == "interesting_week" else view.latest["week_file"]
+        return os.path.join(DATA_DIR, filename) if filename else None
+
+    files = glob.glob(os.path.join(DATA_DIR, f"{prefix}_*.json"))
+    return max(files) if files else None
 
 def get_latest_books():
     """
     가장 최근 week 파일에서 모든 책 데이터를 가져옵니다.
     """
     try:
-        files = glob.glob(os.path.join(DATA_DIR, "week_*.json"))
-        if not files:
+        store = get_book_store()
+        if store:
+            latest = store.latest_week()
+            return store.get_week_books(*latest) if latest else []
+
+        latest_file = get_latest_data_file("week")
+        if not latest_file:
+            # 최신 주차까지 아카이브되었으면 아카이브에서 읽기
+            latest = get_latest_week()
+            archived = week_archives.load(*latest) if latest else None
+            if archived is not None:
+                return archived[0]
             logger.warning("week 파일을 찾을 수 없습니다.")
             return []
 
-        latest_file = max(files)
-        with open(latest_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_books(latest_file)
     except Exception as e:
-        logger.error(f"최신 책 데이터 가져오기 실패: {e}")
+        logger.error("최신 책 데이터 가져오기 실패: %s", e)
         return []
 
 def get_latest_interesting_books():
@@ -59,16 +381,24 @@ def get_latest_interesting_books():
     가장 최근 interesting_week 파일에서 주목할만한 책 데이터를 가져옵니다.
     """
     try:
-        files = glob.glob(os.path.join(DATA_DIR, "interesting_week_*.json"))
-        if not files:
+        store = get_book_store()
+        if store:
+            latest = store.latest_week()
+            return store.get_featured_books(*latest) if latest else []
+
+        latest_file = get_latest_data_file("interesting_week")
+        if not latest_file:
+            # 최신 주차까지 아카이브되었으면 아카이브에서 읽기
+            latest = get_latest_week()
+            archived = week_archives.load(*latest) if latest else None
+            if archived is not None:
+                return archived[1]
             logger.warning("interesting_week 파일을 찾을 수 없습니다.")
             return []
 
-        latest_file = max(files)
-        with open(latest_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_books(latest_file)
     except Exception as e:
-        logger.error(f"최신 주목할만한 책 데이터 가져오기 실패: {e}")
+        logger.error("최신 주목할만한 책 데이터 가져오기 실패: %s", e)
         return []
 
 def get_available_weeks():
@@ -77,8 +407,17 @@ def get_available_weeks():
     Returns: {year: [weeks]} 형식의 딕셔너리
     """
     try:
-        # 모든 interesting_week 파일 찾기
-        files = glob.glob(os.path.join(DATA_DIR, "interesting_week_*.json"))
+        store = get_book_store()
+        if store:
+            return store.list_weeks()
+
+        view = get_manifest_view()
+        if view is not None:
+            return view.weeks_by_year
+
+        # 매니페스트가 없으면 모든 interesting_week 파일과 아카이브 찾기
+        files = {os.path.basename(file) for file in glob.glob(os.path.join(DATA_DIR, "interesting_week_*.json"))}
+        files.update(week_filenames(year, week)[1] for year, week in list_archived_weeks(DATA_DIR))
 
         # 파일명에서 연도와 주차 추출 (interesting_week_2025_W01.json)
         weeks_by_year = {}
@@ -100,7 +439,7 @@ def get_available_weeks():
 
         return weeks_by_year
     except Exception as e:
-        logger.error(f"주차 목록 가져오기 실패: {e}")
+        logger.error("주차 목록 가져오기 실패: %s", e)
         return {}
 
 def get_books_by_week(year, week):
@@ -108,171 +447,439 @@ def get_books_by_week(year, week):
     특정 연도/주차의 책 데이터를 가져옵니다.
     """
     try:
+        store = get_book_store()
+        if store:
+            return store.get_week_books(year, week), store.get_featured_books(year, week)
+
         all_books_file = os.path.join(DATA_DIR, f"week_{year}_W{week:02d}.json")
         featured_books_file = os.path.join(DATA_DIR, f"interesting_week_{year}_W{week:02d}.json")
 
         all_books = []
         featured_books = []
 
+        # JSON 파일이 없으면 지난 주차 아카이브에서 읽기
+        if not os.path.exists(all_books_file) and not os.path.exists(featured_books_file):
+            return week_archives.load(year, week) or ([], [])
+
         if os.path.exists(all_books_file):
-            with open(all_books_file, 'r', encoding='utf-8') as f:
-                all_books = json.load(f)
+            all_books = load_books(all_books_file)
 
         if os.path.exists(featured_books_file):
-            with open(featured_books_file, 'r', encoding='utf-8') as f:
-                featured_books = json.load(f)
+            featured_books = load_books(featured_books_file)
 
         return all_books, featured_books
     except Exception as e:
-        logger.error(f"{year}년 {week}주차의 책 데이터 가져오기 실패: {e}")
+        logger.error("%s년 %s주차의 책 데이터 가져오기 실패: %s", year, week, e)
         return [], []
 
-@app.route('/')
+def index_data_version(selected, current):
+    """
+    메인 페이지 렌더링 결과의 데이터 버전을 돌려줍니다. None이면 캐시하지 않습니다.
+    selected: (연도, 주차) 또는 최신 데이터이면 None
+    """
+    if get_book_store():
+        return None
+
+    if selected is None:
+        data_files = file_version(get_latest_data_file("week"), get_latest_data_file("interesting_week"))
+        if None in data_files:
+            latest = get_latest_week()
+            data_files = file_version(archive_paths(DATA_DIR, *latest)[1]) if latest else (None,)
+        # 데이터가 없으면 렌더링 중에 스크래핑이 실행될 수 있으므로 캐시하지 않음
+        if None in data_files:
+            return None
+    else:
+        data_files = file_version(*(os.path.join(DATA_DIR, name) for name in week_filenames(*selected)),
+                                  archive_paths(DATA_DIR, *selected)[1])
+
+    # 주차 선택기는 data 디렉토리(매니페스트)와 현재 주차에 따라 달라짐
+    return (current,) + file_version(DATA_DIR, manifest_path(DATA_DIR)) + data_files
+
+def render_index(selected, current_year, current_week):
+    """
+    메인 페이지를 렌더링합니다.
+    selected: (연도, 주차) 또는 최신 데이터이면 None
+    """
+    # 사용 가능한 모든 주차 가져오기
+    available_weeks = get_available_weeks()
+
+    # 파라미터가 없으면 최신 데이터 사용
+    if selected is None:
+        # 최신 도서 데이터 가져오기
+        all_books = get_latest_books()
+        featured_books = get_latest_interesting_books()
+
+        # Vercel 환경이 아니고 데이터가 없으면 스크래핑 실행
+        scraper = load_scraper() if not all_books or not featured_books else None
+        if scraper is not None:
+            logger.info("데이터가 없어 스크래핑을 실행합니다.")
+            try:
+                all_books, featured_books = scraper.scrape_aladin_new_books()
+            except Exception as e:
+                logger.error("스크래핑 중 오류 발생: %s", e)
+                # 빈 리스트로 계속 진행
+                if not all_books:
+                    all_books = []
+                if not featured_books:
+                    featured_books = []
+
+        # 마지막 업데이트 시간 계산 (매니페스트 우선)
+        last_update = "데이터 없음"
+        view = get_manifest_view()
+        if view is not None and view.latest and view.latest.get("last_scrape"):
+            last_update = view.latest["last_scrape"]
+        elif all_books and len(all_books) > 0:
+            if 'scrape_date' in all_books[0]:
+                last_update = all_books[0]['scrape_date']
+            else:
+                # 파일 수정 시간으로 대체
+                latest_file = get_latest_data_file("week")
+                if latest_file:
+                    last_update = datetime.fromtimestamp(os.path.getmtime(latest_file)).strftime("%Y-%m-%d %H:%M:%S")
+
+        # 사용할 연도와 주차 결정
+        selected_year = current_year
+        selected_week = current_week
+        if available_weeks:
+            # 가장 최근 연도
+            latest_year = max(available_weeks.keys())
+            selected_year = latest_year
+            # 해당 연도의 가장 최근 주차
+            if available_weeks[latest_year]:
+                selected_week = max(available_weeks[latest_year])
+    else:
+        # 지정된 연도/주차의 데이터 가져오기
+        selected_year, selected_week = selected
+        all_books, featured_books = get_books_by_week(selected_year, selected_week)
+
+        # 마지막 업데이트 시간 (매니페스트 우선)
+        view = get_manifest_view()
+        entry = view.entries.get((selected_year, selected_week)) if view is not None else None
+        if entry and entry.get("last_scrape"):
+            last_update = entry["last_scrape"]
+        elif all_books and len(all_books) > 0 and 'scrape_date' in all_books[0]:
+            last_update = all_books[0]['scrape_date']
+        else:
+            last_update = f"{selected_year}년 {selected_week}주차 데이터"
+
+    return render_template('index.html',
+                          all_books=all_books,
+                          featured_books=featured_books,
+                          last_update=last_update,
+                          selected_year=selected_year,
+                          selected_week=selected_week,
+                          current_year=current_year,
+                          current_week=current_week,
+                          available_weeks=available_weeks)
+
+def get_latest_week():
+    """
+    데이터가 있는 가장 최근 (연도, 주차)를 돌려줍니다. 없으면 None을 돌려줍니다.
+    """
+    available_weeks = get_available_weeks()
+    if not available_weeks:
+        return None
+    latest_year = max(available_weeks.keys())
+    return latest_year, max(available_weeks[latest_year])
+
+@bp.route('/')
 def index():
     """
-    메인 페이지 렌더링
+    메인 페이지 렌더링 (데이터 버전마다 한 번만 렌더링하고 ETag/압축 본문 재사용)
     """
+    # 연도와 주차 파라미터 확인
+    year_param = request.args.get('year', None)
+    week_param = request.args.get('week', None)
     try:
-        # 연도와 주차 파라미터 확인
-        year_param = request.args.get('year', None)
-        week_param = request.args.get('week', None)
+        selected = (int(year_param), int(week_param)) if year_param and week_param else None
+    except ValueError as e:
+        return render_template('error.html', error=str(e))
+    return index_response(selected)
 
-        # 사용 가능한 모든 주차 가져오기
-        available_weeks = get_available_weeks()
+@bp.route('/weeks/<int:year>/<int:week>/')
+def week_page(year, week):
+    """
+    주차별 페이지 (정적 내보내기와 같은 경로, 내보낸 파일이 없을 때의 대체 경로)
+    """
+    return index_response((year, week))
 
+def index_response(selected):
+    """
+    메인 페이지 응답 (데이터 버전마다 한 번만 렌더링하고 ETag/압축 본문 재사용)
+    """
+    try:
         # 현재 연도와 주차
         now = datetime.now()
         current_year, current_week, _ = now.isocalendar()
 
-        # 파라미터가 없으면 최신 데이터 사용
-        if not year_param or not week_param:
-            # 최신 도서 데이터 가져오기
-            all_books = get_latest_books()
-            featured_books = get_latest_interesting_books()
-
-            # Vercel 환경이 아니고 데이터가 없으면 스크래핑 실행
-            if not IS_VERCEL and (not all_books or not featured_books):
-                logger.info("데이터가 없어 스크래핑을 실행합니다.")
-                try:
-                    all_books, featured_books = scrape_aladin_new_books()
-                except Exception as e:
-                    logger.error(f"스크래핑 중 오류 발생: {e}")
-                    # 빈 리스트로 계속 진행
-                    if not all_books:
-                        all_books = []
-                    if not featured_books:
-                        featured_books = []
-
-            # 마지막 업데이트 시간 계산
-            last_update = "데이터 없음"
-            if all_books and len(all_books) > 0:
-                if 'scrape_date' in all_books[0]:
-                    last_update = all_books[0]['scrape_date']
-                else:
-                    # 파일 수정 시간으로 대체
-                    files = [f for f in os.listdir(DATA_DIR) if f.startswith("week_")]
-                    if files:
-                        latest_file = max(files)
-                        file_path = os.path.join(DATA_DIR, latest_file)
-                        last_update = datetime.fromtimestamp(os.path.getmtime(file_path)).strftime("%Y-%m-%d %H:%M:%S")
-
-            # 사용할 연도와 주차 결정
-            selected_year = current_year
-            selected_week = current_week
-            if available_weeks:
-                # 가장 최근 연도
-                latest_year = max(available_weeks.keys())
-                selected_year = latest_year
-                # 해당 연도의 가장 최근 주차
-                if available_weeks[latest_year]:
-                    selected_week = max(available_weeks[latest_year])
-        else:
-            # 지정된 연도/주차의 데이터 가져오기
-            selected_year = int(year_param)
-            selected_week = int(week_param)
-            all_books, featured_books = get_books_by_week(selected_year, selected_week)
-
-            # 마지막 업데이트 시간
-            if all_books and len(all_books) > 0 and 'scrape_date' in all_books[0]:
-                last_update = all_books[0]['scrape_date']
-            else:
-                last_update = f"{selected_year}년 {selected_week}주차 데이터"
-
-        return render_template('index.html',
-                              all_books=all_books,
-                              featured_books=featured_books,
-                              last_update=last_update,
-                              selected_year=selected_year,
-                              selected_week=selected_week,
-                              current_year=current_year,
-                              current_week=current_week,
-                              available_weeks=available_weeks)
+        cached = response_cache.get_or_build(
+            ("index", selected),
+            index_data_version(selected, (current_year, current_week)),
+            lambda: (render_index(selected, current_year, current_week), "text/html")
+        )
+        return make_cached_response(cached)
 
     except Exception as e:
-        logger.error(f"메인 페이지 렌더링 중 오류 발생: {e}")
+        logger.error("메인 페이지 렌더링 중 오류 발생: %s", e)
         return render_template('error.html', error=str(e))
 
-@app.route('/refresh')
+def run_scrape_job(job):
+    """
+    백그라운드 실행기에서 스크래핑 작업 하나를 실행합니다.
+    """
+    all_books, _ = load_scraper().scrape_aladin_new_books(progress=job.update_progress, cancel_event=job.cancel_event)
+    if not all_books:
+        raise RuntimeError("스크래핑 결과가 없습니다. 로그를 확인해주세요.")
+    return all_books
+
+_scrape_jobs = None
+_scrape_jobs_lock = threading.Lock()
+
+def get_scrape_jobs(scraper):
+    """
+    스크래핑 작업 큐 (처음 작업을 제출할 때 실행기 스레드를 만듭니다)
+    동시에 들어온 첫 /refresh 요청들도 같은 큐를 쓰도록 잠금 안에서 한 번만 만듭니다.
+    """
+    global _scrape_jobs
+    if _scrape_jobs is None:
+        with _scrape_jobs_lock:
+            if _scrape_jobs is None:
+                _scrape_jobs = ScrapeJobQueue(run_scrape_job, cancelled=scraper.ScrapeCancelled)
+    return _scrape_jobs
+
+def job_response(job):
+    payload = job.to_dict()
+    payload["status_url"] = url_for('main.refresh_status', job_id=job.id)
+    return payload
+
+@bp.route('/refresh')
 def refresh_data():
     """
     데이터 수동 새로고침 API (Vercel 환경에서는 비활성화)
+    스크래핑 작업을 백그라운드에 제출하고 바로 작업 ID를 돌려줍니다.
+    같은 주차의 작업이 이미 진행 중이면 그 작업을 돌려줍니다.
     """
-    if IS_VERCEL:
+    scraper = load_scraper()
+    if scraper is None:
         return jsonify({
             "success": False,
             "message": "Vercel 환경에서는 스크래핑이 비활성화되어 있습니다. 로컬에서 scraper.py를 실행하고 데이터를 GitHub에 업로드해주세요."
         }), 403
 
     try:
-        all_books, featured_books = scrape_aladin_new_books()
-        return jsonify({
-            "success": True,
-            "message": f"데이터 새로고침 완료. {len(all_books)}권의 책 정보를 가져왔습니다.",
-            "count": len(all_books)
-        })
+        year, week, _ = datetime.now().isocalendar()
+        job, created = get_scrape_jobs(scraper).submit((year, week))
+        payload = job_response(job)
+        payload["success"] = True
+        payload["message"] = "스크래핑 작업을 시작했습니다." if created else "이미 진행 중인 스크래핑 작업이 있습니다."
+        return jsonify(payload), 202
     except Exception as e:
-        logger.error(f"데이터 새로고침 중 오류 발생: {e}")
+        logger.error("데이터 새로고침 중 오류 발생: %s", e)
         return jsonify({
             "success": False,
             "message": f"오류 발생: {str(e)}"
         }), 500
 
-@app.route('/api/books')
+@bp.route('/refresh/status/<job_id>')
+def refresh_status(job_id):
+    """
+    스크래핑 작업 상태와 책 단위 진행률
+    """
+    # 작업 큐는 /refresh가 처음 작업을 제출할 때 만들어짐 (없으면 작업도 없음)
+    job = _scrape_jobs.get(job_id) if _scrape_jobs is not None else None
+    if job is None:
+        return jsonify({"success": False, "message": "작업을 찾을 수 없습니다."}), 404
+    return jsonify(job_response(job))
+
+@bp.route('/refresh/cancel/<job_id>', methods=['POST'])
+def refresh_cancel(job_id):
+    """
+    대기/실행 중인 스크래핑 작업 취소 (실행 중이면 다음 상세 요청 전에 멈춥니다)
+    """
+    jobs = _scrape_jobs
+    job = jobs.get(job_id) if jobs is not None else None
+    if job is None:
+        return jsonify({"success": False, "message": "작업을 찾을 수 없습니다."}), 404
+    if not jobs.cancel(job_id):
+        return jsonify({"success": False, "message": "이미 끝난 작업입니다.", **job_response(job)}), 409
+    return jsonify({"success": True, "message": "취소를 요청했습니다.", **job_response(job)}), 202
+
+def api_data_version(prefix):
+    """
+    API 응답의 데이터 버전 (최신 주차 파일). SQLite 저장소를 쓰면 None(캐시하지 않음)입니다.
+    """
+    if get_book_store():
+        return None
+    latest_file = get_latest_data_file(prefix)
+    if latest_file:
+        return file_version(latest_file)
+    latest = get_latest_week()
+    return file_version(archive_paths(DATA_DIR, *latest)[1]) if latest else None
+
+@bp.route('/api/books')
 def api_books():
     """
     모든 책 정보를 JSON으로 제공하는 API
     """
     try:
-        books = get_latest_books()
-        return jsonify(books)
+        cached = response_cache.get_or_build(
+            ("api_books",),
+            api_data_version("week"),
+            lambda: (jsonify(get_latest_books()).get_data(), "application/json")
+        )
+        return make_cached_response(cached)
     except Exception as e:
-        logger.error(f"API 호출 중 오류 발생: {e}")
+        logger.error("API 호출 중 오류 발생: %s", e)
         return jsonify({"error": str(e)}), 500
 
-@app.route('/api/featured')
+@bp.route('/api/featured')
 def api_featured():
     """
     주목할만한 책 5권 정보를 JSON으로 제공하는 API
     """
     try:
-        books = get_latest_interesting_books()
-        return jsonify(books)
+        cached = response_cache.get_or_build(
+            ("api_featured",),
+            api_data_version("interesting_week"),
+            lambda: (jsonify(get_latest_interesting_books()).get_data(), "application/json")
+        )
+        return make_cached_response(cached)
     except Exception as e:
-        logger.error(f"API 호출 중 오류 발생: {e}")
+        logger.error("API 호출 중 오류 발생: %s", e)
         return jsonify({"error": str(e)}), 500
 
+@bp.route('/api/weeks/<int:year>/<int:week>/<kind>.json')
+def api_week_json(year, week, kind):
+    """
+    주차별 전체 도서(books)/주목할만한 책(featured) JSON (정적 내보내기와 같은 경로)
+    """
+    if kind not in ("books", "featured"):
+        return jsonify({"error": "books 또는 featured만 지원합니다"}), 404
+    all_books, featured_books = get_books_by_week(year, week)
+    if not all_books and not featured_books:
+        return jsonify({"error": f"{year}년 {week}주차 데이터가 없습니다"}), 404
+    return jsonify(all_books if kind == "books" else featured_books)
+
+@bp.route('/api/v1/books')
+def api_query_books():
+    """
+    주차별 도서 조회 API (필터, 필드 선택, 커서 기반 페이지네이션)
+
+    파라미터: year, week (생략하면 최신 주차), limit, cursor, fields (쉼표 구분),
+              category (분류 경로 접두사 또는 분류 이름), publisher, min_price, max_price
+    """
+    try:
+        query = BookQuery.from_args(request.args)
+        year_param = request.args.get('year')
+        week_param = request.args.get('week')
+        if year_param and week_param:
+            year, week = int(year_param), int(week_param)
+        else:
+            latest = get_latest_week()
+            if latest is None:
+                return jsonify({"error": "데이터가 없습니다."}), 404
+            year, week = latest
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        archive = None
+        if not query.has_filters and not os.path.exists(os.path.join(DATA_DIR, week_filenames(year, week)[0])):
+            archive = week_archives.archive(year, week)
+
+        if archive is not None:
+            # 아카이브된 주차는 필요한 블록만 풀어서 한 페이지를 읽음
+            result = query_positions(len(archive), archive.page, query)
+        else:
+            books, featured_books = get_books_by_week(year, week)
+            # /api/weeks/<연도>/<주차>/<종류>.json과 같이 주차 파일도 아카이브도 없으면 404
+            if not books and not featured_books:
+                return jsonify({"error": f"{year}년 {week}주차 데이터가 없습니다"}), 404
+            result = week_indexes.get((year, week), books).query(query)
+        body = jsonify({
+            "year": year,
+            "week": week,
+            "total": result["total"],
+            "next_cursor": result["next_cursor"],
+            "items": result["items"]
+        }).get_data()
+        # 조건 조합이 다양해 본문은 저장하지 않고 ETag/압축만 적용
+        cached = response_cache.get_or_build(None, None, lambda: (body, "application/json"))
+        return make_cached_response(cached)
+    except Exception as e:
+        logger.error("API 호출 중 오류 발생: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+@bp.route('/api/export.<fmt>')
+def api_export(fmt):
+    """
+    여러 주차의 도서를 NDJSON/CSV로 스트리밍 (주차 파일을 하나씩 읽으며 한 줄씩 보냄)
+
+    파라미터: from, to (예: 2026-W01, 생략하면 처음/최신 주차까지), fields (쉼표 구분),
+              category, publisher, min_price, max_price (/api/v1/books와 같은 필터)
+    """
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": f"지원하지 않는 형식입니다: {fmt} ({', '.join(EXPORT_FORMATS)})"}), 404
+    try:
+        query = BookQuery.from_args(request.args, max_limit=None)
+        lines = export_lines(fmt, query, parse_week_spec(request.args.get('from')),
+                             parse_week_spec(request.args.get('to')), DATA_DIR)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    response = Response(lines, mimetype=EXPORT_FORMATS[fmt])
+    response.headers['Content-Disposition'] = f'attachment; filename="aladin_books.{fmt}"'
+    return response
+
+@bp.route('/api/search')
+def api_search():
+    """
+    전체 주차 도서 검색 API (제목, 저자, 출판사, 분류 경로)
+
+    파라미터: q (검색어), limit (기본 20, 최대 100), year, week (해당 주차에 나온 책만)
+    """
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({"error": "검색어(q)를 입력해주세요."}), 400
+
+    try:
+        limit = min(int(request.args.get('limit', 20)), 100)
+        year = int(request.args['year']) if request.args.get('year') else None
+        week = int(request.args['week']) if request.args.get('week') else None
+        if limit < 1:
+            raise ValueError("limit은 1 이상이어야 합니다")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        result = get_search_index().search(query, limit=limit, year=year, week=week)
+        return jsonify({"query": query, "total": result["total"], "items": result["items"]})
+    except Exception as e:
+        logger.error("검색 중 오류 발생: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+@bp.route('/metrics')
+def metrics():
+    """
+    이 프로세스의 타이머/카운터 (Prometheus 텍스트 형식)
+    """
+    return Response(REGISTRY.render(), mimetype=None, content_type=METRICS_CONTENT_TYPE)
+
 if __name__ == "__main__":
+    app = create_app()
+
     # Vercel이 아닐 때만 초기 데이터 확인 및 스크래핑 실행
     if not IS_VERCEL:
         try:
             all_books = get_latest_books()
             featured_books = get_latest_interesting_books()
 
-            if not all_books or not featured_books:
+            scraper = load_scraper() if not all_books or not featured_books else None
+            if scraper is not None:
                 logger.info("초기 데이터가 없어 스크래핑을 실행합니다.")
-                scrape_aladin_new_books()
+                scraper.scrape_aladin_new_books()
         except Exception as e:
-            logger.error(f"초기 데이터 확인 중 오류 발생: {e}")
+            logger.error("초기 데이터 확인 중 오류 발생: %s", e)
 
     # 앱 실행
     app.run(host='0.0.0.0', port=5000, debug=True)
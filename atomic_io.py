@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+data/ 파일의 원자적 쓰기와 프로세스 간 쓰기 잠금.
+
+스케줄러, /refresh, app.py 시작 시 스크래핑이 같은 주차 파일을 동시에 쓸 수 있으므로
+- 파일은 같은 디렉토리의 임시 파일에 다 쓴 뒤 os.replace로 교체해, 읽는 쪽은 잠금 없이도
+  항상 이전 또는 새 파일 전체만 보고
+- 읽기-병합-쓰기 구간은 파일 잠금(fcntl.flock, Windows는 msvcrt.locking)으로 한 프로세스씩만 실행합니다.
+
+같은 프로세스의 스레드끼리는 잠금 파일 경로마다 하나뿐인 FileLock의 스레드 잠금으로 배제됩니다.
+(file_lock(path)가 같은 경로에 항상 같은 객체를 돌려줌) 둘 다 없는 플랫폼에서는 프로세스 안에서만
+배제되고, 처음 잠글 때 경고를 한 번 남깁니다.
+"""
+
+import os
+import json
+import time
+import logging
+import tempfile
+import threading
+
+from metrics import FILE_WRITE_SECONDS, FILE_WRITE_BYTES
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+try:
+    import msvcrt
+    HAS_MSVCRT = True
+except ImportError:
+    HAS_MSVCRT = False
+
+logger = logging.getLogger("aladin_atomic_io")
+
+# 새로 만드는 파일의 권한 (웹 서버가 다른 사용자로 읽을 수 있도록)
+DEFAULT_FILE_MODE = 0o644
+
+# data 디렉토리 쓰기 잠금 파일 이름 (스크래퍼와 웹 앱이 함께 사용)
+WRITE_LOCK_FILENAME = ".write.lock"
+
+def atomic_write_json(path, data, **dump_kwargs):
+    """
+    data를 JSON으로 임시 파일에 쓰고 fsync한 뒤 path로 교체합니다.
+    dump_kwargs는 json.dump에 그대로 전달됩니다. (기본값: ensure_ascii=False, indent=2)
+    """
+    dump_kwargs.setdefault("ensure_ascii", False)
+    if "separators" not in dump_kwargs:
+        dump_kwargs.setdefault("indent", 2)
+    _atomic_write(path, 'w', lambda f: json.dump(data, f, **dump_kwargs))
+
+def atomic_write_bytes(path, data):
+    """
+    바이트 data를 임시 파일에 쓰고 fsync한 뒤 path로 교체합니다.
+    """
+    _atomic_write(path, 'wb', lambda f: f.write(data))
+
+def _atomic_write(path, mode, write):
+    started = time.perf_counter()
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        # mkstemp는 0600으로 만들므로 기존 파일 권한(없으면 0644)을 유지
+        try:
+            file_mode = os.stat(path).st_mode & 0o777
+        except OSError:
+            file_mode = DEFAULT_FILE_MODE
+        os.chmod(tmp_path, file_mode)
+        with os.fdopen(fd, mode, **({} if 'b' in mode else {"encoding": 'utf-8'})) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+            FILE_WRITE_BYTES.inc(f.tell())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    # 교체 자체가 디스크에 남도록 디렉토리도 fsync (지원하지 않는 플랫폼은 건너뜀)
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        dir_fd = None
+    if dir_fd is not None:
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+    FILE_WRITE_SECONDS.observe(time.perf_counter() - started)
+
+class FileLock:
+    """
+    잠금 파일에 대한 배타적 잠금입니다. 인스턴스의 스레드 잠금이 같은 프로세스 안의 스레드를,
+    파일 잠금이 다른 프로세스를 배제하므로 같은 경로에는 file_lock(path)로 얻은 객체 하나를 같이 씁니다.
+    fcntl과 msvcrt가 모두 없는 플랫폼에서는 프로세스 안에서만 유효합니다.
+
+    사용법:
+        with file_lock(path):
+            ...
+    """
+    _warned_no_os_lock = False
+
+    def __init__(self, path, timeout=None, poll_interval=0.2):
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._thread_lock = threading.Lock()
+        self._fd = None
+
+    def acquire(self):
+        """
+        잠금을 얻을 때까지 기다립니다. timeout(초)이 지나면 TimeoutError가 발생합니다.
+        """
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        if not self._thread_lock.acquire(timeout=-1 if self.timeout is None else self.timeout):
+            raise TimeoutError(f"잠금을 얻지 못했습니다: {self.path}")
+        if not HAS_FCNTL and not HAS_MSVCRT:
+            if not FileLock._warned_no_os_lock:
+                FileLock._warned_no_os_lock = True
+                logger.warning(f"파일 잠금을 지원하지 않는 플랫폼이라 다른 프로세스와의 쓰기는 배제되지 않습니다: {self.path}")
+            return
+
+        try:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            waited = False
+            while True:
+                try:
+                    _lock_fd(fd)
+                    break
+                except _LOCK_BUSY_ERRORS:
+                    if deadline is not None and time.monotonic() >= deadline:
+                        os.close(fd)
+                        raise TimeoutError(f"잠금을 얻지 못했습니다: {self.path}")
+                    if not waited:
+                        logger.info(f"다른 프로세스가 쓰는 중이라 기다립니다: {self.path}")
+                        waited = True
+                    time.sleep(self.poll_interval)
+            self._fd = fd
+        except BaseException:
+            self._thread_lock.release()
+            raise
+
+    def release(self):
+        if self._fd is not None:
+            _unlock_fd(self._fd)
+            os.close(self._fd)
+            self._fd = None
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+# 다른 프로세스가 잠금을 잡고 있을 때 나는 오류 (msvcrt는 errno만 다른 OSError)
+_LOCK_BUSY_ERRORS = (BlockingIOError,) if HAS_FCNTL else (OSError,)
+
+def _lock_fd(fd):
+    """
+    잠금 파일을 기다리지 않고 잠급니다. 다른 프로세스가 잡고 있으면 _LOCK_BUSY_ERRORS가 발생합니다.
+    """
+    if HAS_FCNTL:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    else:
+        # msvcrt는 바이트 범위 잠금이므로 첫 바이트를 잠금 표시로 씀
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+def _unlock_fd(fd):
+    if HAS_FCNTL:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+# 잠금 파일 절대 경로 → 프로세스에서 공유하는 FileLock
+_file_locks = {}
+_file_locks_guard = threading.Lock()
+
+def file_lock(path):
+    """
+    path의 FileLock. 같은 경로에는 항상 같은 객체를 돌려주므로 스레드끼리도 서로 배제됩니다.
+    """
+    key = os.path.abspath(path)
+    with _file_locks_guard:
+        lock = _file_locks.get(key)
+        if lock is None:
+            lock = _file_locks[key] = FileLock(key)
+        return lock
+
+def data_dir_lock(data_dir):
+    """
+    data 디렉토리 쓰기 잠금 (프로세스 간 공유). 주차 파일, 매니페스트, 검색 색인을 쓰는 쪽은 모두 이 잠금을 잡습니다.
+    """
+    return file_lock(os.path.join(data_dir, WRITE_LOCK_FILENAME))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 주차를 메모리에 올렸을 때 책 한 권당 메모리 사용량을 JSON 딕셔너리와 BookRecord로 비교합니다.
+
+data/의 주차 파일을 --weeks개 주차만큼 복제해 주차마다 따로 json.loads 하고(실제로 주차 파일을
+하나씩 읽는 것과 같음), 읽은 목록 전체가 차지하는 메모리를 tracemalloc으로 잽니다.
+BookRecord로 바꾼 결과는 원래 JSON과 같은지도 확인합니다.
+
+사용법:
+    python benchmarks/bench_book_memory.py [--weeks 52,260] [--source data/week_2026_W01.json]
+"""
+
+import os
+import gc
+import sys
+import glob
+import json
+import argparse
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from book_record import records_from_json  # noqa: E402
+
+def default_sources():
+    return sorted(glob.glob(os.path.join(ROOT_DIR, "data", "week_*.json")))
+
+def load_weeks(texts, weeks, convert=None):
+    """
+    주차 JSON 텍스트를 돌아가며 weeks개 주차만큼 읽습니다.
+    """
+    loaded = []
+    for week in range(weeks):
+        books = json.loads(texts[week % len(texts)])
+        loaded.append(convert(books) if convert else books)
+    return loaded
+
+def measure(texts, weeks, convert=None):
+    """
+    반환값: (읽은 주차 목록, 유지 중인 메모리 바이트)
+    """
+    gc.collect()
+    tracemalloc.start()
+    loaded = load_weeks(texts, weeks, convert)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return loaded, current
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="책 레코드 메모리 사용량 벤치마크 (dict vs BookRecord)")
+    arg_parser.add_argument("--weeks", default="52,260", help="메모리에 올릴 주차 수 목록 (쉼표 구분)")
+    arg_parser.add_argument("--source", action="append", help="복제할 주차 JSON 파일 (기본값: data/week_*.json)")
+    args = arg_parser.parse_args()
+
+    sources = args.source or default_sources()
+    if not sources:
+        arg_parser.error("주차 JSON 파일이 없습니다")
+    texts = []
+    for path in sources:
+        with open(path, 'r', encoding='utf-8') as f:
+            texts.append(f.read())
+
+    print(f"원본: {', '.join(os.path.relpath(path, ROOT_DIR) for path in sources)}")
+    print(f"{'주차':>5} {'권수':>7} {'dict':>12} {'BookRecord':>12} {'권당 dict':>10} {'권당 레코드':>11} {'절감':>6}")
+    for weeks in [int(value) for value in args.weeks.split(",") if value.strip()]:
+        dict_weeks, dict_bytes = measure(texts, weeks)
+        book_count = sum(len(books) for books in dict_weeks)
+        record_weeks, record_bytes = measure(texts, weeks, records_from_json)
+
+        # 변환이 손실 없는지 확인
+        for books, records in zip(dict_weeks, record_weeks):
+            if [record.to_dict() for record in records] != books:
+                raise SystemExit("BookRecord.to_dict() 결과가 원래 JSON과 다릅니다")
+        del dict_weeks, record_weeks
+
+        print(f"{weeks:>5} {book_count:>7} {dict_bytes / 1e6:10.1f}MB {record_bytes / 1e6:10.1f}MB "
+              f"{dict_bytes / book_count:9.0f}B {record_bytes / book_count:10.0f}B "
+              f"{1 - record_bytes / dict_bytes:6.1%}")
+
+if __name__ == "__main__":
+    main()
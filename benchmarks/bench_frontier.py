@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 목록과 페이지를 훑는 크롤 프런티어(crawl_frontier.py)의 실행 시간과 중복 제거를 확인합니다.
+aladin.co.kr에는 요청하지 않고, 목록 픽스처(benchmarks/fixtures/wnew_list.html)를 로컬 HTTP 서버로
+재생합니다. 서버는 목록/페이지마다 ItemId를 바꿔 돌려주고, --pages 이후 페이지는 빈 목록을 돌려줍니다.
+
+--distinct보다 많은 목록은 앞 목록과 같은 책을 돌려주므로(다른 NewType에 같은 책이 나오는 경우)
+중복 제거가 동작하는지 볼 수 있습니다. 목록 페이지 동시 요청 수별로 실행 시간을 비교합니다.
+
+사용법:
+    python benchmarks/bench_frontier.py [--listings 4] [--pages 3] [--distinct 3] [--latency 0.2] [--workers 1,4,8]
+"""
+
+import os
+import re
+import sys
+import time
+import logging
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from crawl_frontier import CrawlFrontier  # noqa: E402
+from http_client import HttpClient, AdaptiveRateLimiter  # noqa: E402
+from parsers import parse_list_items  # noqa: E402
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "wnew_list.html")
+LIST_PATH = "/shop/common/wnew.aspx"
+ITEM_ID_PATTERN = re.compile(r'(ItemId=)(\d+)', re.IGNORECASE)
+
+class ListingServer:
+    """
+    listing(목록 번호)와 page 파라미터에 따라 ItemId를 바꾼 목록 페이지를 돌려주는 로컬 HTTP 서버
+    """
+    def __init__(self, list_html, pages, distinct, latency):
+        self.list_html = list_html
+        self.pages = pages
+        self.distinct = distinct
+        self.latency = latency
+        self.hits = 0
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                with server._lock:
+                    server.hits += 1
+                query = parse_qs(urlsplit(self.path).query)
+                body = server.page_body(int(query.get("listing", ["0"])[0]), int(query.get("page", ["1"])[0]))
+                time.sleep(server.latency)
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def page_body(self, listing, page):
+        if page > self.pages:
+            return b"<html><body></body></html>"
+        offset = ((listing % self.distinct) * 1000 + page) * 1_000_000_000
+        html = ITEM_ID_PATTERN.sub(lambda match: f"{match.group(1)}{int(match.group(2)) + offset}", self.list_html)
+        return html.encode('utf-8')
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+def run(server, list_urls, max_pages, workers):
+    client = HttpClient(
+        pool_size=max(workers, 1),
+        max_retries=0,
+        limiter_factory=lambda: AdaptiveRateLimiter(rate=1e9, min_rate=1e9, max_rate=1e9, burst=1e9))
+    frontier = CrawlFrontier(list_urls, fetch=lambda url: client.get_text(url, use_cache=False),
+                             parse=parse_list_items, max_pages=max_pages, max_workers=workers)
+    hits_before = server.hits
+    start = time.perf_counter()
+    listed_books = frontier.crawl()
+    elapsed = time.perf_counter() - start
+    client.close()
+    return elapsed, len(listed_books), server.hits - hits_before
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="크롤 프런티어(여러 목록 + 페이지) 벤치마크")
+    arg_parser.add_argument("--listings", type=int, default=4, help="목록 URL 수")
+    arg_parser.add_argument("--pages", type=int, default=3, help="목록마다 책이 있는 페이지 수")
+    arg_parser.add_argument("--distinct", type=int, default=3, help="서로 다른 책을 가진 목록 수 (나머지는 중복)")
+    arg_parser.add_argument("--latency", type=float, default=0.2, help="목록 페이지 응답 지연(초)")
+    arg_parser.add_argument("--workers", default="1,4,8", help="목록 페이지 동시 요청 수 목록 (쉼표 구분)")
+    args = arg_parser.parse_args()
+    logging.basicConfig(level=logging.WARNING, format='%(name)s - %(levelname)s - %(message)s')
+
+    with open(FIXTURE_PATH, 'r', encoding='utf-8') as f:
+        list_html = f.read()
+    per_page = len(parse_list_items(list_html))
+    distinct = max(1, min(args.distinct, args.listings))
+
+    with ListingServer(list_html, args.pages, distinct, args.latency) as server:
+        list_urls = [f"{server.url}{LIST_PATH}?listing={listing}" for listing in range(args.listings)]
+        # 마지막 페이지 다음의 빈 페이지에서 멈추는지 보도록 최대 페이지를 하나 더 줌
+        max_pages = args.pages + 1
+        print(f"목록 {args.listings}개 x {args.pages}페이지 x {per_page}권 (서로 다른 목록 {distinct}개, "
+              f"예상 {distinct * args.pages * per_page}권), 응답 지연 {args.latency:g}s")
+        for workers in [int(value) for value in args.workers.split(",") if value.strip()]:
+            elapsed, book_count, requests_made = run(server, list_urls, max_pages, workers)
+            print(f"  동시 요청 {workers:>2}: {elapsed:6.2f}s  요청 {requests_made:3d}건  중복 제거 후 {book_count}권")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 스텁 HTTP 서버로 http_client.py의 속도 제한, 재시도, 서킷 브레이커 동작을 확인합니다.
+
+시나리오:
+    ok        모든 요청에 200 응답 → 처리량이 허용 속도(--max-rate)에 얼마나 가까운지
+    throttle  --throttle-every번째 요청마다 429 + Retry-After → 속도를 줄였다가 회복하는지
+    flaky     --flaky-every번째 요청마다 503 → 재시도로 모두 성공하는지
+    slow      처음 10개 응답만 --slow-delay초 지연 → 느린 동안 속도를 줄였다가 회복하는지
+    down      모든 요청에 503 → 서킷 브레이커가 열려 요청이 즉시 거부되는지
+
+사용법:
+    python benchmarks/bench_http_client.py [--requests 40] [--workers 4] [--max-rate 20] [시나리오 ...]
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from http_client import HttpClient, AdaptiveRateLimiter, CircuitBreaker, CircuitOpenError  # noqa: E402
+
+SCENARIOS = ("ok", "throttle", "flaky", "slow", "down")
+
+class StubServer:
+    """
+    시나리오에 따라 응답하는 로컬 HTTP 서버 (요청 수를 셉니다)
+    """
+    def __init__(self, scenario, throttle_every=10, flaky_every=4, slow_delay=0.3, slow_hits=10):
+        self.scenario = scenario
+        self.throttle_every = throttle_every
+        self.flaky_every = flaky_every
+        self.slow_delay = slow_delay
+        self.slow_hits = slow_hits
+        self.hits = 0
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with stub._lock:
+                    stub.hits += 1
+                    hit = stub.hits
+                status, headers = stub.respond(hit)
+                body = f"<html><body>{self.path} #{hit}</body></html>".encode('utf-8')
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def respond(self, hit):
+        if self.scenario == "throttle" and hit % self.throttle_every == 0:
+            return 429, {'Retry-After': '1'}
+        if self.scenario == "flaky" and hit % self.flaky_every == 0:
+            return 503, {}
+        if self.scenario == "down":
+            return 503, {}
+        if self.scenario == "slow" and hit <= self.slow_hits:
+            time.sleep(self.slow_delay)
+        return 200, {}
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+def run_scenario(scenario, args):
+    with StubServer(scenario, slow_delay=args.slow_delay) as server:
+        client = HttpClient(
+            max_retries=args.retries,
+            timeout=(1, 5),
+            backoff_base=0.05,
+            limiter_factory=lambda: AdaptiveRateLimiter(
+                rate=args.max_rate / 2, min_rate=1, max_rate=args.max_rate,
+                slow_seconds=args.slow_delay / 2, increase=args.max_rate / 10),
+            breaker_factory=lambda: CircuitBreaker(failure_threshold=5, reset_seconds=30))
+
+        outcomes = {"ok": 0, "http_error": 0, "circuit_open": 0}
+        outcomes_lock = threading.Lock()
+
+        def fetch(i):
+            try:
+                client.get_text(f"{server.url}/item/{i}", use_cache=False)
+                outcome = "ok"
+            except CircuitOpenError:
+                outcome = "circuit_open"
+            except requests.RequestException:
+                outcome = "http_error"
+            with outcomes_lock:
+                outcomes[outcome] += 1
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            list(executor.map(fetch, range(args.requests)))
+        elapsed = time.perf_counter() - start
+        limiter, breaker = client.host_policy(server.url)
+        client.close()
+
+    throughput = outcomes["ok"] / elapsed if elapsed else 0.0
+    print(f"{scenario:>9}: {elapsed:6.2f}s  성공 {outcomes['ok']:3d}  실패 {outcomes['http_error']:3d}  "
+          f"차단 {outcomes['circuit_open']:3d}  서버 요청 {server.hits:3d}  "
+          f"처리량 {throughput:5.1f}/s ({throughput / args.max_rate:4.0%} of {args.max_rate:g}/s)  "
+          f"최종 속도 {limiter.rate:5.2f}/s  브레이커 {breaker.state}")
+
+def main():
+    parser = argparse.ArgumentParser(description="http_client 속도 제한/재시도/서킷 브레이커 벤치마크")
+    parser.add_argument("scenarios", nargs="*", help=f"실행할 시나리오 (기본값: 전부, {', '.join(SCENARIOS)})")
+    parser.add_argument("--requests", type=int, default=40, help="시나리오당 요청 수")
+    parser.add_argument("--workers", type=int, default=4, help="동시 요청 스레드 수")
+    parser.add_argument("--max-rate", type=float, default=20.0, help="허용 속도(초당 요청 수)")
+    parser.add_argument("--retries", type=int, default=3, help="최대 재시도 횟수")
+    parser.add_argument("--slow-delay", type=float, default=0.3, help="slow 시나리오의 응답 지연(초)")
+    args = parser.parse_args()
+    # 재시도/감속 경고는 결과 표를 가리므로 오류만 출력
+    logging.basicConfig(level=logging.ERROR, format='%(name)s - %(levelname)s - %(message)s')
+    unknown = [scenario for scenario in args.scenarios if scenario not in SCENARIOS]
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(unknown)}")
+
+    for scenario in args.scenarios or SCENARIOS:
+        run_scenario(scenario, args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+저장된 알라딘 HTML 픽스처로 파서 백엔드별 처리 속도(pages/second)를 측정합니다.
+
+사용법:
+    python benchmarks/bench_parsers.py [--seconds 2.0]
+"""
+
+import os
+import sys
+import glob
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parsers  # noqa: E402
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def load_fixtures(pattern):
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, pattern))):
+        with open(path, 'r', encoding='utf-8') as f:
+            fixtures.append((os.path.basename(path), f.read()))
+    return fixtures
+
+def measure(func, pages, seconds):
+    """
+    seconds 동안 pages를 반복 파싱하고 초당 처리 페이지 수를 돌려줍니다.
+    """
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while True:
+        for _, html in pages:
+            func(html)
+            count += 1
+        if time.perf_counter() >= deadline:
+            break
+    return count / (time.perf_counter() - start)
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="파서 백엔드 마이크로 벤치마크")
+    arg_parser.add_argument("--seconds", type=float, default=2.0, help="백엔드별 측정 시간(초)")
+    args = arg_parser.parse_args()
+
+    detail_pages = load_fixtures("detail_*.html")
+    list_pages = load_fixtures("wnew_*.html")
+    backends = [b for b in parsers.BACKENDS if b != "lxml" or parsers.HAS_LXML]
+
+    # 모든 백엔드가 기존 동작(html.parser)과 같은 결과를 내는지 먼저 확인
+    for name, html in detail_pages:
+        expected = parsers.parse_detail_blocks(html, "html.parser")
+        for backend in backends:
+            if parsers.parse_detail_blocks(html, backend) != expected:
+                print(f"[경고] {backend} 결과가 html.parser와 다릅니다: {name}")
+
+    print(f"상세 페이지 {len(detail_pages)}개, 목록 페이지 {len(list_pages)}개")
+    if not parsers.HAS_LXML:
+        print("(lxml이 설치되어 있지 않아 lxml 백엔드는 건너뜁니다)")
+
+    print(f"{'backend':<12} {'detail pages/s':>16} {'list pages/s':>14}")
+    for backend in backends:
+        detail_rate = measure(lambda html: parsers.parse_detail_blocks(html, backend), detail_pages, args.seconds)
+        list_rate = measure(lambda html: parsers.parse_list_items(html, backend), list_pages, args.seconds)
+        print(f"{backend:<12} {detail_rate:>16.1f} {list_rate:>14.1f}")
+
+if __name__ == "__main__":
+    main()
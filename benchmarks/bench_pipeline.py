@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+저장된 목록/상세 HTML 픽스처를 로컬 HTTP 서버로 재생해 스크래핑 파이프라인의 단계별 처리 시간을 측정합니다.
+aladin.co.kr에는 요청하지 않습니다.
+
+단계:
+    fetch          목록 페이지 + 상세 페이지 요청 (HttpClient, 스레드 풀)
+    list_parse     목록 페이지 파싱 (parse_list_items)
+    extract        목록의 저자/출판사/출판일/가격 추출 (extract_book_info_batch)
+    detail_parse   상세 페이지 파싱 (parse_book_details, get_book_details의 파싱 부분)
+    assemble       책 레코드 조립과 메타데이터 보강 (build_book_record)
+    select         주목할만한 책 선정 (select_interesting_books)
+    persist        주차/주목할만한 책 JSON 저장 (atomic_write_json)
+
+목록 항목을 ItemId만 바꿔 복제해 코퍼스를 1배, 10배, 100배로 늘리고,
+결과는 커밋끼리 비교할 수 있도록 JSON 보고서로 저장합니다.
+
+사용법:
+    python benchmarks/bench_pipeline.py [--scales 1,10,100] [--repeat 3] [--output report.json] [--compare 이전보고서.json]
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import logging
+import argparse
+import platform
+import datetime
+import tempfile
+import threading
+import subprocess
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import parsers  # noqa: E402
+import scraper  # noqa: E402
+from atomic_io import atomic_write_json  # noqa: E402
+from book_metadata import extract_item_id  # noqa: E402
+from http_client import HttpClient, ResponseCache, AdaptiveRateLimiter  # noqa: E402
+from selection import select_interesting_books  # noqa: E402
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+REPORT_VERSION = 1
+
+STAGES = ("fetch", "list_parse", "extract", "detail_parse", "assemble", "select", "persist")
+
+LIST_PATH = "/shop/common/wnew.aspx"
+DETAIL_PATH = "/shop/wproduct.aspx"
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+class FixtureServer:
+    """
+    목록 페이지와 ItemId별 상세 페이지 픽스처를 돌려주는 로컬 HTTP 서버
+    """
+    def __init__(self, list_html, detail_pages):
+        self.list_body = list_html.encode('utf-8')
+        self.detail_bodies = [html.encode('utf-8') for html in detail_pages]
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # 헤더와 본문을 따로 보내므로 Nagle 지연(~40ms)이 측정에 섞이지 않도록 끔
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                if self.path.startswith(LIST_PATH):
+                    body = server.list_body
+                else:
+                    # ItemId로 상세 픽스처를 고르게 골라 같은 책에는 항상 같은 페이지를 돌려줌
+                    item_id = extract_item_id(self.path) or "0"
+                    body = server.detail_bodies[int(item_id) % len(server.detail_bodies)]
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+def scale_listing(listed_books, scale, base_url):
+    """
+    목록 항목을 scale배로 복제합니다. 복제본은 ItemId와 제목만 다르고, URL은 로컬 서버를 가리킵니다.
+    """
+    scaled = []
+    for copy in range(scale):
+        for position, listed in enumerate(listed_books):
+            item_id = int(extract_item_id(listed["book_url"]) or position) + copy * 1_000_000_000
+            book = dict(listed)
+            book["book_url"] = f"{base_url}{DETAIL_PATH}?ItemId={item_id}"
+            if copy:
+                book["title"] = f"{listed['title']} ({copy})"
+            scaled.append(book)
+    return scaled
+
+def run_pipeline(server, list_html, scale, workers, output_dir):
+    """
+    파이프라인을 한 번 실행하고 단계별 소요 시간(초)과 책 수를 돌려줍니다.
+    """
+    timings = {}
+
+    # 로컬 서버는 속도 제한이 필요 없으므로 사실상 무제한으로 설정
+    client = HttpClient(
+        headers=scraper.HEADERS,
+        cache=ResponseCache(os.path.join(output_dir, "http_cache")),
+        pool_size=max(workers, 1),
+        max_retries=0,
+        limiter_factory=lambda: AdaptiveRateLimiter(rate=1e9, min_rate=1e9, max_rate=1e9, burst=1e9))
+
+    base_listing = parsers.parse_list_items(list_html)
+    listed_books = scale_listing(base_listing, scale, server.url)
+
+    start = time.perf_counter()
+    client.get_text(f"{server.url}{LIST_PATH}", use_cache=False)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        detail_pages = list(executor.map(lambda listed: client.get_text(listed["book_url"], use_cache=False),
+                                         listed_books))
+    timings["fetch"] = time.perf_counter() - start
+    client.close()
+
+    # 실제로는 목록 페이지 하나에 25권이므로 코퍼스 크기만큼 목록 페이지를 파싱
+    start = time.perf_counter()
+    for _ in range(scale):
+        parsers.parse_list_items(list_html)
+    timings["list_parse"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    extracted_infos = scraper.extract_book_info_batch([listed["book_info_text"] for listed in listed_books])
+    timings["extract"] = time.perf_counter() - start
+    for listed, extracted_info in zip(listed_books, extracted_infos):
+        listed["extracted_info"] = extracted_info
+
+    start = time.perf_counter()
+    all_details = [scraper.parse_book_details(html) for html in detail_pages]
+    timings["detail_parse"] = time.perf_counter() - start
+
+    scrape_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    start = time.perf_counter()
+    books = [scraper.build_book_record(listed, details, scrape_date)
+             for listed, details in zip(listed_books, all_details)]
+    timings["assemble"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    interesting_books = select_interesting_books(books, 30)
+    timings["select"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    atomic_write_json(os.path.join(output_dir, "week.json"), books)
+    atomic_write_json(os.path.join(output_dir, "interesting_week.json"), interesting_books)
+    timings["persist"] = time.perf_counter() - start
+
+    return timings, len(books), len(interesting_books)
+
+def measure_scale(server, list_html, scale, workers, repeat):
+    """
+    scale에서 파이프라인을 repeat번 실행하고 단계별 최솟값을 보고서 항목으로 만듭니다.
+    """
+    runs = []
+    with tempfile.TemporaryDirectory(prefix="aladin-bench-") as output_dir:
+        for _ in range(repeat):
+            timings, book_count, featured_count = run_pipeline(server, list_html, scale, workers, output_dir)
+            runs.append(timings)
+        persisted_bytes = os.path.getsize(os.path.join(output_dir, "week.json"))
+
+    stages = {}
+    for stage in STAGES:
+        seconds = min(run[stage] for run in runs)
+        stages[stage] = {
+            "seconds": round(seconds, 6),
+            "books_per_second": round(book_count / seconds, 1) if seconds else None
+        }
+    total = sum(stage["seconds"] for stage in stages.values())
+    return {
+        "scale": scale,
+        "books": book_count,
+        "featured": featured_count,
+        "persisted_bytes": persisted_bytes,
+        "stages": stages,
+        "total_seconds": round(total, 6),
+        "books_per_second": round(book_count / total, 1) if total else None
+    }
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_report(report, baseline=None):
+    baseline_scales = {entry["scale"]: entry for entry in baseline["scales"]} if baseline else {}
+    header = f"{'배율':>5} {'권수':>6} " + " ".join(f"{stage:>12}" for stage in STAGES) + f" {'합계':>10}"
+    print(header)
+    for entry in report["scales"]:
+        cells = [f"{entry['stages'][stage]['seconds'] * 1000:10.1f}ms" for stage in STAGES]
+        print(f"{entry['scale']:>5}x {entry['books']:>6} " + " ".join(cells) +
+              f" {entry['total_seconds'] * 1000:8.1f}ms")
+        previous = baseline_scales.get(entry["scale"])
+        if previous:
+            ratios = []
+            for stage in STAGES + ("total",):
+                old = previous["total_seconds"] if stage == "total" else previous["stages"][stage]["seconds"]
+                new = entry["total_seconds"] if stage == "total" else entry["stages"][stage]["seconds"]
+                ratios.append(f"{(new / old - 1) * 100:+11.1f}%" if old else f"{'-':>12}")
+            print(f"{'':>5}  {'대비':>6} " + " ".join(ratios))
+    if baseline:
+        print(f"비교 기준: {baseline.get('commit')} ({baseline.get('created_at')})")
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="픽스처 재생 스크래핑 파이프라인 벤치마크")
+    arg_parser.add_argument("--scales", default="1,10,100", help="코퍼스 배율 목록 (쉼표 구분)")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="배율마다 반복 횟수 (단계별 최솟값 사용)")
+    arg_parser.add_argument("--workers", type=int, default=scraper.DETAIL_MAX_WORKERS, help="상세 페이지 동시 요청 수")
+    arg_parser.add_argument("--output", help="JSON 보고서를 저장할 경로")
+    arg_parser.add_argument("--compare", help="비교할 이전 JSON 보고서")
+    args = arg_parser.parse_args()
+
+    # 파이프라인 함수의 INFO 로그가 결과를 가리지 않도록 경고 이상만 출력
+    logging.getLogger().setLevel(logging.WARNING)
+
+    list_html = load_fixture("wnew_list.html")
+    detail_pages = [load_fixture(os.path.basename(path))
+                    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "detail_*.html")))]
+    scales = [int(scale) for scale in args.scales.split(",") if scale.strip()]
+
+    report = {
+        "benchmark": "pipeline",
+        "version": REPORT_VERSION,
+        "commit": git_commit(),
+        "created_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "parser_backend": parsers.resolve_backend(),
+        "workers": args.workers,
+        "repeat": args.repeat,
+        "fixtures": {"list_pages": 1, "detail_pages": len(detail_pages)},
+        "scales": []
+    }
+    with FixtureServer(list_html, detail_pages) as server:
+        for scale in scales:
+            report["scales"].append(measure_scale(server, list_html, scale, args.workers, args.repeat))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.output:
+        atomic_write_json(args.output, report)
+        print(f"보고서 저장: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+웹 앱 콜드 스타트 시간을 측정합니다. 매번 새 파이썬 프로세스에서
+import app → create_app() → 첫 응답까지의 시간을 재고, 스크래핑 의존성(requests, bs4)이
+로드되었는지 확인합니다.
+
+사용법:
+    python benchmarks/bench_startup.py [--runs 10] [--path /] [--vercel]
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 자식 프로세스에서 실행하는 측정 코드
+CHILD_SCRIPT = r"""
+import sys, time, json
+started = time.perf_counter()
+import app as web
+imported = time.perf_counter()
+flask_app = web.create_app()
+created = time.perf_counter()
+response = flask_app.test_client().get(sys.argv[1])
+responded = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "create_app_ms": (created - imported) * 1000,
+    "first_response_ms": (responded - created) * 1000,
+    "total_ms": (responded - started) * 1000,
+    "status": response.status_code,
+    "heavy_modules": sorted(name for name in ("requests", "bs4", "scraper", "parsers") if name in sys.modules)
+}))
+"""
+
+def run_once(path, env):
+    result = subprocess.run([sys.executable, "-c", CHILD_SCRIPT, path], cwd=ROOT_DIR, env=env,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="웹 앱 콜드 스타트(import → 첫 응답) 벤치마크")
+    arg_parser.add_argument("--runs", type=int, default=10, help="새 프로세스 실행 횟수")
+    arg_parser.add_argument("--path", default="/", help="첫 요청 경로")
+    arg_parser.add_argument("--vercel", action="store_true", help="VERCEL=1 환경(읽기 전용)으로 실행")
+    args = arg_parser.parse_args()
+
+    env = dict(os.environ)
+    # 측정 중에 app.log를 만들지 않음
+    env["ALADIN_APP_LOG"] = ""
+    if args.vercel:
+        env["VERCEL"] = "1"
+
+    runs = [run_once(args.path, env) for _ in range(args.runs)]
+
+    print(f"{args.runs}회, 경로 {args.path}{' (VERCEL=1)' if args.vercel else ''}, 상태 {runs[-1]['status']}")
+    for key in ("import_ms", "create_app_ms", "first_response_ms", "total_ms"):
+        values = [run[key] for run in runs]
+        print(f"  {key:>18}: 중앙값 {statistics.median(values):7.1f}ms  최소 {min(values):7.1f}ms  최대 {max(values):7.1f}ms")
+    print(f"  로드된 스크래핑 모듈: {', '.join(runs[-1]['heavy_modules']) or '없음'}")
+
+if __name__ == "__main__":
+    main()
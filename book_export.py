@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 주차의 도서를 NDJSON 또는 CSV로 스트리밍 내보내기.
+
+주차 파일(또는 아카이브)을 한 주차씩 읽으면서 조건에 맞는 책을 바로 한 줄씩 내보내므로,
+범위가 아무리 넓어도 메모리에는 한 주차 분량만 올라갑니다. 필터와 필드 선택은
+/api/v1/books와 같은 BookQuery(category, publisher, min_price, max_price, fields)를 씁니다.
+각 줄에는 책이 나온 주차(year, week)가 앞에 붙습니다.
+
+웹: /api/export.ndjson, /api/export.csv (파라미터: from, to, fields, category, publisher, min_price, max_price)
+
+사용법:
+    python book_export.py [--format ndjson|csv] [--from 2026-W01] [--to 2026-W10] [--fields title,price]
+                          [--category 경제경영] [--publisher 출판사] [--min-price 10000] [--max-price 20000]
+                          [--output 파일] [--data-dir 데이터 디렉토리]
+"""
+
+import io
+import os
+import re
+import sys
+import csv
+import json
+import argparse
+
+from book_query import BookQuery, project
+from book_record import FIELDS
+from book_registry import is_week_refs, load_registry
+from manifest import load_manifest, week_filenames, FEATURED_FILE_PATTERN
+from week_archive import WeekArchive, is_archived, list_archived_weeks
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# 모든 줄 앞에 붙는 주차 열
+WEEK_COLUMNS = ("year", "week")
+
+WEEK_SPEC_PATTERN = re.compile(r'^(\d{4})-?W?(\d{1,2})$', re.IGNORECASE)
+
+def parse_week_spec(value):
+    """
+    "2026-W01", "2026W1", "2026-01" 같은 주차 표기를 (연도, 주차)로 바꿉니다. 빈 값이면 None
+    """
+    if not value:
+        return None
+    match = WEEK_SPEC_PATTERN.match(value.strip())
+    if not match or not 1 <= int(match.group(2)) <= 53:
+        raise ValueError(f"주차는 2026-W01 형식이어야 합니다: {value}")
+    return int(match.group(1)), int(match.group(2))
+
+def available_weeks(data_dir=DATA_DIR):
+    """
+    데이터가 있는 (연도, 주차) 목록 (오래된 주차부터). 매니페스트가 없으면 파일 목록을 훑습니다.
+    """
+    manifest = load_manifest(data_dir)
+    if manifest is not None:
+        return sorted((entry["year"], entry["week"]) for entry in manifest["weeks"])
+
+    found = set(list_archived_weeks(data_dir))
+    for name in os.listdir(data_dir):
+        match = FEATURED_FILE_PATTERN.match(name)
+        if match:
+            found.add((int(match.group(1)), int(match.group(2))))
+    return sorted(found)
+
+def iter_week_books(data_dir, year, week, registry_loader=None):
+    """
+    주차의 전체 도서를 목록 순서대로 내보냅니다. JSON 파일이 없으면 아카이브를 블록 단위로 읽습니다.
+    참조 목록 형식의 week 파일은 registry_loader()(기본값: data_dir의 레지스트리)로 풉니다.
+    """
+    week_path = os.path.join(data_dir, week_filenames(year, week)[0])
+    if os.path.exists(week_path):
+        with open(week_path, 'r', encoding='utf-8') as f:
+            books = json.load(f)
+        if is_week_refs(books):
+            registry = registry_loader() if registry_loader is not None else load_registry(data_dir)
+            books = registry.resolve(books["refs"])
+        yield from books
+        return
+
+    if is_archived(data_dir, year, week):
+        archive = WeekArchive(data_dir, year, week)
+        for position in range(len(archive)):
+            yield archive.get(position)
+
+def iter_export_rows(query, start=None, end=None, data_dir=DATA_DIR):
+    """
+    start~end 주차(포함, None이면 끝까지)에서 조건에 맞는 책을 {"year", "week", 필드...}로 내보냅니다.
+    """
+    # 레지스트리는 참조 목록 형식의 주차를 처음 만났을 때 한 번만 읽음
+    registry = []
+
+    def registry_loader():
+        if not registry:
+            registry.append(load_registry(data_dir))
+        return registry[0]
+
+    for year, week in available_weeks(data_dir):
+        if start is not None and (year, week) < start:
+            continue
+        if end is not None and (year, week) > end:
+            break
+        for book in iter_week_books(data_dir, year, week, registry_loader):
+            if query.matches(book):
+                row = {"year": year, "week": week}
+                row.update(project(book, query.fields))
+                yield row
+
+def ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + "\n"
+
+def _csv_value(value):
+    # 목록(분류 경로 등)은 JSON 문자열로 넣어 손실 없이 되읽을 수 있게 함
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return "" if value is None else value
+
+def csv_lines(rows, fields=None):
+    """
+    머리글 한 줄 뒤에 책 한 권당 한 줄. 열은 year, week + fields(기본값: 모든 필드)
+    """
+    columns = WEEK_COLUMNS + tuple(fields or FIELDS)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def line(values):
+        writer.writerow(values)
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text
+
+    yield line(columns)
+    for row in rows:
+        yield line([_csv_value(row.get(column)) for column in columns])
+
+def export_lines(fmt, query, start=None, end=None, data_dir=DATA_DIR):
+    """
+    fmt("ndjson" 또는 "csv") 형식의 줄을 차례로 내보내는 생성기
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt} ({', '.join(FORMATS)})")
+    rows = iter_export_rows(query, start, end, data_dir)
+    return ndjson_lines(rows) if fmt == "ndjson" else csv_lines(rows, query.fields)
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="여러 주차의 도서를 NDJSON/CSV로 내보내기")
+    arg_parser.add_argument("--format", choices=sorted(FORMATS), default="ndjson", help="출력 형식")
+    arg_parser.add_argument("--from", dest="start", help="시작 주차 (예: 2026-W01, 생략하면 처음부터)")
+    arg_parser.add_argument("--to", dest="end", help="마지막 주차 (포함, 생략하면 최신 주차까지)")
+    arg_parser.add_argument("--fields", help="내보낼 필드 (쉼표 구분)")
+    arg_parser.add_argument("--category", help="분류 경로 접두사 또는 분류 이름")
+    arg_parser.add_argument("--publisher", help="출판사")
+    arg_parser.add_argument("--min-price", help="최소 가격")
+    arg_parser.add_argument("--max-price", help="최대 가격")
+    arg_parser.add_argument("--output", help="출력 파일 (생략하면 표준 출력)")
+    arg_parser.add_argument("--data-dir", default=DATA_DIR, help="데이터 디렉토리")
+    args = arg_parser.parse_args()
+
+    try:
+        query = BookQuery.from_args({
+            "fields": args.fields,
+            "category": args.category,
+            "publisher": args.publisher,
+            "min_price": args.min_price,
+            "max_price": args.max_price,
+        }, max_limit=None)
+        lines = export_lines(args.format, query, parse_week_spec(args.start), parse_week_spec(args.end), args.data_dir)
+    except ValueError as e:
+        arg_parser.error(str(e))
+
+    # CSV 모듈이 줄 끝(\r\n)을 직접 쓰므로 newline 변환은 끔
+    output = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    try:
+        for line in lines:
+            output.write(line)
+    finally:
+        if args.output:
+            output.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+상세 페이지의 "기본정보 / 주제 분류" 블록이 한 줄로 합쳐진 description 텍스트를
+페이지 수, 판형, 무게, ISBN-13, 분류 경로 목록 같은 구조화된 필드로 바꿉니다.
+
+예: "기본정보기본정보208쪽188*254mm395gISBN : 9791191923063주제 분류신간알림 신청국내도서>요리/살림>생활요리접기"
+
+사용법 (기존 data/*.json 백필):
+    python book_metadata.py [데이터 디렉토리]
+"""
+
+import os
+import re
+import sys
+import glob
+import json
+import logging
+
+from atomic_io import atomic_write_json, data_dir_lock
+
+logger = logging.getLogger("aladin_metadata")
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# 블록 전체를 한 번만 훑는 통합 패턴 (왼쪽부터 가장 먼저 맞는 토큰을 하나씩 소비)
+METADATA_PATTERN = re.compile(
+    r'ISBN\s*:\s*(?P<isbn>[0-9A-Z][0-9A-Z-]{8,16})'
+    r'|(?P<category>(?:국내도서|외국도서|eBook|중고도서|음반|블루레이|DVD)>.+?)(?:접기|$)'
+    r'|(?P<dimensions>\d+\*\d+(?:\*\d+)?\s*mm?(?:\s*\([^)]*\))?)'
+    r'|(?P<pages>\d[\d,]*)\s*쪽'
+    r'|(?P<weight>\d[\d,]*)\s*g(?![a-z])'
+)
+
+ISBN13_PATTERN = re.compile(r'^97[89]\d{10}$')
+
+ITEM_ID_PATTERN = re.compile(r'[?&]ItemId=(\d+)', re.IGNORECASE)
+
+# 자리표시자 문자열 (기존 JSON 형식과의 호환을 위해 유지)
+MISSING_PAGES = "페이지 정보 없음"
+MISSING_ISBN = "ISBN 정보 없음"
+MISSING_CATEGORY = "분류 정보 없음"
+
+def extract_item_id(book_url):
+    """
+    알라딘 상품 URL에서 ItemId를 추출합니다. 없으면 None을 돌려줍니다.
+    """
+    if not book_url:
+        return None
+    match = ITEM_ID_PATTERN.search(book_url)
+    return match.group(1) if match else None
+
+def parse_metadata_blob(text):
+    """
+    description 블록을 한 번 훑어 구조화된 필드를 돌려줍니다.
+    반환값: {"page_count": int|None, "dimensions": str|None, "weight_g": int|None,
+             "isbn13": str|None, "category_paths": [str, ...]}
+    """
+    metadata = {
+        "page_count": None,
+        "dimensions": None,
+        "weight_g": None,
+        "isbn13": None,
+        "category_paths": []
+    }
+    if not text:
+        return metadata
+
+    for match in METADATA_PATTERN.finditer(text):
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "category":
+            path = value.strip()
+            if path not in metadata["category_paths"]:
+                metadata["category_paths"].append(path)
+        elif kind == "isbn":
+            isbn = value.replace("-", "")
+            if metadata["isbn13"] is None and ISBN13_PATTERN.match(isbn):
+                metadata["isbn13"] = isbn
+        elif kind == "dimensions":
+            if metadata["dimensions"] is None:
+                metadata["dimensions"] = value.strip()
+        elif kind == "pages":
+            if metadata["page_count"] is None:
+                metadata["page_count"] = int(value.replace(",", ""))
+        elif kind == "weight":
+            if metadata["weight_g"] is None:
+                metadata["weight_g"] = int(value.replace(",", ""))
+
+    return metadata
+
+def enrich_book(book):
+    """
+    책 딕셔너리의 description을 파싱해 구조화된 필드를 추가하고,
+    "정보 없음" 자리표시자로 남아 있는 pages/isbn/category_info를 채웁니다.
+    """
+    metadata = parse_metadata_blob(book.get("description", ""))
+    book.update(metadata)
+
+    if metadata["page_count"] is not None and book.get("pages") in ("", None, MISSING_PAGES):
+        book["pages"] = f"{metadata['page_count']}쪽"
+    if metadata["isbn13"] and book.get("isbn") in ("", None, MISSING_ISBN):
+        book["isbn"] = metadata["isbn13"]
+    if metadata["category_paths"] and book.get("category_info") in ("", None, MISSING_CATEGORY):
+        book["category_info"] = metadata["category_paths"][0]
+
+    return book
+
+def backfill_data_dir(data_dir=DATA_DIR):
+    """
+    data 디렉토리의 모든 주차 JSON 파일에 구조화된 필드를 채워 넣습니다.
+    참조 목록 형식의 주차 파일은 레지스트리 레코드를 채우고 바뀐 revision으로 참조를 고쳐 씁니다.
+    반환값: 갱신한 파일 수 (레지스트리 포함)
+    """
+    # book_registry, manifest, search_index가 이 모듈을 (간접적으로) import하므로 여기서 import
+    from book_registry import REGISTRY_FILENAME, is_week_refs, load_registry, save_registry
+
+    updated = 0
+    with data_dir_lock(data_dir):
+        registry = load_registry(data_dir)
+        renamed = registry.rewrite_records(enrich_book)
+        if renamed:
+            # 주차 파일을 고쳐 쓰는 동안에도 옛 참조가 풀리도록 옛 레코드는 아직 남겨 둠
+            save_registry(registry, data_dir)
+            updated += 1
+            logger.info(f"구조화 필드 백필 완료: 레지스트리 레코드 {len(renamed)}개")
+
+        for path in sorted(glob.glob(os.path.join(data_dir, "*.json"))):
+            if os.path.basename(path) == REGISTRY_FILENAME:
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception as e:
+                logger.error(f"파일을 읽을 수 없습니다: {path} ({e})")
+                continue
+
+            if is_week_refs(data):
+                books = [ref["record"] for ref in data["refs"] if isinstance(ref, dict)]
+            elif isinstance(data, list):
+                books = data
+            else:
+                continue
+
+            before = json.dumps(data, ensure_ascii=False, sort_keys=True)
+            for book in books:
+                enrich_book(book)
+            if is_week_refs(data):
+                data["refs"] = [ref if isinstance(ref, dict) else [ref[0], renamed.get(ref[1], ref[1])]
+                                for ref in data["refs"]]
+            if json.dumps(data, ensure_ascii=False, sort_keys=True) == before:
+                continue
+
+            atomic_write_json(path, data)
+            updated += 1
+            logger.info(f"구조화 필드 백필 완료: {path} ({len(data['refs']) if is_week_refs(data) else len(books)}권)")
+
+        if renamed:
+            registry.prune_records()
+            save_registry(registry, data_dir)
+
+        if updated:
+            # 주차 파일 체크섬이 바뀌었으므로 매니페스트와 검색 색인도 맞춤
+            from manifest import build_manifest, week_checksums
+            from search_index import update_search_index
+            update_search_index(data_dir, week_checksums(build_manifest(data_dir)))
+    return updated
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    target_dir = sys.argv[1] if len(sys.argv) > 1 else DATA_DIR
+    count = backfill_data_dir(target_dir)
+    print(f"{count}개 파일 갱신 완료")
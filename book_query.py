@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+주차별 도서 조회: 필터, 필드 선택(projection), 커서 기반 페이지네이션.
+
+필터는 주차 데이터를 읽을 때 한 번 만들어 두는 WeekIndex(분류 경로/출판사/가격 색인)로
+처리하므로 요청마다 목록 전체를 훑지 않습니다.
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+PRICE_PATTERN = re.compile(r'\d[\d,]*')
+
+def parse_price(price):
+    """
+    "16,800원" 같은 가격 문자열을 정수로 바꿉니다. 가격 정보가 없으면 None을 돌려줍니다.
+    """
+    if isinstance(price, int):
+        return price
+    match = PRICE_PATTERN.search(price or "")
+    return int(match.group().replace(",", "")) if match else None
+
+def normalize_publisher(publisher):
+    return (publisher or "").strip().lower()
+
+def book_category_paths(book):
+    """
+    책의 분류 경로 목록 (구조화 필드가 없으면 category_info 하나)
+    """
+    paths = book.get("category_paths")
+    if paths:
+        return paths
+    category_info = book.get("category_info", "")
+    return [category_info] if ">" in category_info else []
+
+def category_keys(path):
+    """
+    분류 경로로 찾을 수 있는 값: 경로의 모든 접두사와 각 분류 이름
+    예: "국내도서>경제경영>재테크" → "국내도서", "국내도서>경제경영", "국내도서>경제경영>재테크", "경제경영", "재테크"
+    """
+    segments = path.split(">")
+    keys = {">".join(segments[:depth]) for depth in range(1, len(segments) + 1)}
+    keys.update(segments)
+    return keys
+
+class BookQuery:
+    """
+    조회 조건: 필터, 반환할 필드, 페이지 크기와 커서
+    """
+    __slots__ = ("category", "publisher", "min_price", "max_price", "fields", "limit", "cursor")
+
+    def __init__(self, category=None, publisher=None, min_price=None, max_price=None,
+                 fields=None, limit=DEFAULT_LIMIT, cursor=None):
+        self.category = category
+        self.publisher = publisher
+        self.min_price = min_price
+        self.max_price = max_price
+        self.fields = fields
+        self.limit = limit
+        self.cursor = cursor
+
+    @property
+    def has_filters(self):
+        return (self.category is not None or self.publisher is not None or
+                self.min_price is not None or self.max_price is not None)
+
+    def matches(self, book):
+        """
+        책 한 권이 필터에 맞는지 확인합니다. (WeekIndex.match와 같은 조건, 색인 없이 한 권씩 볼 때 사용)
+        """
+        if self.category is not None:
+            category = self.category.strip()
+            if not any(category in category_keys(path) for path in book_category_paths(book)):
+                return False
+        if self.publisher is not None and normalize_publisher(book.get("publisher")) != normalize_publisher(self.publisher):
+            return False
+        if self.min_price is not None or self.max_price is not None:
+            price = parse_price(book.get("price"))
+            if price is None:
+                return False
+            if self.min_price is not None and price < self.min_price:
+                return False
+            if self.max_price is not None and price > self.max_price:
+                return False
+        return True
+
+    @classmethod
+    def from_args(cls, args, default_limit=DEFAULT_LIMIT, max_limit=MAX_LIMIT):
+        """
+        요청 파라미터(category, publisher, min_price, max_price, fields, limit, cursor)로
+        조회 조건을 만듭니다. 값이 잘못되면 ValueError가 발생합니다.
+        """
+        def optional_int(name):
+            value = args.get(name)
+            if value in (None, ""):
+                return None
+            try:
+                return int(value)
+            except ValueError:
+                raise ValueError(f"{name}은(는) 정수여야 합니다: {value}")
+
+        limit = optional_int("limit")
+        if limit is None:
+            limit = default_limit
+        if limit < 1:
+            raise ValueError("limit은 1 이상이어야 합니다")
+        if max_limit is not None:
+            limit = min(limit, max_limit)
+
+        cursor = optional_int("cursor")
+        if cursor is not None and cursor < 0:
+            raise ValueError("cursor가 올바르지 않습니다")
+
+        fields = args.get("fields")
+        if fields:
+            fields = tuple(field.strip() for field in fields.split(",") if field.strip())
+
+        return cls(
+            category=args.get("category") or None,
+            publisher=args.get("publisher") or None,
+            min_price=optional_int("min_price"),
+            max_price=optional_int("max_price"),
+            fields=fields or None,
+            limit=limit,
+            cursor=cursor
+        )
+
+def project(book, fields):
+    """
+    fields에 있는 필드만 남긴 딕셔너리를 돌려줍니다. fields가 None이면 책 전체를 돌려줍니다.
+    """
+    if fields is None:
+        return book
+    return {field: book[field] for field in fields if field in book}
+
+class WeekIndex:
+    """
+    한 주차 도서 목록의 필터용 색인입니다. 색인 값은 목록 안의 위치(position)이고,
+    모든 결과는 위치 순서(원래 목록 순서)로 돌려줍니다.
+    """
+    def __init__(self, books):
+        self.books = books
+        self.category_index = {}   # 분류 경로 접두사 또는 분류 이름 → 위치 집합
+        self.publisher_index = {}  # 정규화한 출판사 → 위치 집합
+        prices = []
+
+        for position, book in enumerate(books):
+            for path in book_category_paths(book):
+                for key in category_keys(path):
+                    self.category_index.setdefault(key, set()).add(position)
+
+            self.publisher_index.setdefault(normalize_publisher(book.get("publisher")), set()).add(position)
+
+            price = parse_price(book.get("price"))
+            if price is not None:
+                prices.append((price, position))
+
+        prices.sort()
+        self._price_values = [price for price, _ in prices]
+        self._price_positions = [position for _, position in prices]
+
+    def _price_range(self, min_price, max_price):
+        low = 0 if min_price is None else bisect_left(self._price_values, min_price)
+        high = len(self._price_values) if max_price is None else bisect_right(self._price_values, max_price)
+        return set(self._price_positions[low:high])
+
+    def match(self, query):
+        """
+        조건에 맞는 위치 목록(오름차순)을 돌려줍니다.
+        """
+        if not query.has_filters:
+            return range(len(self.books))
+
+        candidate_sets = []
+        if query.category is not None:
+            candidate_sets.append(self.category_index.get(query.category.strip(), set()))
+        if query.publisher is not None:
+            candidate_sets.append(self.publisher_index.get(normalize_publisher(query.publisher), set()))
+        if query.min_price is not None or query.max_price is not None:
+            candidate_sets.append(self._price_range(query.min_price, query.max_price))
+
+        # 가장 작은 집합부터 교집합
+        candidate_sets.sort(key=len)
+        positions = set(candidate_sets[0])
+        for other in candidate_sets[1:]:
+            positions &= other
+        return sorted(positions)
+
+    def query(self, query):
+        """
+        조건에 맞는 책 한 페이지를 돌려줍니다.
+        반환값: {"items": [...], "total": int, "next_cursor": int|None}
+        커서는 마지막으로 돌려준 책의 위치이며, 다음 페이지는 그 다음 위치부터 시작합니다.
+        """
+        positions = self.match(query)
+        start = 0 if query.cursor is None else bisect_right(positions, query.cursor)
+        page = positions[start:start + query.limit]
+
+        items = [project(self.books[position], query.fields) for position in page]
+        has_more = start + query.limit < len(positions)
+        return {
+            "items": items,
+            "total": len(positions),
+            "next_cursor": page[-1] if has_more and len(page) else None
+        }
+
+def query_positions(count, read_page, query):
+    """
+    필터 없는 조회를 위치 범위로 바로 읽습니다. (아카이브처럼 일부만 읽을 수 있는 저장소용)
+    read_page(start, stop)는 목록 위치 [start, stop)의 책을 돌려줘야 합니다.
+    """
+    start = 0 if query.cursor is None else query.cursor + 1
+    page = read_page(start, start + query.limit) if start < count else []
+    has_more = start + query.limit < count
+    return {
+        "items": [project(book, query.fields) for book in page],
+        "total": count,
+        "next_cursor": start + len(page) - 1 if has_more and page else None
+    }
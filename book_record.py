@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+메모리를 적게 쓰는 책 레코드 (BookRecord).
+
+주차 JSON의 책 딕셔너리(키 18~19개)를 __slots__ 객체로 바꿔 여러 주차를 메모리에 올려도
+책 한 권당 크기가 작게 유지되도록 합니다.
+
+- "저자 정보 없음" 같은 자리표시자는 MISSING 하나로 저장합니다.
+- 출판사, 분류, 출판일, 가격, 수집 시각처럼 여러 책이 같은 값을 갖는 문자열은 intern하고,
+  키 순서와 분류 경로 목록은 같이 읽은 레코드끼리(records_from_json 한 번) 같은 튜플을 공유합니다.
+  공유 표는 읽기가 끝나면 버리므로 오래 도는 프로세스에서도 쌓이지 않습니다.
+- 키 순서와 목록에 없는 키도 기억하므로 to_dict()는 원래 JSON과 같은 딕셔너리를 돌려줍니다.
+
+레코드는 읽기 전용 딕셔너리처럼 쓸 수 있습니다. (캐시된 레코드를 여러 요청이 공유하므로 값을 바꾸려면
+to_dict()로 복사합니다) book["author"], book.get("author")는
+기존 JSON 형식의 값(자리표시자 문자열, 목록)을, book.author는 저장된 값(MISSING, 튜플)을 돌려줍니다.
+
+사용법:
+    books = records_from_json(json.load(f))
+    json.dumps([book.to_dict() for book in books])
+"""
+
+import sys
+
+from book_metadata import MISSING_PAGES, MISSING_ISBN, MISSING_CATEGORY
+
+class _Missing:
+    """
+    자리표시자로 채워져 있던 필드의 값 (거짓으로 평가됩니다)
+    """
+    __slots__ = ()
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return "MISSING"
+
+    def __reduce__(self):
+        return (_Missing, ())
+
+MISSING = _Missing()
+
+# 주차 JSON의 필드 (scraper.py가 쓰는 순서)
+FIELDS = (
+    "title", "author", "publisher", "price", "img_url", "book_url", "short_description",
+    "description", "pub_date", "pages", "isbn", "category_info", "scrape_date", "categories",
+    "page_count", "dimensions", "weight_g", "isbn13", "category_paths"
+)
+
+# 필드별 자리표시자 (scraper.py와 parsers.py가 값을 찾지 못했을 때 쓰는 문자열)
+PLACEHOLDERS = {
+    "title": "제목 없음",
+    "author": "저자 정보 없음",
+    "publisher": "출판사 정보 없음",
+    "price": "가격 정보 없음",
+    "pub_date": "출판일 정보 없음",
+    "pages": MISSING_PAGES,
+    "isbn": MISSING_ISBN,
+    "category_info": MISSING_CATEGORY,
+}
+
+# 여러 책이 같은 값을 갖는 문자열 필드
+INTERNED_FIELDS = frozenset(("publisher", "price", "pub_date", "pages", "category_info", "scrape_date", "dimensions"))
+
+# 목록 필드 (튜플로 저장하고 to_dict()에서 목록으로 되돌림)
+LIST_FIELDS = frozenset(("categories", "category_paths"))
+
+_FIELD_SET = frozenset(FIELDS)
+
+def _share(values, shared):
+    """
+    shared(같이 읽는 레코드끼리의 공유 표)에 같은 내용의 튜플이 있으면 그것을 돌려줍니다.
+    """
+    if shared is None:
+        return values
+    return shared.setdefault(values, values)
+
+def _store(field, value, shared=None):
+    """
+    JSON 값 → 저장 값
+    """
+    if type(value) is str:
+        if value == PLACEHOLDERS.get(field):
+            return MISSING
+        if field in INTERNED_FIELDS:
+            return sys.intern(value)
+        return value
+    if type(value) is list and field in LIST_FIELDS:
+        return _share(tuple(sys.intern(item) if type(item) is str else item for item in value), shared)
+    return value
+
+def _load(field, value):
+    """
+    저장 값 → JSON 값
+    """
+    if value is MISSING:
+        return PLACEHOLDERS[field]
+    if type(value) is tuple:
+        return list(value)
+    return value
+
+class BookRecord:
+    """
+    책 한 권. 필드는 슬롯에 저장하고, FIELDS에 없는 키는 _extra 딕셔너리에 둡니다.
+    """
+    __slots__ = FIELDS + ("_keys", "_extra")
+
+    def __init__(self, **fields):
+        self._fill(fields)
+
+    @classmethod
+    def from_dict(cls, book, shared=None):
+        """
+        JSON 딕셔너리로 레코드를 만듭니다. shared: 튜플 공유 표 (records_from_json이 읽기마다 만듦)
+        """
+        record = cls.__new__(cls)
+        record._fill(book, shared)
+        return record
+
+    def _fill(self, book, shared=None):
+        self._extra = None
+        for key, value in book.items():
+            if key in _FIELD_SET:
+                setattr(self, key, _store(key, value, shared))
+            else:
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[key] = value
+        self._keys = _share(tuple(book), shared)
+
+    def to_dict(self):
+        """
+        원래 JSON과 같은 키 순서와 값의 딕셔너리
+        """
+        return {key: self[key] for key in self._keys}
+
+    def __getitem__(self, key):
+        if key in _FIELD_SET:
+            try:
+                return _load(key, getattr(self, key))
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def keys(self):
+        return self._keys
+
+    def items(self):
+        return [(key, self[key]) for key in self._keys]
+
+    def __eq__(self, other):
+        if isinstance(other, BookRecord):
+            other = other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"BookRecord({self.get('title')!r})"
+
+def records_from_json(books):
+    """
+    주차 JSON 목록 → BookRecord 목록 (목록이 아니면 그대로 돌려줍니다)
+    """
+    if not isinstance(books, list):
+        return books
+    shared = {}
+    return [BookRecord.from_dict(book, shared) if isinstance(book, dict) else book for book in books]
+
+def to_json(book):
+    """
+    BookRecord면 JSON 딕셔너리로 바꾸고, 아니면(딕셔너리) 그대로 돌려줍니다.
+    """
+    return book.to_dict() if isinstance(book, BookRecord) else book
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+주차를 가로지르는 도서 식별 레지스트리 (data/registry.json).
+
+ItemId와 ISBN을 정규 ID(canonical id)로 연결하고, 정규 ID마다 처음/마지막으로 목록에 나온
+주차와 가장 최근 레코드를 기록합니다. 레코드는 내용 해시(revision)로 저장하므로, 여러 주차에
+걸쳐 바뀌지 않은 책은 한 번만 저장되고 주차 목록은 (정규 ID, revision) 참조만으로 표현할 수 있습니다.
+
+스크래퍼는 이번 주 목록에 새로 나온 책이라도 레지스트리에 최근 레코드가 있으면
+상세 페이지를 다시 요청하지 않고 그 레코드를 재사용합니다.
+
+스크래퍼가 쓰는 주차 파일(week_*.json)은 책 레코드 대신 {"format": "week_refs", "refs": [...]}
+참조 목록을 저장하고, 읽을 때 레지스트리로 풀어냅니다(read_week_file). 레지스트리는 주차 파일이
+참조하는 revision을 주차별로 기록해 두므로, 저장할 때마다 아무도 참조하지 않는 revision을 지워
+다시 수집한 책의 옛 revision이 쌓이지 않습니다. 예전 형식(책 목록)의 주차 파일도 그대로 읽습니다.
+
+사용법 (기존 주차 데이터로 레지스트리 만들기):
+    python book_registry.py [데이터 디렉토리]
+"""
+
+import os
+import sys
+import copy
+import json
+import hashlib
+import logging
+
+from atomic_io import atomic_write_json
+from book_metadata import extract_item_id, MISSING_ISBN
+
+logger = logging.getLogger("aladin_registry")
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+REGISTRY_FILENAME = "registry.json"
+REGISTRY_VERSION = 1
+
+# 참조 목록으로 저장한 주차 파일의 형식 표시
+WEEK_REFS_FORMAT = "week_refs"
+
+def registry_path(data_dir=DATA_DIR):
+    return os.path.join(data_dir, REGISTRY_FILENAME)
+
+def identity_keys(book):
+    """
+    책의 식별 키 목록: ("item", ItemId), ("isbn", ISBN-13 또는 ISBN)
+    """
+    keys = []
+    item_id = extract_item_id(book.get("book_url"))
+    if item_id:
+        keys.append(("item", item_id))
+    isbn = book.get("isbn13") or book.get("isbn")
+    if isbn and isbn != MISSING_ISBN:
+        keys.append(("isbn", isbn))
+    return keys
+
+def week_key(year, week):
+    return f"{year}-W{week:02d}"
+
+def is_week_refs(data):
+    """
+    주차 파일 JSON이 참조 목록 형식인지 확인합니다.
+    """
+    return isinstance(data, dict) and data.get("format") == WEEK_REFS_FORMAT
+
+def revision_of(record):
+    """
+    레코드 내용 해시 (필드 순서와 무관)
+    """
+    canonical = json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+class BookRegistry:
+    """
+    정규 ID → 도서 항목, 식별 키 → 정규 ID, revision → 레코드를 가진 레지스트리입니다.
+    조회와 병합은 책 한 권당 딕셔너리 조회 몇 번(O(1))으로 끝납니다.
+    """
+    def __init__(self):
+        self.books = {}      # 정규 ID → {"item_id", "isbn", "first_seen", "last_seen", "revision"}
+        self.records = {}    # revision → 레코드
+        self.keys = {}       # ("item"|"isbn", 값) → 정규 ID
+        self.weeks = {}      # "YYYY-WNN" → 그 주차 파일이 참조하는 revision 목록
+        self.dirty = False
+
+    def __len__(self):
+        return len(self.books)
+
+    def find(self, book):
+        """
+        같은 책의 정규 ID. 처음 보는 책이면 None
+        """
+        for key in identity_keys(book):
+            canonical_id = self.keys.get(key)
+            if canonical_id is not None:
+                return canonical_id
+        return None
+
+    def canonical_record(self, book):
+        """
+        같은 책의 가장 최근 레코드. 처음 보는 책이면 None
+        """
+        canonical_id = self.find(book)
+        if canonical_id is None:
+            return None
+        return self.records[self.books[canonical_id]["revision"]]
+
+    def merge(self, book, year, week):
+        """
+        (year, week) 목록에 나온 책을 레지스트리에 병합하고 (정규 ID, revision)을 돌려줍니다.
+        식별 키가 하나도 없으면 (None, None)을 돌려줍니다.
+        """
+        keys = identity_keys(book)
+        if not keys:
+            return None, None
+
+        seen = [year, week]
+        canonical_id = self.find(book)
+        if canonical_id is None:
+            canonical_id = f"{keys[0][0]}:{keys[0][1]}"
+            entry = {"item_id": None, "isbn": None, "first_seen": seen, "last_seen": seen, "revision": None}
+            self.books[canonical_id] = entry
+        else:
+            entry = self.books[canonical_id]
+            if seen < entry["first_seen"]:
+                entry["first_seen"] = seen
+
+        # 새로 알게 된 식별 키(예: 나중에 채워진 ISBN)도 같은 정규 ID로 연결
+        for kind, value in keys:
+            self.keys.setdefault((kind, value), canonical_id)
+            if kind == "item" and entry["item_id"] is None:
+                entry["item_id"] = value
+            elif kind == "isbn" and entry["isbn"] is None:
+                entry["isbn"] = value
+
+        revision = revision_of(book)
+        self.records.setdefault(revision, book)
+        # 가장 최근 주차의 레코드를 정규 레코드로 사용
+        if seen >= entry["last_seen"] or entry["revision"] is None:
+            entry["last_seen"] = seen
+            entry["revision"] = revision
+
+        self.dirty = True
+        return canonical_id, revision
+
+    def merge_week(self, year, week, books):
+        """
+        주차 목록 전체를 병합하고 참조 목록을 돌려줍니다. (week_refs 참고)
+        """
+        return [self.merge(book, year, week) for book in books]
+
+    def week_refs(self, year, week, books):
+        """
+        주차 목록을 레코드 복사 없이 [정규 ID, revision] 참조 목록으로 바꿉니다.
+        식별 키가 없는 책은 {"record": 책} 그대로 둡니다.
+        """
+        refs = []
+        for book, (canonical_id, revision) in zip(books, self.merge_week(year, week, books)):
+            refs.append([canonical_id, revision] if canonical_id else {"record": book})
+        return refs
+
+    def resolve(self, refs):
+        """
+        week_refs로 만든 참조 목록을 책 목록으로 되돌립니다.
+        레지스트리에 없는 revision을 참조하면 ValueError가 발생합니다.
+        """
+        books = []
+        for ref in refs:
+            if isinstance(ref, dict):
+                books.append(ref["record"])
+                continue
+            record = self.records.get(ref[1])
+            if record is None:
+                raise ValueError(f"레지스트리에 없는 레코드를 참조합니다: {ref[0]} ({ref[1]})")
+            books.append(record)
+        return books
+
+    def week_revisions(self, year, week):
+        """
+        주차 파일이 참조하는 revision 집합
+        """
+        return set(self.weeks.get(week_key(year, week), ()))
+
+    def pin_week(self, year, week, refs):
+        """
+        주차 파일이 참조하는 revision을 기록합니다. (prune_records가 지우지 않도록)
+        """
+        self.weeks[week_key(year, week)] = sorted({ref[1] for ref in refs if not isinstance(ref, dict)})
+        self.dirty = True
+
+    def unpin_week(self, year, week):
+        """
+        주차 파일을 지웠거나(아카이브) 책 목록 형식으로 바꿨을 때 참조 기록을 지웁니다.
+        """
+        if self.weeks.pop(week_key(year, week), None) is not None:
+            self.dirty = True
+
+    def week_file_data(self, year, week, books):
+        """
+        주차 목록을 병합하고, 주차 파일에 저장할 참조 목록 JSON을 만듭니다.
+        """
+        refs = self.week_refs(year, week, books)
+        self.pin_week(year, week, refs)
+        return {"format": WEEK_REFS_FORMAT, "year": year, "week": week, "refs": refs}
+
+    def prune_records(self, keep=()):
+        """
+        어떤 정규 항목도, 주차 파일도 가리키지 않는 revision을 지웁니다.
+        keep: 함께 남길 revision (예: 새 주차 파일로 교체되기 전까지 이전 파일이 참조하는 revision)
+        """
+        live = {entry["revision"] for entry in self.books.values()}
+        for revisions in self.weeks.values():
+            live.update(revisions)
+        live.update(keep)
+        removed = [revision for revision in self.records if revision not in live]
+        for revision in removed:
+            del self.records[revision]
+        if removed:
+            self.dirty = True
+        return len(removed)
+
+    def rewrite_records(self, update):
+        """
+        모든 레코드를 update(레코드 사본)의 결과로 바꾸고 revision을 다시 계산합니다.
+        정규 항목과 주차별 참조 기록은 새 revision을 가리키고, 옛 레코드는 주차 파일의 참조를
+        고쳐 쓸 때까지 남겨 두므로 그 뒤 prune_records()로 지웁니다.
+        반환값: {옛 revision: 새 revision} (내용이 바뀐 레코드만)
+        """
+        renamed = {}
+        for revision, record in list(self.records.items()):
+            updated = update(copy.deepcopy(record))
+            new_revision = revision_of(updated)
+            if new_revision != revision:
+                self.records.setdefault(new_revision, updated)
+                renamed[revision] = new_revision
+        if not renamed:
+            return renamed
+
+        for canonical_id, entry in self.books.items():
+            new_revision = renamed.get(entry["revision"])
+            if new_revision is None:
+                continue
+            entry["revision"] = new_revision
+            # 새로 채워진 식별 키(예: description에서 찾은 ISBN)도 같은 정규 ID로 연결
+            for kind, value in identity_keys(self.records[new_revision]):
+                self.keys.setdefault((kind, value), canonical_id)
+                if kind == "isbn" and entry["isbn"] is None:
+                    entry["isbn"] = value
+        for label, revisions in self.weeks.items():
+            self.weeks[label] = sorted({renamed.get(revision, revision) for revision in revisions})
+        self.dirty = True
+        return renamed
+
+    def to_dict(self):
+        return {
+            "version": REGISTRY_VERSION,
+            "books": self.books,
+            "records": self.records,
+            # 정규 항목의 대표 키 외에 나중에 연결된 식별 키(다른 ItemId/ISBN)까지 모두 저장
+            "keys": [[kind, value, canonical_id] for (kind, value), canonical_id in self.keys.items()],
+            "weeks": self.weeks
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        registry = cls()
+        registry.books = data["books"]
+        registry.records = data["records"]
+        registry.weeks = data.get("weeks", {})
+        for kind, value, canonical_id in data.get("keys", ()):
+            if canonical_id in registry.books:
+                registry.keys[(kind, value)] = canonical_id
+        # keys가 없는 예전 형식이면 항목의 대표 키로 복원
+        for canonical_id, entry in registry.books.items():
+            if entry.get("item_id"):
+                registry.keys.setdefault(("item", entry["item_id"]), canonical_id)
+            if entry.get("isbn"):
+                registry.keys.setdefault(("isbn", entry["isbn"]), canonical_id)
+        return registry
+
+def load_registry(data_dir=DATA_DIR):
+    """
+    저장된 레지스트리를 읽습니다. 없거나 형식이 다르면 빈 레지스트리를 돌려줍니다.
+    """
+    try:
+        with open(registry_path(data_dir), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return BookRegistry()
+    if data.get("version") != REGISTRY_VERSION:
+        return BookRegistry()
+    return BookRegistry.from_dict(data)
+
+def save_registry(registry, data_dir=DATA_DIR):
+    atomic_write_json(registry_path(data_dir), registry.to_dict(), separators=(",", ":"))
+    registry.dirty = False
+
+def resolve_week_data(data, data_dir=DATA_DIR, registry=None):
+    """
+    주차 파일 JSON → 책 목록. 참조 목록 형식이면 registry(없으면 data_dir의 레지스트리)로 풉니다.
+    """
+    if not is_week_refs(data):
+        return data
+    if registry is None:
+        registry = load_registry(data_dir)
+    return registry.resolve(data["refs"])
+
+def read_week_file(path, data_dir=None, registry=None):
+    """
+    주차 파일(week_*.json)의 책 목록을 읽습니다. 형식과 관계없이 책 딕셔너리 목록을 돌려줍니다.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return resolve_week_data(data, data_dir or os.path.dirname(os.path.abspath(path)), registry)
+
+def build_registry(data_dir=DATA_DIR):
+    """
+    모든 주차(JSON 파일과 아카이브)를 오래된 순서로 병합해 레지스트리를 새로 만들고 저장합니다.
+    """
+    from manifest import load_manifest, build_manifest, week_filenames
+    from week_archive import load_week
+
+    manifest = load_manifest(data_dir) or build_manifest(data_dir)
+    previous = load_registry(data_dir)
+    registry = BookRegistry()
+    for entry in sorted(manifest["weeks"], key=lambda entry: (entry["year"], entry["week"])):
+        year, week = entry["year"], entry["week"]
+        books, _ = load_week(data_dir, year, week, registry=previous)
+        refs = registry.week_refs(year, week, books)
+        # 참조 목록으로 저장된 주차 파일이 계속 풀리도록 참조 기록도 다시 만듦
+        week_path = os.path.join(data_dir, week_filenames(year, week)[0])
+        if week_key(year, week) in previous.weeks and os.path.exists(week_path):
+            registry.pin_week(year, week, refs)
+    registry.prune_records()
+    save_registry(registry, data_dir)
+    return registry
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    target_dir = sys.argv[1] if len(sys.argv) > 1 else DATA_DIR
+    result = build_registry(target_dir)
+    print(f"레지스트리 생성 완료: {registry_path(target_dir)} (도서 {len(result)}권, 레코드 {len(result.records)}개)")
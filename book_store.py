@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+sqlite3(WAL 모드) 기반 도서 저장소.
+
+- books: 책 한 권당 한 행 (ItemId/ISBN/출판사 인덱스, 가장 최근 정보)
+- week_books: 주차별 스냅샷 (그 주에 수집된 그대로의 책 정보와 순서)
+- featured_books: 주차별 주목할만한 책 선정 결과 (스냅샷 참조 + 분야 태그)
+
+Vercel 배포는 읽기 전용이므로 기존 JSON 파일(week_*.json, interesting_week_*.json)은
+export_json으로 계속 만들어 둡니다.
+
+사용법:
+    python book_store.py import [데이터 디렉토리]   # 기존 JSON 파일을 DB로 가져오기
+    python book_store.py export [데이터 디렉토리]   # DB 내용을 JSON 파일로 내보내기
+"""
+
+import os
+import re
+import sys
+import glob
+import json
+import sqlite3
+import logging
+import datetime
+import threading
+from book_metadata import extract_item_id
+from atomic_io import atomic_write_json
+from book_registry import read_week_file
+
+logger = logging.getLogger("aladin_store")
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DB_PATH = os.environ.get("ALADIN_DB_PATH", os.path.join(DATA_DIR, "books.db"))
+
+# 저장 방식: "json" (기본값, 주차별 JSON 파일) 또는 "sqlite"
+STORAGE_BACKEND = os.environ.get("ALADIN_STORAGE", "json")
+
+WEEK_FILE_PATTERN = re.compile(r'^week_(\d{4})_W(\d{2})\.json$')
+LEGACY_FILE_PATTERN = re.compile(r'^aladin_new_books_(\d{4}-\d{2}-\d{2})\.json$')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS books (
+    id INTEGER PRIMARY KEY,
+    item_id TEXT UNIQUE,
+    isbn TEXT,
+    title TEXT NOT NULL,
+    publisher TEXT,
+    scrape_date TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_books_isbn ON books(isbn);
+CREATE INDEX IF NOT EXISTS idx_books_publisher ON books(publisher);
+
+CREATE TABLE IF NOT EXISTS week_books (
+    year INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    book_id INTEGER NOT NULL REFERENCES books(id),
+    data TEXT NOT NULL,
+    PRIMARY KEY (year, week, position)
+);
+CREATE INDEX IF NOT EXISTS idx_week_books_book ON week_books(book_id);
+
+CREATE TABLE IF NOT EXISTS featured_books (
+    year INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    book_id INTEGER NOT NULL REFERENCES books(id),
+    categories TEXT NOT NULL,
+    PRIMARY KEY (year, week, rank)
+);
+"""
+
+def _isbn(book):
+    isbn = book.get("isbn13") or book.get("isbn") or ""
+    return isbn if isbn and isbn != "ISBN 정보 없음" else None
+
+class BookStore:
+    """
+    도서/주차 스냅샷/선정 결과를 담는 SQLite 저장소입니다.
+    스레드마다 별도의 연결을 사용하며, WAL 모드라 읽기가 쓰기를 막지 않습니다.
+    """
+    def __init__(self, db_path=DB_PATH):
+        self.db_path = db_path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # --- 책 ---
+
+    def _upsert_book(self, conn, book):
+        """
+        ItemId → ISBN 순으로 같은 책을 찾아 갱신하고, 없으면 새로 추가합니다. 책 id를 돌려줍니다.
+        """
+        item_id = extract_item_id(book.get("book_url", ""))
+        isbn = _isbn(book)
+        row = None
+        if item_id:
+            row = conn.execute("SELECT id FROM books WHERE item_id = ?", (item_id,)).fetchone()
+        if row is None and isbn:
+            row = conn.execute("SELECT id FROM books WHERE isbn = ?", (isbn,)).fetchone()
+
+        values = (
+            isbn,
+            book.get("title", ""),
+            book.get("publisher"),
+            book.get("scrape_date"),
+            json.dumps(book, ensure_ascii=False)
+        )
+        if row is not None:
+            conn.execute(
+                "UPDATE books SET isbn = ?, title = ?, publisher = ?, scrape_date = ?, data = ?,"
+                " item_id = COALESCE(item_id, ?) WHERE id = ?",
+                values + (item_id, row[0])
+            )
+            return row[0]
+
+        cursor = conn.execute(
+            "INSERT INTO books (isbn, title, publisher, scrape_date, data, item_id) VALUES (?, ?, ?, ?, ?, ?)",
+            values + (item_id,)
+        )
+        return cursor.lastrowid
+
+    def find_book(self, item_id=None, isbn=None):
+        """
+        ItemId 또는 ISBN으로 가장 최근에 저장된 책 정보를 찾습니다.
+        """
+        conn = self._connect()
+        row = None
+        if item_id:
+            row = conn.execute("SELECT data FROM books WHERE item_id = ?", (item_id,)).fetchone()
+        if row is None and isbn:
+            row = conn.execute("SELECT data FROM books WHERE isbn = ?", (isbn,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find_books_by_publisher(self, publisher):
+        conn = self._connect()
+        rows = conn.execute("SELECT data FROM books WHERE publisher = ? ORDER BY id", (publisher,)).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    # --- 주차 스냅샷 ---
+
+    def save_week(self, year, week, books):
+        """
+        주차 스냅샷을 books 목록(순서 포함)으로 교체합니다.
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM week_books WHERE year = ? AND week = ?", (year, week))
+            for position, book in enumerate(books):
+                book_id = self._upsert_book(conn, book)
+                conn.execute(
+                    "INSERT INTO week_books (year, week, position, book_id, data) VALUES (?, ?, ?, ?, ?)",
+                    (year, week, position, book_id, json.dumps(book, ensure_ascii=False))
+                )
+
+    def save_featured(self, year, week, books):
+        """
+        주차의 주목할만한 책 선정 결과를 저장합니다.
+        책 정보는 books/week_books를 참조하고 선정 순서와 분야 태그만 따로 보관합니다.
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM featured_books WHERE year = ? AND week = ?", (year, week))
+            for rank, book in enumerate(books):
+                book_id = self._upsert_book(conn, {k: v for k, v in book.items() if k != "categories"})
+                conn.execute(
+                    "INSERT INTO featured_books (year, week, rank, book_id, categories) VALUES (?, ?, ?, ?, ?)",
+                    (year, week, rank, book_id, json.dumps(book.get("categories", []), ensure_ascii=False))
+                )
+
+    def get_week_books(self, year, week):
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT data FROM week_books WHERE year = ? AND week = ? ORDER BY position",
+            (year, week)
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_featured_books(self, year, week):
+        """
+        선정된 책을 그 주차 스냅샷 정보 + categories로 돌려줍니다.
+        """
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT COALESCE("
+            "  (SELECT w.data FROM week_books w"
+            "   WHERE w.year = f.year AND w.week = f.week AND w.book_id = f.book_id LIMIT 1),"
+            "  b.data), f.categories"
+            " FROM featured_books f JOIN books b ON b.id = f.book_id"
+            " WHERE f.year = ? AND f.week = ? ORDER BY f.rank",
+            (year, week)
+        ).fetchall()
+        books = []
+        for data, categories in rows:
+            book = json.loads(data)
+            book["categories"] = json.loads(categories)
+            books.append(book)
+        return books
+
+    def list_weeks(self):
+        """
+        저장된 주차 목록을 {year: [weeks]} 형식으로 돌려줍니다. (최신 주차가 먼저)
+        """
+        conn = self._connect()
+        weeks_by_year = {}
+        rows = conn.execute(
+            "SELECT DISTINCT year, week FROM week_books ORDER BY year DESC, week DESC"
+        ).fetchall()
+        for year, week in rows:
+            weeks_by_year.setdefault(year, []).append(week)
+        return weeks_by_year
+
+    def latest_week(self):
+        conn = self._connect()
+        row = conn.execute("SELECT year, week FROM week_books ORDER BY year DESC, week DESC LIMIT 1").fetchone()
+        return (row[0], row[1]) if row else None
+
+    # --- JSON 가져오기/내보내기 ---
+
+    def import_data_dir(self, data_dir=DATA_DIR):
+        """
+        기존 data/ 디렉토리의 JSON 파일을 한 번에 가져옵니다.
+        날짜 기반의 옛 파일(aladin_new_books_YYYY-MM-DD.json)은 같은 주차 파일이 없을 때만 가져옵니다.
+        반환값: 가져온 주차 수
+        """
+        sources = {}
+        for path in glob.glob(os.path.join(data_dir, "*.json")):
+            name = os.path.basename(path)
+            match = WEEK_FILE_PATTERN.match(name)
+            if match:
+                year, week = int(match.group(1)), int(match.group(2))
+                featured = os.path.join(data_dir, f"interesting_week_{year}_W{week:02d}.json")
+                sources[(year, week)] = (path, featured)
+                continue
+            match = LEGACY_FILE_PATTERN.match(name)
+            if match:
+                date = datetime.datetime.strptime(match.group(1), "%Y-%m-%d")
+                year, week, _ = date.isocalendar()
+                featured = os.path.join(data_dir, f"interesting_books_{match.group(1)}.json")
+                sources.setdefault((year, week), (path, featured))
+
+        for (year, week), (path, featured_path) in sorted(sources.items()):
+            self.save_week(year, week, read_week_file(path, data_dir))
+            if os.path.exists(featured_path):
+                with open(featured_path, 'r', encoding='utf-8') as f:
+                    self.save_featured(year, week, json.load(f))
+            logger.info(f"{year}년 {week}주차 가져오기 완료: {os.path.basename(path)}")
+
+        return len(sources)
+
+    def export_week_json(self, year, week, data_dir=DATA_DIR):
+        """
+        한 주차의 스냅샷과 선정 결과를 기존 JSON 파일 형식으로 내보냅니다.
+        """
+        outputs = (
+            (f"week_{year}_W{week:02d}.json", self.get_week_books(year, week)),
+            (f"interesting_week_{year}_W{week:02d}.json", self.get_featured_books(year, week)),
+        )
+        for filename, books in outputs:
+            atomic_write_json(os.path.join(data_dir, filename), books)
+
+    def export_json(self, data_dir=DATA_DIR):
+        """
+        저장된 모든 주차를 JSON 파일로 내보냅니다. 반환값: 내보낸 주차 수
+        """
+        count = 0
+        for year, weeks in self.list_weeks().items():
+            for week in weeks:
+                self.export_week_json(year, week, data_dir)
+                count += 1
+        return count
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+def get_book_store():
+    """
+    ALADIN_STORAGE=sqlite일 때 공용 BookStore를 돌려주고, 그렇지 않으면 None을 돌려줍니다.
+    """
+    global _default_store
+    if STORAGE_BACKEND != "sqlite":
+        return None
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = BookStore()
+        return _default_store
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    if len(sys.argv) < 2 or sys.argv[1] not in ("import", "export"):
+        print(__doc__)
+        sys.exit(1)
+
+    target_dir = sys.argv[2] if len(sys.argv) > 2 else DATA_DIR
+    store = BookStore()
+    if sys.argv[1] == "import":
+        print(f"{store.import_data_dir(target_dir)}개 주차를 가져왔습니다: {store.db_path}")
+    else:
+        print(f"{store.export_json(target_dir)}개 주차를 내보냈습니다: {target_dir}")
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 목록 URL과 페이지를 병렬로 훑는 크롤 프런티어.
+
+목록(예: 주목할만한 신간, 다른 NewType, 외국도서)마다 1페이지부터 요청하고, 한 페이지에서
+새 책이 나오면 다음 페이지를 다음 차례에 요청합니다. 같은 차례의 페이지는 모든 목록에 걸쳐
+스레드 풀로 동시에 가져오므로 실행 시간은 목록 수가 아니라 가장 긴 목록의 페이지 수에 비례합니다.
+
+모든 페이지를 받은 뒤 (목록 순서, 페이지 순서, 페이지 안 순서)로 합치면서 ItemId가 같은 책을
+한 번만 남깁니다. 상세 페이지 요청은 이렇게 중복을 제거한 목록으로 한 번에 합니다.
+
+사용법:
+    frontier = CrawlFrontier([url1, url2], fetch=client.get_text, parse=parse_list_items, max_pages=3)
+    listed_books = frontier.crawl()
+"""
+
+import logging
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from book_metadata import extract_item_id
+
+logger = logging.getLogger("aladin_frontier")
+
+# 알라딘 목록 페이지의 페이지 번호 파라미터
+PAGE_PARAM = "page"
+
+def page_url(url, page):
+    """
+    목록 URL의 page번째 페이지 URL. 1페이지는 원래 URL을 그대로 씁니다. (HTTP 캐시 키 유지)
+    """
+    if page == 1:
+        return url
+    parts = urlsplit(url)
+    query = [(name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True) if name != PAGE_PARAM]
+    query.append((PAGE_PARAM, str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+def listing_key(listed):
+    """
+    목록 항목의 중복 판단 키: ItemId, 없으면 상품 URL, 그것도 없으면 제목
+    """
+    item_id = extract_item_id(listed.get("book_url"))
+    if item_id:
+        return ("item", item_id)
+    if listed.get("book_url"):
+        return ("url", listed["book_url"])
+    return ("title", listed.get("title", ""))
+
+def parse_list_urls(value):
+    """
+    쉼표나 공백으로 구분한 목록 URL 문자열을 목록으로 바꿉니다.
+    """
+    return [url for url in value.replace(",", " ").split() if url]
+
+class CrawlFrontier:
+    """
+    목록 URL 집합의 페이지를 차례(wave) 단위로 병렬 요청하고 결과를 합칩니다.
+
+    fetch(url) → HTML, parse(HTML) → 목록 항목 딕셔너리 목록 ("book_url", "title" 포함)
+    """
+    def __init__(self, list_urls, fetch, parse, max_pages=1, max_workers=4):
+        self.list_urls = list(list_urls)
+        self.fetch = fetch
+        self.parse = parse
+        self.max_pages = max(max_pages, 1)
+        self.max_workers = max(max_workers, 1)
+
+    def _fetch_page(self, task):
+        """
+        반환값: (목록 항목, None) 또는 실패하면 (None, 오류)
+        요청 오류와 파싱 오류 모두 그 페이지만 실패로 처리하고 다른 목록은 계속 훑습니다.
+        """
+        listing_no, page = task
+        url = page_url(self.list_urls[listing_no], page)
+        try:
+            html = self.fetch(url)
+        except requests.RequestException as e:
+            return None, e
+        try:
+            return self.parse(html), None
+        except Exception as e:
+            return None, e
+
+    def crawl(self, cancel_event=None):
+        """
+        모든 목록을 훑어 중복을 제거한 목록 항목을 돌려줍니다.
+        요청이나 파싱에 실패한 페이지는 건너뛰고(그 목록의 다음 페이지도 요청하지 않음),
+        목록 페이지를 하나도 가져오지 못하면 첫 번째 오류를 다시 발생시킵니다.
+        cancel_event가 설정되면 다음 차례의 페이지를 요청하지 않고 지금까지 받은 항목을 돌려줍니다.
+        """
+        pages = {}  # (목록 번호, 페이지) → 항목 목록
+        seen_by_listing = [set() for _ in self.list_urls]
+        errors = []
+        tasks = [(listing_no, 1) for listing_no in range(len(self.list_urls))]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="aladin-list") as executor:
+            while tasks:
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                next_tasks = []
+                for (listing_no, page), (items, error) in zip(tasks, executor.map(self._fetch_page, tasks)):
+                    if error is not None:
+                        logger.warning("목록 페이지 처리 실패: %s (%s: %s)", page_url(self.list_urls[listing_no], page),
+                                       type(error).__name__, error)
+                        errors.append(error)
+                        continue
+                    pages[(listing_no, page)] = items
+                    # 새 책이 없는 페이지(빈 페이지, 마지막 페이지 반복)에서 그 목록을 멈춤
+                    keys = {listing_key(listed) for listed in items}
+                    has_new = not keys <= seen_by_listing[listing_no]
+                    seen_by_listing[listing_no] |= keys
+                    if has_new and page < self.max_pages:
+                        next_tasks.append((listing_no, page + 1))
+                tasks = next_tasks
+
+        if not pages and errors:
+            raise errors[0]
+        return self._merge(pages)
+
+    def _merge(self, pages):
+        seen = set()
+        listed_books = []
+        counts = {}  # 목록 번호 → [페이지 수, 항목 수, 추가된 책 수]
+        for (listing_no, _), items in sorted(pages.items()):
+            count = counts.setdefault(listing_no, [0, 0, 0])
+            count[0] += 1
+            count[1] += len(items)
+            for listed in items:
+                key = listing_key(listed)
+                if key in seen:
+                    continue
+                seen.add(key)
+                listed_books.append(listed)
+                count[2] += 1
+
+        for listing_no, (page_count, item_count, added) in sorted(counts.items()):
+            logger.info("목록 %s: %s페이지, %s권 중 %s권 추가", self.list_urls[listing_no], page_count, item_count, added)
+        logger.info("목록 %s/%s개에서 중복 제거 후 %s권", len(counts), len(self.list_urls), len(listed_books))
+        return listed_books
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import time
+import random
+import hashlib
+import logging
+import threading
+import email.utils
+import requests
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from metrics import HTTP_CLIENT_SECONDS, HTTP_CLIENT_RETRIES, HTTP_CLIENT_CACHE, CIRCUIT_OPEN
+
+logger = logging.getLogger("aladin_http")
+
+# 응답 캐시 디렉토리 (data/와 달리 저장소에 커밋하지 않습니다)
+CACHE_DIR = os.environ.get(
+    "ALADIN_HTTP_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".http_cache")
+)
+
+# 캐시 유지 시간(초)과 전체 크기 상한(바이트)
+CACHE_TTL_SECONDS = float(os.environ.get("ALADIN_HTTP_CACHE_TTL", str(7 * 24 * 3600)))
+CACHE_MAX_BYTES = int(os.environ.get("ALADIN_HTTP_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+
+# 커넥션 풀 크기 (상세 페이지 동시 요청 수보다 크게 잡습니다)
+POOL_SIZE = int(os.environ.get("ALADIN_HTTP_POOL_SIZE", "10"))
+
+# 연결/읽기 타임아웃(초)
+CONNECT_TIMEOUT = float(os.environ.get("ALADIN_HTTP_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.environ.get("ALADIN_HTTP_READ_TIMEOUT", "20"))
+
+# 호스트별 요청 속도(초당 요청 수): 시작 속도, 하한, 상한(사이트가 허용하는 속도)
+RATE_INITIAL = float(os.environ.get("ALADIN_RATE_INITIAL", "2"))
+RATE_MIN = float(os.environ.get("ALADIN_RATE_MIN", "0.2"))
+RATE_MAX = float(os.environ.get("ALADIN_RATE_MAX", "4"))
+
+# 응답 지연이 이 시간(초)을 넘으면 사이트가 느려진 것으로 보고 속도를 줄입니다
+SLOW_RESPONSE_SECONDS = float(os.environ.get("ALADIN_SLOW_RESPONSE_SECONDS", "3"))
+
+# 재시도: 최대 재시도 횟수, 지수 백오프 기본/최대 대기(초)
+MAX_RETRIES = int(os.environ.get("ALADIN_HTTP_MAX_RETRIES", "3"))
+BACKOFF_BASE = float(os.environ.get("ALADIN_HTTP_BACKOFF_BASE", "0.5"))
+BACKOFF_MAX = float(os.environ.get("ALADIN_HTTP_BACKOFF_MAX", "30"))
+
+# 서킷 브레이커: 연속 실패 횟수와 차단 유지 시간(초)
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get("ALADIN_BREAKER_FAILURES", "5"))
+BREAKER_RESET_SECONDS = float(os.environ.get("ALADIN_BREAKER_RESET_SECONDS", "60"))
+
+# 재시도할 상태 코드 (429/503은 사이트가 속도를 낮추라는 신호로도 사용)
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+THROTTLE_STATUS = {429, 503}
+
+class CircuitOpenError(requests.RequestException):
+    """
+    서킷 브레이커가 열려 있어 요청을 보내지 않았을 때 발생합니다.
+    """
+
+class AdaptiveRateLimiter:
+    """
+    응답 지연과 오류에 따라 속도가 바뀌는 토큰 버킷입니다.
+
+    정상 응답이면 속도를 조금씩 올리고(가산 증가), 429/503이나 느린 응답이면 절반으로 줄입니다
+    (곱셈 감소). Retry-After를 받으면 그 시각까지 토큰을 내주지 않습니다.
+    """
+    def __init__(self, rate=RATE_INITIAL, min_rate=RATE_MIN, max_rate=RATE_MAX,
+                 burst=1, slow_seconds=SLOW_RESPONSE_SECONDS, increase=0.1):
+        self.rate = min(max(rate, min_rate), max_rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.slow_seconds = slow_seconds
+        self.increase = increase
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        토큰 하나를 얻을 때까지 대기합니다.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+    def on_success(self, latency):
+        with self._lock:
+            if latency > self.slow_seconds:
+                self.rate = max(self.min_rate, self.rate / 2)
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttled(self, retry_after=None):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+        if retry_after:
+            logger.warning("요청 속도를 낮춥니다: %.2f회/초 (%.0f초 대기)", self.rate, retry_after)
+        else:
+            logger.warning("요청 속도를 낮춥니다: %.2f회/초", self.rate)
+
+    def on_error(self):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold번 쌓이면 reset_seconds 동안 요청을 막고(open),
+    그 뒤 요청 하나만 시험 삼아 보내(half-open) 성공하면 다시 닫습니다.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=BREAKER_FAILURE_THRESHOLD, reset_seconds=BREAKER_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_request(self, host):
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_seconds:
+                    raise CircuitOpenError(f"{host} 요청이 차단되어 있습니다 (연속 실패 {self.failures}회)")
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == self.HALF_OPEN:
+                if self._trial_in_flight:
+                    raise CircuitOpenError(f"{host} 차단 해제 여부를 확인하는 중입니다")
+                self._trial_in_flight = True
+
+    def release_trial(self):
+        """
+        시험 요청이 성공/실패를 기록하지 못하고 끝났을 때(요청과 무관한 예외) 시험 자리를 비웁니다.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self, host):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.error("%s 연속 실패 %s회, %.0f초 동안 요청을 차단합니다", host, self.failures, self.reset_seconds)
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+def parse_retry_after(value):
+    """
+    Retry-After 헤더(초 또는 HTTP 날짜)를 초 단위로 바꿉니다.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+def backoff_delay(attempt, base=BACKOFF_BASE, cap=BACKOFF_MAX):
+    """
+    attempt번째 재시도 전 대기 시간 (full jitter 지수 백오프)
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+class ResponseCache:
+    """
+    URL을 키로 하는 디스크 응답 캐시입니다.
+    본문과 함께 ETag/Last-Modified를 저장해 조건부 요청에 사용하며,
+    TTL이 지난 항목과 크기 상한을 넘는 오래된 항목은 제거합니다.
+    """
+    def __init__(self, cache_dir=CACHE_DIR, ttl=CACHE_TTL_SECONDS, max_bytes=CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes = None
+
+    def _path(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, url):
+        """
+        캐시 항목을 돌려줍니다. 없거나 TTL이 지났으면 None을 돌려줍니다.
+        """
+        path = self._path(url)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("url") != url:
+            return None
+        if time.time() - entry.get("stored_at", 0) > self.ttl:
+            self._remove(path)
+            return None
+        return entry
+
+    def put(self, url, body, etag=None, last_modified=None, encoding=None):
+        """
+        응답 본문과 검증자(ETag/Last-Modified)를 저장합니다.
+        """
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "encoding": encoding,
+            "stored_at": time.time(),
+            "body": body
+        }
+        path = self._path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # 다른 스레드가 읽는 중에도 깨진 파일이 보이지 않도록 임시 파일 후 교체
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+
+        with self._lock:
+            self._ensure_total()
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(tmp_path, path)
+            self._total_bytes += os.path.getsize(path) - old_size
+            over_limit = self._total_bytes > self.max_bytes
+
+        if over_limit:
+            self.evict()
+        return entry
+
+    def touch(self, url, entry):
+        """
+        304 응답으로 재검증된 항목의 저장 시각을 갱신합니다.
+        """
+        return self.put(url, entry["body"], entry.get("etag"), entry.get("last_modified"), entry.get("encoding"))
+
+    def _entries(self):
+        if not os.path.isdir(self.cache_dir):
+            return []
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _ensure_total(self):
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, size, _ in self._entries())
+
+    def _remove(self, path):
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes -= size
+
+    def evict(self):
+        """
+        TTL이 지난 항목을 지우고, 크기 상한을 넘으면 오래된 항목부터 지웁니다.
+        """
+        with self._lock:
+            entries = sorted(self._entries())
+            now = time.time()
+            total = 0
+            kept = []
+            for mtime, size, path in entries:
+                if now - mtime > self.ttl:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                    continue
+                kept.append((mtime, size, path))
+                total += size
+
+            removed = 0
+            for mtime, size, path in kept:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+
+            self._total_bytes = total
+
+        if removed:
+            logger.info("HTTP 캐시 크기 제한으로 %s개 항목 제거", removed)
+
+class HttpClient:
+    """
+    keep-alive 커넥션 풀을 공유하는 requests.Session 기반 HTTP 클라이언트입니다.
+    캐시된 응답이 있으면 If-None-Match/If-Modified-Since로 조건부 요청을 보내고,
+    304 응답이면 저장된 본문을 재사용합니다.
+
+    호스트마다 AdaptiveRateLimiter와 CircuitBreaker를 두고, 연결/읽기 타임아웃,
+    재시도 가능한 오류(연결 오류, 타임아웃, 429/5xx)의 지수 백오프 재시도를 처리합니다.
+    """
+    def __init__(self, headers=None, cache=None, pool_size=POOL_SIZE,
+                 timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), max_retries=MAX_RETRIES,
+                 backoff_base=BACKOFF_BASE, backoff_max=BACKOFF_MAX, limiter_factory=AdaptiveRateLimiter, breaker_factory=CircuitBreaker):
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+        # requests가 gzip/deflate 응답을 자동으로 풀어줍니다
+        self.session.headers.setdefault('Accept-Encoding', 'gzip, deflate')
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self.cache = cache if cache is not None else ResponseCache()
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._limiter_factory = limiter_factory
+        self._breaker_factory = breaker_factory
+        self._hosts = {}  # 호스트 → (AdaptiveRateLimiter, CircuitBreaker)
+        self._hosts_lock = threading.Lock()
+
+    def host_policy(self, url):
+        """
+        url 호스트의 (속도 제한기, 서킷 브레이커)
+        """
+        host = urlparse(url).netloc
+        with self._hosts_lock:
+            policy = self._hosts.get(host)
+            if policy is None:
+                policy = (self._limiter_factory(), self._breaker_factory())
+                self._hosts[host] = policy
+        return policy
+
+    def request(self, url, headers=None):
+        """
+        속도 제한, 서킷 브레이커, 타임아웃, 재시도를 적용해 GET 요청을 보냅니다.
+        재시도할 수 없는 응답(2xx/3xx/4xx)은 그대로 돌려주고, 재시도를 모두 써도 실패하면
+        마지막 예외(또는 HTTPError)가 발생합니다. 차단 중이면 CircuitOpenError가 발생합니다.
+        """
+        host = urlparse(url).netloc
+        limiter, breaker = self.host_policy(url)
+
+        attempt = 0
+        while True:
+            try:
+                breaker.before_request(host)
+            except CircuitOpenError:
+                CIRCUIT_OPEN.inc(host=host)
+                raise
+            limiter.acquire()
+
+            started = time.monotonic()
+            retry_after = None
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                reason = "timeout" if isinstance(e, requests.Timeout) else "connection"
+                HTTP_CLIENT_SECONDS.observe(time.monotonic() - started, host=host, outcome=reason)
+                limiter.on_error()
+                breaker.record_failure(host)
+                error = e
+            except requests.RequestException:
+                # 재시도해도 소용없는 오류(TooManyRedirects, InvalidURL, ContentDecodingError 등)도
+                # 브레이커에 기록해야 half-open 시험 자리가 비워짐
+                HTTP_CLIENT_SECONDS.observe(time.monotonic() - started, host=host, outcome="error")
+                breaker.record_failure(host)
+                raise
+            except BaseException:
+                breaker.release_trial()
+                raise
+            else:
+                reason = str(response.status_code)
+                HTTP_CLIENT_SECONDS.observe(time.monotonic() - started, host=host, outcome=reason)
+                if response.status_code not in RETRYABLE_STATUS:
+                    limiter.on_success(time.monotonic() - started)
+                    breaker.record_success()
+                    return response
+
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                if response.status_code in THROTTLE_STATUS:
+                    limiter.on_throttled(retry_after)
+                else:
+                    limiter.on_error()
+                breaker.record_failure(host)
+                error = requests.HTTPError(f"{response.status_code} 응답: {url}", response=response)
+
+            if attempt >= self.max_retries:
+                raise error
+
+            HTTP_CLIENT_RETRIES.inc(host=host, reason=reason)
+            delay = max(backoff_delay(attempt, self.backoff_base, self.backoff_max), retry_after or 0)
+            logger.warning("요청 실패, %.1f초 후 재시도 (%s/%s): %s (%s)", delay, attempt + 1, self.max_retries, url, error)
+            time.sleep(delay)
+            attempt += 1
+
+    def get_text(self, url, use_cache=True):
+        """
+        URL의 본문 텍스트를 가져옵니다. HTTP 오류는 requests 예외로 전달됩니다.
+        """
+        entry = self.cache.get(url) if use_cache else None
+
+        request_headers = {}
+        if entry:
+            if entry.get("etag"):
+                request_headers['If-None-Match'] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers['If-Modified-Since'] = entry["last_modified"]
+
+        response = self.request(url, headers=request_headers)
+
+        if response.status_code == 304 and entry:
+            logger.debug("HTTP 캐시 재사용 (304): %s", url)
+            HTTP_CLIENT_CACHE.inc(result="revalidated")
+            self.cache.touch(url, entry)
+            return entry["body"]
+
+        response.raise_for_status()
+        HTTP_CLIENT_CACHE.inc(result="changed" if entry else "uncached")
+        text = response.text
+
+        if use_cache and (response.headers.get('ETag') or response.headers.get('Last-Modified')):
+            self.cache.put(
+                url,
+                text,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                encoding=response.encoding
+            )
+        return text
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+웹 요청과 분리된 백그라운드 스크래핑 작업 큐.
+
+/refresh는 작업을 제출하고 바로 작업 ID를 돌려주며, 스크래핑은 별도 실행기 스레드에서 돌아갑니다.
+같은 주차의 작업이 이미 대기/실행 중이면 새로 만들지 않고 그 작업을 돌려줍니다 (single-flight).
+"""
+
+import uuid
+import logging
+import datetime
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger("aladin_jobs")
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+
+def _now():
+    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+class ScrapeJob:
+    """
+    스크래핑 작업 하나의 상태와 책 단위 진행률입니다.
+    """
+    def __init__(self, key):
+        self.id = uuid.uuid4().hex
+        self.key = key  # (연도, 주차)
+        self.status = QUEUED
+        self.created_at = _now()
+        self.started_at = None
+        self.finished_at = None
+        self.done = 0
+        self.total = None
+        self.current_title = None
+        self.book_count = None
+        self.error = None
+        self.cancel_event = threading.Event()
+        self._lock = threading.Lock()
+
+    def update_progress(self, done, total, title=None):
+        """
+        스크래퍼가 책 하나를 처리할 때마다 호출하는 진행률 콜백
+        """
+        with self._lock:
+            self.done = done
+            self.total = total
+            if title:
+                self.current_title = title
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "job_id": self.id,
+                "year": self.key[0],
+                "week": self.key[1],
+                "status": self.status,
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "progress": {"done": self.done, "total": self.total, "current_title": self.current_title},
+                "book_count": self.book_count,
+                "error": self.error
+            }
+
+class ScrapeJobQueue:
+    """
+    백그라운드 실행기에서 작업을 돌리는 큐입니다.
+
+    run: ScrapeJob을 받아 스크래핑을 실행하고 수집한 책 목록을 돌려주는 함수.
+         job.cancel_event가 설정되면 cancelled 예외를 던지고 멈춰야 합니다.
+    cancelled: 취소를 나타내는 예외 타입
+    """
+    def __init__(self, run, cancelled=(), max_workers=1, max_history=50):
+        self.run = run
+        self.cancelled = cancelled
+        self.max_history = max_history
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="aladin-scrape")
+        self._jobs = OrderedDict()  # 작업 ID → ScrapeJob (최근 max_history개)
+        self._active = {}           # (연도, 주차) → 대기/실행 중인 ScrapeJob
+        self._lock = threading.Lock()
+
+    def submit(self, key):
+        """
+        key 주차의 작업을 제출합니다. 이미 대기/실행 중이면 그 작업을 돌려줍니다.
+        반환값: (ScrapeJob, 새로 만들었는지 여부)
+        """
+        with self._lock:
+            job = self._active.get(key)
+            if job is not None:
+                return job, False
+
+            job = ScrapeJob(key)
+            self._active[key] = job
+            self._jobs[job.id] = job
+            while len(self._jobs) > self.max_history:
+                oldest_id, oldest = next(iter(self._jobs.items()))
+                if oldest.status in ACTIVE_STATUSES:
+                    break
+                del self._jobs[oldest_id]
+
+        self._executor.submit(self._execute, job)
+        logger.info(f"스크래핑 작업 제출: {job.id} ({key[0]}년 {key[1]}주차)")
+        return job, True
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """
+        작업 취소를 요청합니다. 대기 중이면 바로 취소되고, 실행 중이면 다음 책 요청 전에 멈춥니다.
+        반환값: 취소 요청을 받아들였으면 True (이미 끝난 작업이면 False)
+        """
+        job = self.get(job_id)
+        if job is None or job.status not in ACTIVE_STATUSES:
+            return False
+        job.cancel_event.set()
+        logger.info(f"스크래핑 작업 취소 요청: {job.id}")
+        return True
+
+    def _finish(self, job, status, error=None, book_count=None):
+        with job._lock:
+            job.status = status
+            job.error = error
+            job.book_count = book_count
+            job.finished_at = _now()
+        with self._lock:
+            if self._active.get(job.key) is job:
+                del self._active[job.key]
+
+    def _execute(self, job):
+        if job.cancel_event.is_set():
+            self._finish(job, CANCELLED)
+            return
+
+        with job._lock:
+            job.status = RUNNING
+            job.started_at = _now()
+
+        try:
+            books = self.run(job)
+        except self.cancelled:
+            logger.info(f"스크래핑 작업 취소됨: {job.id}")
+            self._finish(job, CANCELLED)
+        except Exception as e:
+            logger.error(f"스크래핑 작업 실패: {job.id} ({e})")
+            self._finish(job, FAILED, error=str(e))
+        else:
+            self._finish(job, SUCCEEDED, book_count=len(books))
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+주차 데이터 매니페스트(data/manifest.json) 관리.
+
+웹 앱이 요청마다 data/를 glob하고 파일명을 파싱하지 않도록, 스크래퍼가 실행될 때마다
+주차 목록, 책 수, 마지막 수집 시각, 파일 체크섬을 작은 파일 하나에 기록합니다.
+
+사용법 (기존 data/ 디렉토리로 매니페스트 다시 만들기):
+    python manifest.py [데이터 디렉토리]
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+import logging
+import datetime
+
+from atomic_io import atomic_write_json
+from week_archive import WeekArchive, is_archived, list_archived_weeks
+from book_registry import read_week_file
+
+logger = logging.getLogger("aladin_manifest")
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+FEATURED_FILE_PATTERN = re.compile(r'^interesting_week_(\d{4})_W(\d{2})\.json$')
+
+def manifest_path(data_dir=DATA_DIR):
+    return os.path.join(data_dir, MANIFEST_FILENAME)
+
+def week_filenames(year, week):
+    """
+    주차의 (전체 도서 파일명, 주목할만한 책 파일명)을 돌려줍니다.
+    """
+    return f"week_{year}_W{week:02d}.json", f"interesting_week_{year}_W{week:02d}.json"
+
+def file_checksum(path):
+    """
+    파일 내용의 SHA-256 (체크아웃/복사로 mtime이 바뀌어도 유지되는 버전)
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _week_entry(data_dir, year, week, last_scrape=None):
+    """
+    주차 파일을 읽어 매니페스트 항목을 만듭니다. 주목할만한 책 파일이 없으면 None을 돌려줍니다.
+    """
+    week_file, featured_file = week_filenames(year, week)
+    week_path = os.path.join(data_dir, week_file)
+    featured_path = os.path.join(data_dir, featured_file)
+    if not os.path.exists(featured_path):
+        return _archive_entry(data_dir, year, week, last_scrape) if is_archived(data_dir, year, week) else None
+
+    books = []
+    if os.path.exists(week_path):
+        books = read_week_file(week_path, data_dir)
+    with open(featured_path, 'r', encoding='utf-8') as f:
+        featured = json.load(f)
+
+    if last_scrape is None:
+        scrape_dates = [book.get("scrape_date", "") for book in books if book.get("scrape_date")]
+        last_scrape = max(scrape_dates) if scrape_dates else None
+
+    return {
+        "year": year,
+        "week": week,
+        "book_count": len(books),
+        "featured_count": len(featured),
+        "last_scrape": last_scrape,
+        "week_file": week_file if os.path.exists(week_path) else None,
+        "week_sha256": file_checksum(week_path) if os.path.exists(week_path) else None,
+        "featured_file": featured_file,
+        "featured_sha256": file_checksum(featured_path)
+    }
+
+def _archive_entry(data_dir, year, week, last_scrape=None):
+    """
+    아카이브된 주차의 매니페스트 항목 (오프셋 색인만 읽고 레코드는 풀지 않음)
+    """
+    archive = WeekArchive(data_dir, year, week)
+    return {
+        "year": year,
+        "week": week,
+        "book_count": len(archive),
+        "featured_count": len(archive.featured_refs),
+        "last_scrape": last_scrape or archive.last_scrape,
+        "week_file": None,
+        "week_sha256": file_checksum(archive.data_path),
+        "featured_file": None,
+        "featured_sha256": None,
+        "archive": os.path.relpath(archive.data_path, data_dir)
+    }
+
+def _finalize(weeks, generation):
+    """
+    주차 항목을 최신순으로 정렬하고 매니페스트 딕셔너리를 만듭니다.
+    generation은 data/ 쓰기마다 1씩 늘어나는 세대 번호입니다.
+    """
+    weeks = sorted(weeks, key=lambda entry: (entry["year"], entry["week"]), reverse=True)
+    scrape_dates = [entry["last_scrape"] for entry in weeks if entry.get("last_scrape")]
+    return {
+        "version": MANIFEST_VERSION,
+        "generation": generation,
+        "updated_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "last_scrape": max(scrape_dates) if scrape_dates else None,
+        "latest": {"year": weeks[0]["year"], "week": weeks[0]["week"]} if weeks else None,
+        "weeks": weeks
+    }
+
+def write_manifest(manifest, data_dir=DATA_DIR):
+    """
+    임시 파일에 쓴 뒤 os.replace로 교체해 읽는 쪽이 항상 완전한 파일만 보게 합니다.
+    """
+    atomic_write_json(manifest_path(data_dir), manifest)
+
+def load_manifest(data_dir=DATA_DIR):
+    """
+    매니페스트를 읽습니다. 없거나 읽을 수 없으면 None을 돌려줍니다.
+    """
+    try:
+        with open(manifest_path(data_dir), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("version") == MANIFEST_VERSION else None
+
+def build_manifest(data_dir=DATA_DIR):
+    """
+    data 디렉토리의 주차 파일로 매니페스트를 처음부터 다시 만들어 저장합니다.
+    """
+    previous = load_manifest(data_dir)
+    generation = previous.get("generation", 0) + 1 if previous else 1
+
+    found = set(list_archived_weeks(data_dir))
+    for name in os.listdir(data_dir):
+        match = FEATURED_FILE_PATTERN.match(name)
+        if match:
+            found.add((int(match.group(1)), int(match.group(2))))
+
+    weeks = []
+    for year, week in sorted(found):
+        entry = _week_entry(data_dir, year, week)
+        if entry:
+            entry["generation"] = generation
+            weeks.append(entry)
+
+    manifest = _finalize(weeks, generation)
+    write_manifest(manifest, data_dir)
+    return manifest
+
+def update_manifest(year, week, last_scrape=None, data_dir=DATA_DIR):
+    """
+    스크래핑이 끝난 주차 하나의 항목만 갱신합니다. 매니페스트가 없으면 새로 만듭니다.
+    """
+    manifest = load_manifest(data_dir)
+    if manifest is None:
+        return build_manifest(data_dir)
+
+    generation = manifest.get("generation", 0) + 1
+    weeks = [entry for entry in manifest["weeks"] if (entry["year"], entry["week"]) != (year, week)]
+    entry = _week_entry(data_dir, year, week, last_scrape)
+    if entry:
+        # 이 주차 파일을 마지막으로 쓴 세대
+        entry["generation"] = generation
+        weeks.append(entry)
+
+    manifest = _finalize(weeks, generation)
+    write_manifest(manifest, data_dir)
+    return manifest
+
+def week_checksums(manifest):
+    """
+    매니페스트의 주차별 week 파일 체크섬 {(year, week): sha256}
+    """
+    return {(entry["year"], entry["week"]): entry["week_sha256"]
+            for entry in manifest["weeks"] if entry.get("week_sha256")}
+
+def weeks_by_year(manifest):
+    """
+    매니페스트의 주차 목록을 {year: [weeks]} 형식(최신 주차가 먼저)으로 돌려줍니다.
+    """
+    result = {}
+    for entry in manifest["weeks"]:
+        result.setdefault(entry["year"], []).append(entry["week"])
+    return result
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    target_dir = sys.argv[1] if len(sys.argv) > 1 else DATA_DIR
+    result = build_manifest(target_dir)
+    print(f"매니페스트 생성 완료: {manifest_path(target_dir)} ({len(result['weeks'])}개 주차)")
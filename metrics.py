@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스크래퍼와 웹 앱의 타이머/카운터 (Prometheus 텍스트 형식).
+
+prometheus_client 없이 프로세스 안에서 값을 모으고, /metrics가 REGISTRY.render()로 내보냅니다.
+값은 프로세스마다 따로 쌓이므로 스케줄러 프로세스의 수집 결과는 실행 요약(snapshot 차이)으로 남깁니다.
+
+사용법:
+    with timer(STAGE_SECONDS, stage="select"):
+        ...
+    FIELD_EXTRACTIONS.inc(field="isbn", result="fallback")
+"""
+
+import time
+import math
+import threading
+from contextlib import contextmanager
+
+# 기본 지연 시간 구간(초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _label_text(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+def _format_number(value):
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}  # 레이블 값 튜플 → 값
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} 레이블이 맞지 않습니다: {sorted(labels)} (필요: {list(self.labelnames)})")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def header(self):
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+class Counter(_Metric):
+    """
+    증가만 하는 카운터
+    """
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [(self.name, key, (), value) for key, value in items]
+
+class Histogram(_Metric):
+    """
+    관측값(주로 초 단위 지연 시간)의 구간별 누적 개수, 합계, 개수
+    """
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    def totals(self, **labels):
+        """
+        (합계, 개수)
+        """
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return (state[1], state[2]) if state else (0.0, 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, (list(state[0]), state[1], state[2])) for key, state in self._values.items())
+        samples = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                samples.append((f"{self.name}_bucket", key, (("le", _format_number(bound)),), cumulative))
+            samples.append((f"{self.name}_sum", key, (), total))
+            samples.append((f"{self.name}_count", key, (), count))
+        return samples
+
+class MetricsRegistry:
+    """
+    이름 → 메트릭. 같은 이름으로 다시 만들면 기존 메트릭을 돌려줍니다.
+    """
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name, help_text, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, labelnames, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"{name}은(는) 이미 {metric.kind}로 등록되어 있습니다")
+            return metric
+
+    def counter(self, name, help_text, labelnames=()):
+        return self._register(Counter, name, help_text, labelnames)
+
+    def histogram(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def render(self):
+        """
+        Prometheus 텍스트 노출 형식(0.0.4)
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.header())
+            for sample_name, key, extra, value in metric.samples():
+                lines.append(f"{sample_name}{_label_text(metric.labelnames, key, extra)} {_format_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self):
+        """
+        카운터 값과 히스토그램 (합계, 개수)를 {(이름, 레이블 튜플): 값} 딕셔너리로 복사합니다.
+        실행 전후 snapshot의 차이(diff_snapshots)로 한 번의 실행 요약을 만들 수 있습니다.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        values = {}
+        for metric in metrics:
+            if isinstance(metric, Counter):
+                for _, key, _, value in metric.samples():
+                    values[(metric.name, key)] = value
+            elif isinstance(metric, Histogram):
+                with metric._lock:
+                    for key, state in metric._values.items():
+                        values[(metric.name, key)] = (state[1], state[2])
+        return values
+
+def diff_snapshots(before, after):
+    """
+    두 snapshot 사이에 바뀐 값만 돌려줍니다. 히스토그램 값은 (합계 초, 개수)입니다.
+    """
+    changes = {}
+    for key, value in after.items():
+        previous = before.get(key)
+        if isinstance(value, tuple):
+            previous = previous or (0.0, 0)
+            delta = (value[0] - previous[0], value[1] - previous[1])
+            if delta[1]:
+                changes[key] = delta
+        else:
+            delta = value - (previous or 0)
+            if delta:
+                changes[key] = delta
+    return changes
+
+REGISTRY = MetricsRegistry()
+
+@contextmanager
+def timer(histogram, **labels):
+    """
+    with 블록의 실행 시간(초)을 histogram에 기록합니다. 예외가 나도 기록합니다.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.observe(time.perf_counter() - start, **labels)
+
+# 스크래퍼/웹 앱 공용 메트릭
+HTTP_CLIENT_SECONDS = REGISTRY.histogram(
+    "aladin_http_client_request_seconds", "외부 HTTP 요청 한 번(시도 단위)의 소요 시간", ("host", "outcome"))
+HTTP_CLIENT_RETRIES = REGISTRY.counter(
+    "aladin_http_client_retries_total", "재시도한 외부 HTTP 요청 수", ("host", "reason"))
+HTTP_CLIENT_CACHE = REGISTRY.counter(
+    "aladin_http_client_cache_total", "조건부 요청 결과 (revalidated: 304로 캐시 재사용)", ("result",))
+CIRCUIT_OPEN = REGISTRY.counter(
+    "aladin_http_client_circuit_open_total", "서킷 브레이커가 막은 요청 수", ("host",))
+STAGE_SECONDS = REGISTRY.histogram(
+    "aladin_scrape_stage_seconds", "스크래핑 단계별 소요 시간", ("stage",))
+DETAIL_FETCHES = REGISTRY.counter(
+    "aladin_detail_fetch_total", "상세 페이지 요청 결과", ("result",))
+FIELD_EXTRACTIONS = REGISTRY.counter(
+    "aladin_field_extractions_total", "수집한 책 레코드의 필드별 추출 결과 (fallback: '정보 없음' 등 기본값)",
+    ("field", "result"))
+FILE_WRITE_SECONDS = REGISTRY.histogram(
+    "aladin_file_write_seconds", "data/ 파일 원자적 쓰기 소요 시간", ())
+FILE_WRITE_BYTES = REGISTRY.counter(
+    "aladin_file_write_bytes_total", "data/ 파일에 쓴 바이트 수", ())
+FILE_READ_SECONDS = REGISTRY.histogram(
+    "aladin_file_read_seconds", "웹 앱의 JSON 파일 읽기(캐시 미스) 소요 시간", ())
+ROUTE_SECONDS = REGISTRY.histogram(
+    "aladin_route_request_seconds", "Flask 라우트 응답 시간", ("route", "method", "status"))
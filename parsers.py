@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import logging
+from html.parser import HTMLParser
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger("aladin_parsers")
+
+# 파서 백엔드 선택
+# - "html.parser": 기존 동작 (BeautifulSoup + 표준 라이브러리 파서)
+# - "lxml": BeautifulSoup + lxml (lxml이 설치되어 있어야 함)
+# - "fast": 상세 페이지를 한 번의 순회로 처리하는 단일 패스 추출기
+# - "auto": lxml이 있으면 lxml, 없으면 fast
+PARSER_BACKEND = os.environ.get("ALADIN_PARSER", "auto")
+
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+BACKENDS = ("html.parser", "lxml", "fast")
+
+# 상세 페이지에서 찾는 블록별 선택자 (우선순위 순)
+DESCRIPTION_SELECTORS = ['#div_book_content', '.Ere_prod_mconts_box', '.book_info_area']
+BOOK_INFO_SELECTORS = ['.Ere_book_info', '.book_info_area', '.info_list']
+CATEGORY_SELECTORS = [
+    '.location',
+    '.catetab_cont li:-soup-contains("분야")',
+    '.book_info_area li:-soup-contains("분야")'
+]
+ISBN_SELECTORS = [
+    '.info_list li:-soup-contains("ISBN")',
+    '.book_info_area li:-soup-contains("ISBN")',
+    '.Ere_sub2_title:-soup-contains("ISBN")'
+]
+PAGE_SELECTORS = [
+    '.info_list li:-soup-contains("페이지")',
+    '.book_info_area li:-soup-contains("페이지")',
+    '.Ere_sub2_title:-soup-contains("페이지")'
+]
+
+def resolve_backend(backend=None):
+    """
+    요청한 백엔드 이름을 실제로 사용할 백엔드로 바꿉니다.
+    lxml이 설치되어 있지 않으면 auto는 fast로, lxml은 기존 html.parser로 대체합니다.
+    """
+    backend = backend or PARSER_BACKEND
+    if backend == "auto":
+        return "lxml" if HAS_LXML else "fast"
+    if backend not in BACKENDS:
+        logger.warning(f"알 수 없는 파서 백엔드 '{backend}', html.parser를 사용합니다")
+        return "html.parser"
+    if backend == "lxml" and not HAS_LXML:
+        logger.warning("lxml이 설치되어 있지 않아 html.parser를 사용합니다")
+        return "html.parser"
+    return backend
+
+def make_soup(html, backend=None):
+    """
+    백엔드에 맞는 BeautifulSoup 객체를 만듭니다. (fast 백엔드는 가능한 가장 빠른 트리 빌더 사용)
+    """
+    backend = resolve_backend(backend)
+    if backend == "lxml" or (backend == "fast" and HAS_LXML):
+        return BeautifulSoup(html, 'lxml')
+    return BeautifulSoup(html, 'html.parser')
+
+def _select_detail_blocks(soup):
+    """
+    BeautifulSoup 트리에서 선택자로 상세 페이지 블록을 찾습니다. (기존 동작)
+    """
+    blocks = {"description": "", "book_info_text": "", "category": "", "isbn": "", "pages": ""}
+
+    for selector in DESCRIPTION_SELECTORS:
+        description_div = soup.select_one(selector)
+        if description_div and description_div.get_text(strip=True):
+            blocks["description"] = description_div.get_text(strip=True)
+            break
+
+    for selector in BOOK_INFO_SELECTORS:
+        book_info_div = soup.select_one(selector)
+        if book_info_div:
+            blocks["book_info_text"] = book_info_div.get_text(strip=True)
+            break
+
+    for field, selectors in (("category", CATEGORY_SELECTORS),
+                             ("isbn", ISBN_SELECTORS),
+                             ("pages", PAGE_SELECTORS)):
+        for selector in selectors:
+            elem = soup.select_one(selector)
+            if elem:
+                blocks[field] = elem.get_text(strip=True)
+                break
+
+    return blocks
+
+# 단일 패스 추출기 규칙: (필드, 조상 클래스, 요소 id, 요소 클래스, 요소 태그, 포함해야 하는 텍스트, 비어 있으면 안 됨)
+# 필드별로 규칙 순서가 곧 우선순위이며, 각 규칙 안에서는 문서 순서상 첫 요소가 선택됩니다.
+_FAST_RULES = [
+    ("description", None, "div_book_content", None, None, None, True),
+    ("description", None, None, "Ere_prod_mconts_box", None, None, True),
+    ("description", None, None, "book_info_area", None, None, True),
+    ("book_info_text", None, None, "Ere_book_info", None, None, False),
+    ("book_info_text", None, None, "book_info_area", None, None, False),
+    ("book_info_text", None, None, "info_list", None, None, False),
+    ("category", None, None, "location", None, None, False),
+    ("category", "catetab_cont", None, None, "li", "분야", False),
+    ("category", "book_info_area", None, None, "li", "분야", False),
+    ("isbn", "info_list", None, None, "li", "ISBN", False),
+    ("isbn", "book_info_area", None, None, "li", "ISBN", False),
+    ("isbn", None, None, "Ere_sub2_title", None, "ISBN", False),
+    ("pages", "info_list", None, None, "li", "페이지", False),
+    ("pages", "book_info_area", None, None, "li", "페이지", False),
+    ("pages", None, None, "Ere_sub2_title", None, "페이지", False),
+]
+
+_VOID_TAGS = frozenset([
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr"
+])
+_SKIP_TEXT_TAGS = frozenset(["script", "style", "template"])
+
+class _DetailBlockScanner(HTMLParser):
+    """
+    상세 페이지를 한 번만 훑으면서 모든 규칙의 후보 요소 텍스트를 모읍니다.
+    """
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = []            # (태그, 이 요소에서 시작한 캡처 목록, 클래스 목록)
+        self.open_classes = {}     # 현재 열려 있는 조상 요소의 클래스별 개수
+        self.active = []           # 텍스트를 모으는 중인 캡처
+        self.skip_depth = 0
+        self.position = 0
+        self.results = {}          # 규칙 번호 → (시작 위치, 텍스트)
+
+    def handle_starttag(self, tag, attrs):
+        self.position += 1
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+        elem_id = attrs.get("id")
+
+        if tag in _SKIP_TEXT_TAGS:
+            self.skip_depth += 1
+
+        started = []
+        for rule_no, (_, ancestor, rule_id, rule_class, rule_tag, _, _) in enumerate(_FAST_RULES):
+            if rule_no in self.results and self.results[rule_no][0] < self.position:
+                continue
+            if rule_id is not None and elem_id != rule_id:
+                continue
+            if rule_class is not None and rule_class not in classes:
+                continue
+            if rule_tag is not None and tag != rule_tag:
+                continue
+            if ancestor is not None and not self.open_classes.get(ancestor):
+                continue
+            capture = [rule_no, self.position, []]
+            started.append(capture)
+            self.active.append(capture)
+
+        if tag in _VOID_TAGS:
+            self._finish(started)
+            return
+
+        for cls in classes:
+            self.open_classes[cls] = self.open_classes.get(cls, 0) + 1
+        self.stack.append((tag, started, classes))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        # 닫히지 않은 요소가 있으면 일치하는 태그까지 함께 닫습니다
+        if not any(entry[0] == tag for entry in self.stack):
+            return
+        while self.stack:
+            open_tag, started, classes = self.stack.pop()
+            for cls in classes:
+                self.open_classes[cls] -= 1
+            if open_tag in _SKIP_TEXT_TAGS:
+                self.skip_depth -= 1
+            self._finish(started)
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self.skip_depth or not self.active:
+            return
+        text = data.strip()
+        if text:
+            for capture in self.active:
+                capture[2].append(text)
+
+    def _finish(self, captures):
+        for capture in captures:
+            self.active.remove(capture)
+            rule_no, start, parts = capture
+            text = "".join(parts)
+            _, _, _, _, _, must_contain, non_empty = _FAST_RULES[rule_no]
+            if must_contain is not None and must_contain not in text:
+                continue
+            if non_empty and not text:
+                continue
+            previous = self.results.get(rule_no)
+            if previous is None or start < previous[0]:
+                self.results[rule_no] = (start, text)
+
+    def blocks(self):
+        # 문서 끝까지 닫히지 않은 요소도 마무리
+        while self.stack:
+            self.handle_endtag(self.stack[-1][0])
+
+        blocks = {"description": "", "book_info_text": "", "category": "", "isbn": "", "pages": ""}
+        found = set()
+        for rule_no, rule in enumerate(_FAST_RULES):
+            field = rule[0]
+            if field in found or rule_no not in self.results:
+                continue
+            blocks[field] = self.results[rule_no][1]
+            found.add(field)
+        return blocks
+
+def parse_detail_blocks(html, backend=None):
+    """
+    상세 페이지 HTML에서 소개, 책 정보, 분류, ISBN, 페이지 블록의 텍스트를 추출합니다.
+    반환값: {"description", "book_info_text", "category", "isbn", "pages"} (원본 텍스트)
+    """
+    backend = resolve_backend(backend)
+    if backend == "fast":
+        scanner = _DetailBlockScanner()
+        scanner.feed(html)
+        scanner.close()
+        return scanner.blocks()
+    return _select_detail_blocks(make_soup(html, backend))
+
+def parse_list_items(html, backend=None):
+    """
+    신간 목록 페이지에서 책 항목별 기본 정보를 추출합니다.
+    반환값: [{"title", "book_url", "img_url", "book_info_text", "short_description"}, ...]
+    """
+    soup = make_soup(html, backend)
+    items = []
+
+    for item in soup.select('.ss_book_box'):
+        try:
+            # 책 제목
+            title_elem = item.select_one('.bo3')
+            title = title_elem.get_text(strip=True) if title_elem else "제목 없음"
+
+            # 책 URL
+            book_url = title_elem['href'] if title_elem and title_elem.has_attr('href') else ""
+
+            # 이미지 URL
+            img_elem = item.select_one('.front_cover img')
+            img_url = img_elem['src'] if img_elem and img_elem.has_attr('src') else ""
+
+            # 책 정보 텍스트 (저자, 출판사, 출판일, 가격 정보 추출용)
+            book_info_text = ""
+            info_elem = item.select_one('.ss_book_list')
+            if info_elem:
+                book_info_text = info_elem.get_text(strip=True)
+
+            # 간단한 설명
+            short_description_elem = item.select_one('.ss_book_list:nth-of-type(3)')
+            short_description = short_description_elem.get_text(strip=True) if short_description_elem else ""
+
+            items.append({
+                "title": title,
+                "book_url": book_url,
+                "img_url": img_url,
+                "book_info_text": book_info_text,
+                "short_description": short_description
+            })
+        except Exception as e:
+            logger.error(f"책 정보 추출 실패: {e}")
+            continue
+
+    return items
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+데이터 버전별로 한 번만 만드는 응답 본문 캐시.
+
+주차 데이터는 일주일에 두 번만 바뀌므로 /api/books, /api/featured 응답과 렌더링한
+페이지를 (키, 데이터 버전)마다 한 번만 직렬화/렌더링하고, 본문의 해시로 만든 ETag와
+미리 압축한 gzip(설치되어 있으면 brotli) 본문을 재사용합니다.
+같은 주차를 다시 요청하는 클라이언트는 If-None-Match로 304를 받습니다.
+"""
+
+import os
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from flask import Response, request
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+GZIP_LEVEL = 6
+
+# 이보다 작은 본문은 압축하지 않습니다 (헤더 비용이 더 큼)
+MIN_COMPRESS_BYTES = 512
+
+def file_version(*paths):
+    """
+    파일들의 (mtime_ns, 크기) 튜플을 데이터 버전으로 돌려줍니다. 없는 파일은 None입니다.
+    """
+    versions = []
+    for path in paths:
+        if path is None:
+            versions.append(None)
+            continue
+        try:
+            stat = os.stat(path)
+            versions.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            versions.append(None)
+    return tuple(versions)
+
+class CachedBody:
+    """
+    직렬화/렌더링이 끝난 응답 본문과 ETag, 인코딩별 압축 본문입니다.
+    """
+    __slots__ = ("etag", "mimetype", "bodies")
+
+    def __init__(self, body, mimetype):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        self.mimetype = mimetype
+        self.bodies = {"identity": body}
+        if len(body) >= MIN_COMPRESS_BYTES:
+            self.bodies["gzip"] = gzip.compress(body, GZIP_LEVEL, mtime=0)
+            if HAS_BROTLI:
+                self.bodies["br"] = brotli.compress(body)
+
+    def variant_etag(self, encoding):
+        # 인코딩마다 바이트가 다르므로 강한 ETag도 인코딩별로 구분합니다
+        return self.etag if encoding == "identity" else f"{self.etag}-{encoding}"
+
+    def choose_encoding(self, accept_encodings):
+        for encoding in ("br", "gzip"):
+            if encoding in self.bodies and accept_encodings[encoding]:
+                return encoding
+        return "identity"
+
+class ResponseBodyCache:
+    """
+    (키, 데이터 버전) → CachedBody 캐시입니다.
+    버전이 바뀌면 다시 만들고, max_entries를 넘으면 가장 오래 쓰지 않은 항목부터 버립니다.
+    """
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # 키 → (버전, CachedBody)
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, version, build):
+        """
+        캐시된 본문을 돌려주고, 없거나 버전이 다르면 build()로 만듭니다.
+        build()는 (본문, mimetype)을 돌려주고, 본문이 None이면 캐시하지 않고 None을 돌려줍니다.
+        version이 None이면 캐시를 거치지 않습니다.
+        """
+        if version is not None:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] == version:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+
+        body, mimetype = build()
+        if body is None:
+            return None
+        cached = CachedBody(body, mimetype)
+        if version is None:
+            return cached
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (version, cached)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return cached
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+def make_cached_response(cached, status=200):
+    """
+    현재 요청의 If-None-Match / Accept-Encoding에 맞춰 304 또는 압축된 본문으로 응답합니다.
+    """
+    encoding = cached.choose_encoding(request.accept_encodings)
+    etag = cached.variant_etag(encoding)
+
+    if status == 200 and any(request.if_none_match.contains(cached.variant_etag(e)) for e in cached.bodies):
+        response = Response(status=304)
+    else:
+        response = Response(cached.bodies[encoding], status=status, mimetype=cached.mimetype)
+        if encoding != "identity":
+            response.headers["Content-Encoding"] = encoding
+
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    if len(cached.bodies) > 1:
+        response.vary.add("Accept-Encoding")
+    return response
@@ -2,11 +2,13 @@
 # -*- coding: utf-8 -*-
 
 import os
+import json
 import time
 import logging
 import schedule
 from datetime import datetime
-from scraper import scrape_aladin_new_books
+from scraper import scrape_aladin_new_books, DATA_DIR
+from metrics import REGISTRY, diff_snapshots
 
 # 로깅 설정
 logging.basicConfig(
@@ -19,6 +21,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger("aladin_scheduler")
 
+# 실행마다 한 줄씩(JSON) 요약을 덧붙이는 파일 (실행 위치와 상관없이 data/ 아래)
+RUN_SUMMARY_FILE = os.environ.get("ALADIN_RUN_SUMMARY_FILE", os.path.join(DATA_DIR, "scheduler_runs.jsonl"))
+
+def build_run_summary(changes):
+    """
+    실행 전후 메트릭 차이(diff_snapshots)를 단계별 시간, 요청/추출 결과 요약으로 정리합니다.
+    """
+    summary = {"stages": {}, "detail_fetches": {}, "http_requests": {}, "http_retries": 0,
+               "circuit_open": 0, "field_fallback_rate": {}, "file_writes": {}}
+    fields = {}
+    for (name, labels), value in changes.items():
+        if name == "aladin_scrape_stage_seconds":
+            summary["stages"][labels[0]] = {"seconds": round(value[0], 3), "count": value[1]}
+        elif name == "aladin_detail_fetch_total":
+            summary["detail_fetches"][labels[0]] = value
+        elif name == "aladin_http_client_request_seconds":
+            outcome = summary["http_requests"].setdefault(labels[1], {"count": 0, "seconds": 0.0})
+            outcome["count"] += value[1]
+            outcome["seconds"] = round(outcome["seconds"] + value[0], 3)
+        elif name == "aladin_http_client_retries_total":
+            summary["http_retries"] += value
+        elif name == "aladin_http_client_circuit_open_total":
+            summary["circuit_open"] += value
+        elif name == "aladin_field_extractions_total":
+            fields.setdefault(labels[0], {"ok": 0, "fallback": 0})[labels[1]] = value
+        elif name == "aladin_file_write_seconds":
+            summary["file_writes"] = {"count": value[1], "seconds": round(value[0], 3)}
+    for field, counts in sorted(fields.items()):
+        total = counts["ok"] + counts["fallback"]
+        summary["field_fallback_rate"][field] = round(counts["fallback"] / total, 3) if total else 0.0
+    return summary
+
+def write_run_summary(summary):
+    """
+    실행 요약을 로그에 남기고 RUN_SUMMARY_FILE에 한 줄로 덧붙입니다.
+    """
+    stages = ", ".join(f"{stage} {info['seconds']:.2f}s" for stage, info in summary["stages"].items())
+    fallbacks = ", ".join(f"{field} {rate:.0%}" for field, rate in summary["field_fallback_rate"].items() if rate)
+    logger.info(f"실행 요약: {stages}")
+    logger.info(f"상세 요청 {summary['detail_fetches']}, 재시도 {summary['http_retries']}회, "
+                f"차단 {summary['circuit_open']}회, 기본값 비율: {fallbacks or '없음'}")
+    try:
+        with open(RUN_SUMMARY_FILE, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(summary, ensure_ascii=False) + "\n")
+    except OSError as e:
+        logger.error(f"실행 요약 저장 실패: {e}")
+
 def job():
     """
     스케줄링된 작업: 알라딘 신간 도서 스크래핑
@@ -27,11 +76,17 @@ def job():
     current_day = datetime.now().strftime("%A")
     logger.info(f"현재 요일: {current_day}")
     
+    before = REGISTRY.snapshot()
+    summary = {"started_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "books": 0, "featured": 0, "error": None}
     try:
         books, interesting_books = scrape_aladin_new_books()
+        summary["books"], summary["featured"] = len(books), len(interesting_books)
         logger.info(f"작업 완료: 총 {len(books)}권의 책 정보 추출, 주목할만한 책 {len(interesting_books)}권 선정")
     except Exception as e:
+        summary["error"] = str(e)
         logger.error(f"스케줄된 작업 실행 중 오류 발생: {e}")
+    summary.update(build_run_summary(diff_snapshots(before, REGISTRY.snapshot())))
+    write_run_summary(summary)
 
 def run_scheduler():
     """
@@ -5,12 +5,21 @@ import os
 import json
 import logging
 import datetime
-import requests
 import re
-from bs4 import BeautifulSoup
-import time
-import random
 import sys  # ← 이 줄 추가
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http_client import HttpClient, CircuitOpenError
+from parsers import parse_detail_blocks, parse_list_items
+from crawl_frontier import CrawlFrontier, parse_list_urls
+from book_metadata import enrich_book, extract_item_id
+from selection import select_interesting_books
+from book_store import get_book_store
+from manifest import update_manifest, week_checksums
+from atomic_io import atomic_write_json, data_dir_lock
+from book_registry import load_registry, save_registry, read_week_file
+from search_index import update_search_index
+from metrics import timer, STAGE_SECONDS, DETAIL_FETCHES, FIELD_EXTRACTIONS
 
 # 로깅 설정
 logging.basicConfig(
@@ -37,173 +46,172 @@ HEADERS = {
 # 알라딘 주목할만한 새 책 URL
 ALADIN_URL = "https://www.aladin.co.kr/shop/common/wnew.aspx?BranchType=1&NewType=SpecialNew"
 
-def extract_book_info_from_text(text):
+# 크롤할 목록 URL (쉼표/공백 구분, 기본값: ALADIN_URL 하나)과 목록마다 최대 페이지 수, 목록 페이지 동시 요청 수
+# 예: ALADIN_LIST_URLS="...NewType=SpecialNew ...NewType=New ...BranchType=2&NewType=New" ALADIN_LIST_PAGES=3
+LIST_URLS = parse_list_urls(os.environ.get("ALADIN_LIST_URLS", "")) or [ALADIN_URL]
+LIST_MAX_PAGES = int(os.environ.get("ALADIN_LIST_PAGES", "1"))
+LIST_MAX_WORKERS = int(os.environ.get("ALADIN_LIST_WORKERS", "4"))
+
+# 커넥션을 재사용하고 조건부 요청/응답 캐시를 처리하는 공용 HTTP 클라이언트
+HTTP_CLIENT = HttpClient(headers=HEADERS)
+
+# 상세 페이지 동시 요청 설정
+# - DETAIL_MAX_WORKERS: 동시에 상세 페이지를 가져올 스레드 수 (1이면 순차 실행)
+# (호스트별 요청 속도, 재시도, 서킷 브레이커는 http_client.py에서 처리)
+DETAIL_MAX_WORKERS = int(os.environ.get("ALADIN_DETAIL_WORKERS", "4"))
+
+# 이미 주차 파일에 있는 책의 상세 정보를 다시 가져오기 전까지 유지하는 시간(시간 단위)
+DETAIL_MAX_AGE_HOURS = float(os.environ.get("ALADIN_DETAIL_MAX_AGE_HOURS", "72"))
+
+# 상세 정보 요청 실패 시 저장되는 기본 설명 (재수집 대상 판별용)
+DETAIL_FALLBACK_DESCRIPTION = "책 소개 정보를 가져오지 못했습니다."
+
+# 필드별 추출 결과 카운터에서 기본값(fallback)으로 보는 값
+FIELD_FALLBACK_VALUES = {"", None, DETAIL_FALLBACK_DESCRIPTION}
+TRACKED_FIELDS = ("author", "publisher", "price", "description", "pub_date", "pages", "isbn", "category_info")
+
+# 책 정보 추출 패턴 (모듈 로드 시 한 번만 컴파일)
+# 각 항목: (필드, 패턴, 텍스트에 반드시 있어야 하는 문자열들)
+# 필수 문자열이 없으면 정규식을 실행하지 않고 건너뜁니다.
+BOOK_INFO_PATTERNS = {
+    "author": [
+        # 저자: (지은이) 앞에 있는 이름
+        (re.compile(r'([^|]+?)\s*\(지은이\)'), ("(지은이)",)),
+        # 다른 형식의 저자 정보
+        (re.compile(r'([^|]+?)\s*저자'), ("저자",)),
+    ],
+    "publisher": [
+        # 출판사: (지은이) | 뒤에 있는 이름
+        (re.compile(r'\(지은이\)\s*\|\s*([^|]+?)(?=\||$)'), ("(지은이)", "|")),
+        # 다른 형식의 출판사 정보
+        (re.compile(r'출판사\s*:\s*([^|]+?)(?=\||$)'), ("출판사",)),
+    ],
+    "pub_date": [
+        # 출판일: | 다음에 있는 년월 정보
+        (re.compile(r'\|\s*(20\d{2}년\s*\d{1,2}월)'), ("|", "년")),
+        # 다른 형식의 출판일 정보
+        (re.compile(r'출간일\s*:\s*(20\d{2}-\d{2}-\d{2}|20\d{2}년\s*\d{1,2}월)'), ("출간일",)),
+    ],
+    "price": [
+        # 가격: → 다음에 있는 금액
+        (re.compile(r'→\s*([\d,]+원)'), ("→",)),
+        # 다른 형식의 가격 정보
+        (re.compile(r'정가\s*:\s*([\d,]+원)'), ("정가",)),
+    ],
+}
+
+BOOK_INFO_DEFAULTS = {
+    "author": "저자 정보 없음",
+    "publisher": "출판사 정보 없음",
+    "pub_date": "출판일 정보 없음",
+    "price": "가격 정보 없음"
+}
+
+def _extract_book_info(text):
     """
-    텍스트에서 저자, 출판사, 출판일, 가격 정보를 추출합니다.
+    한 텍스트에서 저자, 출판사, 출판일, 가격을 추출합니다. (extract_book_info_batch 내부용)
+    """
+    info = dict(BOOK_INFO_DEFAULTS)
+    if not text:
+        return info
+
+    for field, patterns in BOOK_INFO_PATTERNS.items():
+        for pattern, required in patterns:
+            if not all(literal in text for literal in required):
+                continue
+            match = pattern.search(text)
+            if match:
+                info[field] = match.group(1).strip()
+                break
+
+    return info
+
+def extract_book_info_batch(texts):
+    """
+    여러 책 정보 텍스트에서 저자, 출판사, 출판일, 가격 정보를 한꺼번에 추출합니다.
+    결과는 texts와 같은 순서의 딕셔너리 목록입니다.
     
     사용자 지정 규칙:
     - 저자: (지은이) 앞에 있는 이름
     - 출판사: (지은이) | 뒤에 있는 이름
     - 출판일: | 다음에 있는 년월 정보
     - 가격: → 다음에 있는 금액
+    규칙에 맞지 않으면 "저자 :", "출판사 :", "출간일 :", "정가 :" 형식을 차례로 시도합니다.
     """
-    author = "저자 정보 없음"
-    publisher = "출판사 정보 없음"
-    pub_date = "출판일 정보 없음"
-    price = "가격 정보 없음"
+    debug = logger.isEnabledFor(logging.DEBUG)
+    results = []
+    for text in texts:
+        try:
+            info = _extract_book_info(text)
+        except Exception as e:
+            logger.error("텍스트에서 책 정보 추출 실패: %s", e)
+            info = dict(BOOK_INFO_DEFAULTS)
+        if debug:
+            logger.debug("책 정보 추출: %s → %s", text, info)
+        results.append(info)
+    return results
+
+def extract_book_info_from_text(text):
+    """
+    텍스트에서 저자, 출판사, 출판일, 가격 정보를 추출합니다.
+    (extract_book_info_batch의 단일 텍스트 버전)
+    """
+    return extract_book_info_batch([text])[0]
+
+def parse_book_details(html):
+    """
+    책 상세 페이지 HTML에서 추가 정보를 추출합니다.
+    가능한 모든 정보를 수집하여 빈 값을 최소화합니다.
+    """
+    with timer(STAGE_SECONDS, stage="detail_parse"):
+        return _parse_book_details(html)
+
+def _parse_book_details(html):
+    blocks = parse_detail_blocks(html)
     
-    try:
-        logger.debug(f"추출할 텍스트: {text}")
-        
-        # 저자 추출: (지은이) 앞에 있는 이름
-        author_match = re.search(r'([^|]+?)\s*\(지은이\)', text)
-        if author_match:
-            author = author_match.group(1).strip()
-            logger.debug(f"저자 추출 성공: {author}")
-        
-        # 출판사 추출: (지은이) | 뒤에 있는 이름
-        publisher_match = re.search(r'\(지은이\)\s*\|\s*([^|]+?)(?=\||$)', text)
-        if publisher_match:
-            publisher = publisher_match.group(1).strip()
-            logger.debug(f"출판사 추출 성공: {publisher}")
-        
-        # 출판일 추출: | 다음에 있는 년월 정보
-        pub_date_match = re.search(r'\|\s*(20\d{2}년\s*\d{1,2}월)', text)
-        if pub_date_match:
-            pub_date = pub_date_match.group(1).strip()
-            logger.debug(f"출판일 추출 성공: {pub_date}")
-        
-        # 가격 추출: → 다음에 있는 금액
-        price_match = re.search(r'→\s*([\d,]+원)', text)
-        if price_match:
-            price = price_match.group(1).strip()
-            logger.debug(f"가격 추출 성공: {price}")
-        
-        # 추가 패턴 시도 - 알라딘 웹페이지의 다양한 형식 대응
-        if author == "저자 정보 없음":
-            # 다른 형식의 저자 정보 시도
-            alt_author_match = re.search(r'([^|]+?)\s*저자', text)
-            if alt_author_match:
-                author = alt_author_match.group(1).strip()
-                logger.debug(f"대체 패턴으로 저자 추출 성공: {author}")
-        
-        if publisher == "출판사 정보 없음":
-            # 다른 형식의 출판사 정보 시도
-            alt_publisher_match = re.search(r'출판사\s*:\s*([^|]+?)(?=\||$)', text)
-            if alt_publisher_match:
-                publisher = alt_publisher_match.group(1).strip()
-                logger.debug(f"대체 패턴으로 출판사 추출 성공: {publisher}")
-        
-        if pub_date == "출판일 정보 없음":
-            # 다른 형식의 출판일 정보 시도
-            alt_pub_date_match = re.search(r'출간일\s*:\s*(20\d{2}-\d{2}-\d{2}|20\d{2}년\s*\d{1,2}월)', text)
-            if alt_pub_date_match:
-                pub_date = alt_pub_date_match.group(1).strip()
-                logger.debug(f"대체 패턴으로 출판일 추출 성공: {pub_date}")
-        
-        if price == "가격 정보 없음":
-            # 다른 형식의 가격 정보 시도
-            alt_price_match = re.search(r'정가\s*:\s*([\d,]+원)', text)
-            if alt_price_match:
-                price = alt_price_match.group(1).strip()
-                logger.debug(f"대체 패턴으로 가격 추출 성공: {price}")
-    except Exception as e:
-        logger.error(f"텍스트에서 책 정보 추출 실패: {e}")
+    # 책 소개
+    description = blocks["description"]
+    
+    # 텍스트에서 저자, 출판사, 출판일, 가격 정보 추출
+    extracted_info = extract_book_info_from_text(blocks["book_info_text"])
+    
+    # 카테고리 정보
+    category = blocks["category"].replace('분야 :', '').replace('분야:', '').strip()
+    
+    # ISBN
+    isbn = blocks["isbn"].replace('ISBN :', '').replace('ISBN:', '').strip()
+    
+    # 페이지 수
+    pages = blocks["pages"].replace('페이지 :', '').replace('쪽수 :', '').replace('쪽수:', '').strip()
     
     return {
-        "author": author,
-        "publisher": publisher,
-        "pub_date": pub_date,
-        "price": price
+        "description": description[:500] + "..." if len(description) > 500 else description,
+        "pub_date": extracted_info["pub_date"],
+        "pages": pages if pages else "페이지 정보 없음",
+        "isbn": isbn if isbn else "ISBN 정보 없음",
+        "detailed_price": extracted_info["price"],
+        "detailed_author": extracted_info["author"],
+        "detailed_publisher": extracted_info["publisher"],
+        "category": category if category else "분류 정보 없음"
     }
 
 def get_book_details(book_url):
     """
-    책 상세 페이지에서 추가 정보를 가져옵니다.
-    가능한 모든 정보를 수집하여 빈 값을 최소화합니다.
+    책 상세 페이지를 가져와 추가 정보를 추출합니다. 실패하면 기본값을 돌려줍니다.
     """
     try:
-        response = requests.get(book_url, headers=HEADERS)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # 책 소개 추출 - 여러 선택자 시도
-        description = ""
-        description_selectors = ['#div_book_content', '.Ere_prod_mconts_box', '.book_info_area']
-        for selector in description_selectors:
-            description_div = soup.select_one(selector)
-            if description_div and description_div.get_text(strip=True):
-                description = description_div.get_text(strip=True)
-                break
-        
-        # 책 정보 텍스트 추출 - 사용자 지정 규칙에 따라 정보 추출
-        book_info_text = ""
-        book_info_selectors = ['.Ere_book_info', '.book_info_area', '.info_list']
-        for selector in book_info_selectors:
-            book_info_div = soup.select_one(selector)
-            if book_info_div:
-                book_info_text = book_info_div.get_text(strip=True)
-                break
-        
-        # 텍스트에서 저자, 출판사, 출판일, 가격 정보 추출
-        extracted_info = extract_book_info_from_text(book_info_text)
-        
-        # 카테고리 정보 추출
-        category = ""
-        category_selectors = [
-            '.location', 
-            '.catetab_cont li:contains("분야")',
-            '.book_info_area li:contains("분야")'
-        ]
-        for selector in category_selectors:
-            category_info = soup.select_one(selector)
-            if category_info:
-                category = category_info.get_text(strip=True)
-                category = category.replace('분야 :', '').replace('분야:', '').strip()
-                break
-        
-        # ISBN 추출
-        isbn = ""
-        isbn_info_selectors = [
-            '.info_list li:contains("ISBN")', 
-            '.book_info_area li:contains("ISBN")',
-            '.Ere_sub2_title:contains("ISBN")'
-        ]
-        for selector in isbn_info_selectors:
-            isbn_info = soup.select_one(selector)
-            if isbn_info:
-                isbn = isbn_info.get_text(strip=True)
-                isbn = isbn.replace('ISBN :', '').replace('ISBN:', '').strip()
-                break
-        
-        # 페이지 수 추출
-        pages = ""
-        page_info_selectors = [
-            '.info_list li:contains("페이지")', 
-            '.book_info_area li:contains("페이지")',
-            '.Ere_sub2_title:contains("페이지")'
-        ]
-        for selector in page_info_selectors:
-            page_info = soup.select_one(selector)
-            if page_info:
-                pages = page_info.get_text(strip=True)
-                pages = pages.replace('페이지 :', '').replace('쪽수 :', '').replace('쪽수:', '').strip()
-                break
-        
-        return {
-            "description": description[:500] + "..." if len(description) > 500 else description,
-            "pub_date": extracted_info["pub_date"],
-            "pages": pages if pages else "페이지 정보 없음",
-            "isbn": isbn if isbn else "ISBN 정보 없음",
-            "detailed_price": extracted_info["price"],
-            "detailed_author": extracted_info["author"],
-            "detailed_publisher": extracted_info["publisher"],
-            "category": category if category else "분류 정보 없음"
-        }
+        details = parse_book_details(HTTP_CLIENT.get_text(book_url))
+        DETAIL_FETCHES.inc(result="ok")
+        return details
     except Exception as e:
-        logger.error(f"책 상세 정보 가져오기 실패: {e}")
+        if isinstance(e, CircuitOpenError):
+            DETAIL_FETCHES.inc(result="circuit_open")
+            logger.warning("책 상세 정보 요청 건너뜀: %s", e)
+        else:
+            DETAIL_FETCHES.inc(result="error")
+            logger.error("책 상세 정보 가져오기 실패: %s", e)
         return {
-            "description": "책 소개 정보를 가져오지 못했습니다.",
+            "description": DETAIL_FALLBACK_DESCRIPTION,
             "pub_date": "출판일 정보 없음",
             "pages": "페이지 정보 없음",
             "isbn": "ISBN 정보 없음",
@@ -213,183 +221,356 @@ def get_book_details(book_url):
             "category": "분류 정보 없음"
         }
 
-def scrape_aladin_new_books():
+def build_book_record(listed, details, scrape_date=None):
+    """
+    목록 항목(parse_list_items + extracted_info)과 상세 정보로 저장할 책 레코드를 만듭니다.
+    """
+    extracted_info = listed["extracted_info"]
+    book_info = {
+        "title": listed["title"],
+        "author": details.get("detailed_author", extracted_info["author"]),
+        "publisher": details.get("detailed_publisher", extracted_info["publisher"]),
+        "price": details.get("detailed_price", extracted_info["price"]),
+        "img_url": listed["img_url"],
+        "book_url": listed["book_url"],
+        "short_description": listed["short_description"],
+        "description": details.get("description", ""),
+        "pub_date": details.get("pub_date", extracted_info["pub_date"]),
+        "pages": details.get("pages", ""),
+        "isbn": details.get("isbn", ""),
+        "category_info": details.get("category", ""),
+        "scrape_date": scrape_date or datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+    
+    # 기본정보/주제 분류 블록을 페이지 수, ISBN-13, 분류 경로 등 구조화된 필드로 변환
+    enrich_book(book_info)
+    count_field_results(book_info)
+    return book_info
+
+def count_field_results(book):
+    """
+    필드별로 값을 추출했는지, 기본값('... 정보 없음' 등)으로 남았는지 카운터에 기록합니다.
+    """
+    for field in TRACKED_FIELDS:
+        value = book.get(field)
+        fallback = value in FIELD_FALLBACK_VALUES or (isinstance(value, str) and value.endswith("정보 없음"))
+        FIELD_EXTRACTIONS.inc(field=field, result="fallback" if fallback else "ok")
+
+def parse_list_page(html):
+    """
+    목록 페이지 하나를 파싱합니다. (list_parse 단계 시간 기록, 프런티어 작업 스레드에서 호출)
+    """
+    with timer(STAGE_SECONDS, stage="list_parse"):
+        return parse_list_items(html)
+
+def crawl_listings(cancel_event=None):
+    """
+    LIST_URLS의 모든 목록을 페이지까지 병렬로 훑어 ItemId 중복을 제거한 목록 항목을 돌려줍니다.
+    """
+    frontier = CrawlFrontier(LIST_URLS, fetch=HTTP_CLIENT.get_text, parse=parse_list_page,
+                             max_pages=LIST_MAX_PAGES, max_workers=LIST_MAX_WORKERS)
+    return frontier.crawl(cancel_event=cancel_event)
+
+def get_book_keys(book):
+    """
+    책을 식별하는 키 목록을 돌려줍니다. (ItemId, ISBN 순)
+    """
+    keys = []
+    item_id = extract_item_id(book.get("book_url", ""))
+    if item_id:
+        keys.append(("item", item_id))
+    isbn = book.get("isbn", "")
+    if isbn and isbn != "ISBN 정보 없음":
+        keys.append(("isbn", isbn))
+    return keys
+
+def build_book_index(books, keys_func=get_book_keys):
+    """
+    책 목록에서 (ItemId/ISBN 키 → 목록 내 위치) 인덱스를 만듭니다.
+    """
+    index = {}
+    for position, book in enumerate(books):
+        for key in keys_func(book):
+            index.setdefault(key, position)
+    return index
+
+def find_book_position(index, book, keys_func=get_book_keys):
+    """
+    인덱스에서 같은 책의 위치를 찾습니다. 없으면 None을 돌려줍니다.
+    """
+    for key in keys_func(book):
+        if key in index:
+            return index[key]
+    return None
+
+def is_book_stale(book, now=None, max_age_hours=None):
+    """
+    저장된 책 정보를 다시 수집해야 하는지 판단합니다.
+    상세 정보 요청이 실패했던 책이나 max_age_hours보다 오래된 책이 대상입니다.
+    """
+    if now is None:
+        now = datetime.datetime.now()
+    if max_age_hours is None:
+        max_age_hours = DETAIL_MAX_AGE_HOURS
+
+    if not book.get("description") or book.get("description") == DETAIL_FALLBACK_DESCRIPTION:
+        return True
+
+    try:
+        scraped_at = datetime.datetime.strptime(book.get("scrape_date", ""), "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return True
+
+    return now - scraped_at > datetime.timedelta(hours=max_age_hours)
+
+def load_week_books(filename):
+    """
+    주차 파일에서 책 목록을 읽어옵니다. 파일이 없거나 읽을 수 없으면 빈 목록을 돌려줍니다.
+    """
+    if not os.path.exists(filename):
+        return []
+    try:
+        books = read_week_file(filename, DATA_DIR)
+        logger.info("기존 데이터 %s권 발견", len(books))
+        return books
+    except (OSError, ValueError) as e:
+        logger.warning("기존 파일을 읽을 수 없어 새로 생성합니다: %s (%s)", filename, e)
+        return []
+
+class ScrapeCancelled(Exception):
+    """
+    cancel_event가 설정되어 스크래핑을 중단했을 때 발생합니다.
+    """
+
+def merge_week_books(existing_books, books, registry=None):
+    """
+    새로 수집한 책을 기존 주차 목록에 병합합니다.
+    중복은 ItemId/ISBN으로 판단하고, 식별자가 없으면 제목 기준으로 판단합니다.
+    registry(BookRegistry)를 주면 ItemId와 ISBN이 서로 다른 항목도 같은 정규 ID이면 같은 책으로 봅니다.
+    다시 수집한 책은 기존 위치를 그대로 유지한 채 새 정보로 교체합니다.
+    반환값: (병합된 전체 목록, 새로 추가된 책 목록)
+    """
+    def keys_func(book):
+        keys = get_book_keys(book)
+        canonical_id = registry.find(book) if registry is not None else None
+        return [("canonical", canonical_id)] + keys if canonical_id else keys
+
+    existing_index = build_book_index(existing_books, keys_func)
+    all_books = list(existing_books)
+    existing_titles = {book.get('title', '') for book in existing_books}
+    new_books = []
+    for book in books:
+        position = find_book_position(existing_index, book, keys_func)
+        if position is not None:
+            all_books[position] = book
+            continue
+        if not get_book_keys(book) and book.get('title', '') in existing_titles:
+            continue
+        for key in keys_func(book):
+            existing_index[key] = len(all_books)
+        existing_titles.add(book.get('title', ''))
+        all_books.append(book)
+        new_books.append(book)
+    return all_books, new_books
+
+def data_write_lock():
+    """
+    data 디렉토리 쓰기 잠금 (프로세스 간 공유)
+    """
+    return data_dir_lock(DATA_DIR)
+
+def fetch_all_book_details(book_urls, max_workers=None, on_fetched=None, cancel_event=None):
+    """
+    여러 책의 상세 정보를 스레드 풀로 동시에 가져옵니다.
+    결과는 book_urls 순서를 그대로 유지하며, URL이 비어 있으면 빈 딕셔너리를 돌려줍니다.
+    개별 책의 실패는 get_book_details의 기본값으로 대체됩니다.
+    요청 속도는 HTTP_CLIENT의 호스트별 속도 제한기가 맞추므로 스레드 수만큼 요청이 몰리지 않습니다.
+
+    on_fetched: 상세 요청이 하나 끝날 때마다 book_url로 호출되는 콜백 (작업 스레드에서 호출)
+    cancel_event: 설정되면 남은 요청을 보내지 않고 ScrapeCancelled를 발생시킵니다
+    """
+    if max_workers is None:
+        max_workers = DETAIL_MAX_WORKERS
+
+    def fetch(book_url):
+        if not book_url:
+            return {}
+        if cancel_event is not None and cancel_event.is_set():
+            raise ScrapeCancelled()
+        details = get_book_details(book_url)
+        if on_fetched is not None:
+            on_fetched(book_url)
+        return details
+
+    if max_workers <= 1:
+        return [fetch(book_url) for book_url in book_urls]
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="aladin-detail") as executor:
+        # map은 입력 순서대로 결과를 돌려줍니다
+        return list(executor.map(fetch, book_urls))
+
+def scrape_aladin_new_books(max_workers=None, progress=None, cancel_event=None):
     """
     알라딘 주목할만한 새 책 페이지에서 책 정보를 스크래핑합니다.
+    max_workers로 상세 페이지 동시 요청 수를 지정할 수 있습니다 (기본값: DETAIL_MAX_WORKERS).
+
+    progress: 책 하나를 처리할 때마다 (처리한 수, 전체 수, 제목)으로 호출되는 콜백
+    cancel_event: threading.Event. 설정되면 파일을 쓰기 전에 멈추고 ScrapeCancelled를 발생시킵니다
     """
+    with timer(STAGE_SECONDS, stage="scrape"):
+        return _scrape_aladin_new_books(max_workers, progress, cancel_event)
+
+def _scrape_aladin_new_books(max_workers, progress, cancel_event):
     logger.info("알라딘 주목할만한 새 책 스크래핑 시작")
     
     try:
-        # 페이지 요청
-        response = requests.get(ALADIN_URL, headers=HEADERS)
-        response.raise_for_status()
+        # 결과 저장 - 주차 기반
+        now = datetime.datetime.now()
+        year, week, _ = now.isocalendar()  # ISO 8601 주차
+
+        # 파일명: week_2025_W01.json 형식
+        filename = os.path.join(DATA_DIR, f"week_{year}_W{week:02d}.json")
+
+        # 크롤링 전에 기존 주차 데이터를 읽어 이미 가진 책은 상세 요청을 건너뜁니다
+        # (ALADIN_STORAGE=sqlite이면 SQLite 저장소의 주차 스냅샷을 사용)
+        store = get_book_store()
+        existing_books = store.get_week_books(year, week) if store else load_week_books(filename)
+        existing_index = build_book_index(existing_books)
+
+        # 1단계: 모든 목록 페이지를 병렬로 요청해 기본 정보만 먼저 추출 (ItemId 중복 제거)
+        # list_fetch는 목록 크롤 전체, list_parse는 페이지별 파싱 시간
+        with timer(STAGE_SECONDS, stage="list_fetch"):
+            listed_books = crawl_listings(cancel_event)
+        # 텍스트에서 저자, 출판사, 출판일, 가격 정보를 한꺼번에 추출
+        with timer(STAGE_SECONDS, stage="extract"):
+            extracted_infos = extract_book_info_batch([listed["book_info_text"] for listed in listed_books])
+        for listed, extracted_info in zip(listed_books, extracted_infos):
+            listed["extracted_info"] = extracted_info
         
-        # HTML 파싱
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # 2단계: 이미 저장된 최신 책은 재사용하고, 나머지만 상세 페이지 요청
+        # 이번 주차에 없던 책도 지난 주차에 수집한 최신 레코드가 레지스트리에 있으면 재사용
+        registry = load_registry(DATA_DIR)
+        detail_urls = []
+        reused_count = 0
+        registry_count = 0
+        for listed in listed_books:
+            position = find_book_position(existing_index, listed)
+            listed["existing"] = existing_books[position] if position is not None else None
+            if listed["existing"] is None:
+                canonical = registry.canonical_record(listed)
+                if canonical is not None and not is_book_stale(canonical, now):
+                    listed["existing"] = dict(canonical)
+                    registry_count += 1
+            if listed["existing"] is not None and not is_book_stale(listed["existing"], now):
+                detail_urls.append("")
+                reused_count += 1
+            else:
+                detail_urls.append(listed["book_url"])
+        logger.info("상세 요청 %s건, 기존 데이터 재사용 %s건 (지난 주차 레코드 %s건)", len(listed_books) - reused_count, reused_count, registry_count)
         
-        # 책 목록 컨테이너 찾기
-        book_items = soup.select('.ss_book_box')
+        # 진행률: 재사용한 책은 바로 처리한 것으로 계산
+        titles_by_url = {listed["book_url"]: listed["title"] for listed in listed_books}
+        progress_lock = threading.Lock()
+        progress_state = {"done": reused_count}
+        total = len(listed_books)
+        if progress is not None:
+            progress(reused_count, total, None)
+
+        def on_fetched(book_url):
+            if progress is None:
+                return
+            with progress_lock:
+                progress_state["done"] += 1
+                progress(progress_state["done"], total, titles_by_url.get(book_url))
+
+        # 상세 페이지를 동시에 가져오기 (순서 유지)
+        with timer(STAGE_SECONDS, stage="detail_fetch"):
+            all_details = fetch_all_book_details(detail_urls, max_workers=max_workers,
+                                                 on_fetched=on_fetched, cancel_event=cancel_event)
+
+        # 파일을 쓰기 전 마지막 취소 지점
+        if cancel_event is not None and cancel_event.is_set():
+            raise ScrapeCancelled()
         
         books = []
         
-        for item in book_items:
-            try:
-                # 책 제목
-                title_elem = item.select_one('.bo3')
-                title = title_elem.get_text(strip=True) if title_elem else "제목 없음"
-                
-                # 책 URL
-                book_url = title_elem['href'] if title_elem and title_elem.has_attr('href') else ""
-                
-                # 이미지 URL
-                img_elem = item.select_one('.front_cover img')
-                img_url = img_elem['src'] if img_elem and img_elem.has_attr('src') else ""
-                
-                # 책 정보 텍스트 (저자, 출판사, 출판일, 가격 정보 추출용)
-                book_info_text = ""
-                info_elem = item.select_one('.ss_book_list')
-                if info_elem:
-                    book_info_text = info_elem.get_text(strip=True)
-                
-                # 텍스트에서 저자, 출판사, 출판일, 가격 정보 추출
-                extracted_info = extract_book_info_from_text(book_info_text)
-                
-                # 간단한 설명
-                short_description_elem = item.select_one('.ss_book_list:nth-of-type(3)')
-                short_description = short_description_elem.get_text(strip=True) if short_description_elem else ""
+        with timer(STAGE_SECONDS, stage="assemble"):
+            for listed, details, detail_url in zip(listed_books, all_details, detail_urls):
+                try:
+                    if listed["existing"] is not None and not detail_url:
+                        # 상세 요청을 건너뛴 책은 저장된 정보를 그대로 사용
+                        books.append(enrich_book(listed["existing"]))
+                        continue
                 
-                # 책 상세 페이지에서 추가 정보 가져오기
-                details = {}
-                if book_url:
-                    # 너무 많은 요청을 방지하기 위해 잠시 대기
-                    time.sleep(random.uniform(1, 3))
-                    details = get_book_details(book_url)
+                    book_info = build_book_record(listed, details)
+                    books.append(book_info)
+                    logger.info("책 정보 추출 성공: %s", listed['title'])
                 
-                book_info = {
-                    "title": title,
-                    "author": details.get("detailed_author", extracted_info["author"]),
-                    "publisher": details.get("detailed_publisher", extracted_info["publisher"]),
-                    "price": details.get("detailed_price", extracted_info["price"]),
-                    "img_url": img_url,
-                    "book_url": book_url,
-                    "short_description": short_description,
-                    "description": details.get("description", ""),
-                    "pub_date": details.get("pub_date", extracted_info["pub_date"]),
-                    "pages": details.get("pages", ""),
-                    "isbn": details.get("isbn", ""),
-                    "category_info": details.get("category", ""),
-                    "scrape_date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
-                
-                books.append(book_info)
-                logger.info(f"책 정보 추출 성공: {title}")
-                
-            except Exception as e:
-                logger.error(f"책 정보 추출 실패: {e}")
-                continue
+                except Exception as e:
+                    logger.error("책 정보 추출 실패: %s", e)
+                    continue
         
-        logger.info(f"총 {len(books)}권의 책 정보 추출 완료")
-
-        # 결과 저장 - 주차 기반
-        now = datetime.datetime.now()
-        year, week, _ = now.isocalendar()  # ISO 8601 주차
+        logger.info("총 %s권의 책 정보 추출 완료", len(books))
 
-        # 파일명: week_2025_W01.json 형식
-        filename = os.path.join(DATA_DIR, f"week_{year}_W{week:02d}.json")
+        # 크롤링하는 동안 다른 프로세스(스케줄러, /refresh)가 같은 주차를 썼을 수 있으므로
+        # 잠금을 잡은 뒤 기존 데이터를 다시 읽어 병합하고, 모든 파일은 임시 파일 후 교체로 씁니다
+        # persist 단계는 잠금 대기, 레지스트리/주차 파일 쓰기, 선정, 매니페스트, 검색 색인을 모두 포함
+        with timer(STAGE_SECONDS, stage="persist"), data_write_lock():
+            existing_books = store.get_week_books(year, week) if store else load_week_books(filename)
+            registry = load_registry(DATA_DIR)
+            registry.merge_week(year, week, books)
+            all_books, new_books = merge_week_books(existing_books, books, registry)
+            # 정규 레코드와 처음/마지막 등장 주차 갱신 (책 한 권당 O(1))
+            # 주차 파일은 레코드 대신 레지스트리 참조 목록으로 저장
+            previous_revisions = registry.week_revisions(year, week)
+            if store:
+                registry.merge_week(year, week, all_books)
+            else:
+                week_data = registry.week_file_data(year, week, all_books)
+            # 다시 수집해 교체된 옛 revision 정리 (이전 주차 파일은 새 파일로 바뀔 때까지 그대로 읽혀야 함)
+            registry.prune_records(keep=previous_revisions)
+            save_registry(registry, DATA_DIR)
 
-        # 기존 데이터가 있으면 병합
-        existing_books = []
-        if os.path.exists(filename):
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    existing_books = json.load(f)
-                logger.info(f"기존 데이터 {len(existing_books)}권 발견")
-            except:
-                logger.warning("기존 파일을 읽을 수 없어 새로 생성합니다")
+            if store:
+                store.save_week(year, week, all_books)
+            else:
+                atomic_write_json(filename, week_data)
 
-        # 중복 제거 (ISBN 또는 제목 기준)
-        existing_titles = {book.get('title', '') for book in existing_books}
-        new_books = [book for book in books if book.get('title', '') not in existing_titles]
+            logger.info("책 정보 저장 완료: %s (기존 %s권 + 신규 %s권)", filename, len(existing_books), len(new_books))
 
-        # 병합
-        all_books = existing_books + new_books
+            # 가장 흥미로운 책 30권 선정 (전체 병합된 데이터에서)
+            with timer(STAGE_SECONDS, stage="select"):
+                interesting_books = select_interesting_books(all_books, 30)
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(all_books, f, ensure_ascii=False, indent=2)
+            interesting_filename = os.path.join(DATA_DIR, f"interesting_week_{year}_W{week:02d}.json")
+            if store:
+                store.save_featured(year, week, interesting_books)
+                # Vercel 읽기 전용 배포를 위해 기존 JSON 파일도 함께 내보냅니다
+                store.export_week_json(year, week, DATA_DIR)
+            else:
+                atomic_write_json(interesting_filename, interesting_books)
 
-        logger.info(f"책 정보 저장 완료: {filename} (기존 {len(existing_books)}권 + 신규 {len(new_books)}권)")
+            logger.info("주목할만한 책 30권 저장 완료: %s", interesting_filename)
 
-        # 가장 흥미로운 책 30권 선정 (전체 병합된 데이터에서)
-        interesting_books = select_interesting_books(all_books, 30)
+            # 웹 앱이 사용하는 주차 매니페스트 갱신 (쓰기마다 세대 번호 증가)
+            manifest = update_manifest(year, week, last_scrape=now.strftime("%Y-%m-%d %H:%M:%S"), data_dir=DATA_DIR)
 
-        interesting_filename = os.path.join(DATA_DIR, f"interesting_week_{year}_W{week:02d}.json")
-        with open(interesting_filename, 'w', encoding='utf-8') as f:
-            json.dump(interesting_books, f, ensure_ascii=False, indent=2)
+            # 검색 색인은 체크섬이 바뀐 주차(이번 주차)만 다시 색인
+            with timer(STAGE_SECONDS, stage="search_index"):
+                update_search_index(DATA_DIR, week_checksums(manifest))
 
-        logger.info(f"주목할만한 책 30권 저장 완료: {interesting_filename}")
+        # 오래되었거나 크기 상한을 넘는 HTTP 캐시 정리
+        HTTP_CLIENT.cache.evict()
         
         return books, interesting_books
-        
+
+    except ScrapeCancelled:
+        logger.info("스크래핑이 취소되었습니다")
+        raise
     except Exception as e:
-        logger.error(f"스크래핑 중 오류 발생: {e}")
+        logger.error("스크래핑 중 오류 발생: %s", e)
         return [], []
 
-def select_interesting_books(books, count=30):
-    """
-    경제, 정치, 인문, 사회, 자기계발, 과학 분야의 책 중에서
-    가장 흥미로운 책 30권을 선정합니다.
-    """
-    # 관심 카테고리 정의
-    target_categories = [
-        "경제", "정치", "인문", "사회", "자기계발", "과학",
-        "경영", "비즈니스", "심리", "철학", "역사", "사회과학"
-    ]
-    
-    # 카테고리에 해당하는 책만 필터링
-    filtered_books = []
-    for book in books:
-        title = book.get("title", "").lower()
-        description = book.get("description", "").lower() + book.get("short_description", "").lower()
-        publisher = book.get("publisher", "").lower()
-        
-        # 카테고리 관련 키워드가 제목, 설명, 출판사에 포함되어 있는지 확인
-        for category in target_categories:
-            if (category.lower() in title or 
-                category.lower() in description or 
-                category.lower() in publisher):
-                filtered_books.append(book)
-                break
-    
-    # 필터링된 책이 count보다 적으면 원래 목록에서 추가
-    if len(filtered_books) < count:
-        remaining_count = count - len(filtered_books)
-        # 이미 선택된 책은 제외
-        remaining_books = [b for b in books if b not in filtered_books]
-        # 설명 길이를 기준으로 정렬
-        sorted_remaining = sorted(remaining_books, key=lambda x: len(x.get("description", "")), reverse=True)
-        filtered_books.extend(sorted_remaining[:remaining_count])
-    
-    # 설명 길이를 기준으로 정렬
-    sorted_books = sorted(filtered_books, key=lambda x: len(x.get("description", "")), reverse=True)
-    
-    # 상위 count개 선택
-    selected_books = sorted_books[:count]
-    
-    # 선택된 책에 카테고리 정보 추가
-    for book in selected_books:
-        book_categories = []
-        title = book.get("title", "").lower()
-        description = book.get("description", "").lower() + book.get("short_description", "").lower()
-        
-        for category in target_categories:
-            if (category.lower() in title or 
-                category.lower() in description):
-                book_categories.append(category)
-        
-        book["categories"] = book_categories if book_categories else ["기타"]
-    
-    return selected_books
-
 def get_latest_books():
     """
     가장 최근에 스크래핑한 책 정보를 가져옵니다.
@@ -403,12 +584,9 @@ def get_latest_books():
         latest_file = max(files)
         file_path = os.path.join(DATA_DIR, latest_file)
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            books = json.load(f)
-
-        return books
+        return read_week_file(file_path, DATA_DIR)
     except Exception as e:
-        logger.error(f"최근 책 정보 가져오기 실패: {e}")
+        logger.error("최근 책 정보 가져오기 실패: %s", e)
         return []
 
 def get_latest_interesting_books():
@@ -429,7 +607,7 @@ def get_latest_interesting_books():
 
         return books
     except Exception as e:
-        logger.error(f"최근 흥미로운 책 정보 가져오기 실패: {e}")
+        logger.error("최근 흥미로운 책 정보 가져오기 실패: %s", e)
         return []
 
 if __name__ == "__main__":
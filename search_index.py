@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+모든 주차(week_*.json)를 대상으로 하는 도서 검색용 역색인.
+
+제목, 저자, 출판사, 분류 경로를 정규화한 뒤 글자 단위 n-gram(1-gram + 2-gram)으로 나눠
+색인하므로 한국어처럼 띄어쓰기가 일정하지 않은 텍스트도 부분 문자열로 찾을 수 있습니다.
+같은 책(ItemId/URL 기준)은 여러 주차에 나와도 문서 하나로 묶고, 등장한 주차 목록을 함께 저장합니다.
+
+색인은 data/search_index.json에 저장되고, 주차 파일의 체크섬(매니페스트에 기록된 값)이 바뀐 주차만
+다시 색인합니다.
+
+사용법 (기존 data/ 디렉토리로 색인 갱신):
+    python search_index.py [데이터 디렉토리]
+"""
+
+import os
+import re
+import sys
+import json
+import logging
+import unicodedata
+
+from book_metadata import extract_item_id
+from atomic_io import atomic_write_json
+from week_archive import load_week, list_archived_weeks, archive_paths
+from manifest import load_manifest, file_checksum, week_checksums
+
+logger = logging.getLogger("aladin_search")
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+INDEX_FILENAME = "search_index.json"
+INDEX_VERSION = 2
+
+WEEK_FILE_PATTERN = re.compile(r'^week_(\d{4})_W(\d{2})\.json$')
+TOKEN_SPLIT_PATTERN = re.compile(r'[^\w]+')
+
+# 색인할 필드와 검색 점수 가중치
+FIELD_WEIGHTS = {
+    "title": 3,
+    "author": 2,
+    "publisher": 1,
+    "categories": 1,
+}
+
+# 자리표시자는 색인하지 않습니다
+PLACEHOLDERS = {"저자 정보 없음", "출판사 정보 없음", "분류 정보 없음"}
+
+def index_path(data_dir=DATA_DIR):
+    return os.path.join(data_dir, INDEX_FILENAME)
+
+def normalize(text):
+    return unicodedata.normalize("NFKC", text or "").lower()
+
+def tokenize(text):
+    """
+    정규화한 텍스트를 구분자로 나눈 토큰 목록
+    """
+    return [token for token in TOKEN_SPLIT_PATTERN.split(normalize(text)) if token]
+
+def ngrams(text):
+    """
+    텍스트의 글자 1-gram과 2-gram 집합 (토큰 경계를 넘지 않음)
+    """
+    grams = set()
+    for token in tokenize(text):
+        grams.update(token)
+        grams.update(token[i:i + 2] for i in range(len(token) - 1))
+    return grams
+
+def _query_grams(term):
+    # 검색어는 2-gram만으로 후보를 좁히고, 한 글자 검색어만 1-gram을 씁니다
+    if len(term) == 1:
+        return {term}
+    return {term[i:i + 2] for i in range(len(term) - 1)}
+
+def book_key(book):
+    """
+    여러 주차에 걸쳐 같은 책을 가리키는 키 (ItemId > URL > 제목)
+    """
+    item_id = extract_item_id(book.get("book_url"))
+    if item_id:
+        return f"item:{item_id}"
+    if book.get("book_url"):
+        return f"url:{book['book_url']}"
+    return f"title:{book.get('title', '')}"
+
+def _category_paths(book):
+    paths = list(book.get("category_paths") or [])
+    if not paths and book.get("category_info") not in (None, "", "분류 정보 없음"):
+        paths = [book["category_info"]]
+    return paths
+
+def _book_fields(book):
+    paths = _category_paths(book)
+    fields = {
+        "title": book.get("title", ""),
+        "author": book.get("author", ""),
+        "publisher": book.get("publisher", ""),
+        "categories": " ".join(segment for path in paths for segment in path.split(">")),
+    }
+    return {name: ("" if value in PLACEHOLDERS else value) for name, value in fields.items()}
+
+class SearchIndex:
+    """
+    문서(책) 목록과 n-gram → 문서 번호 역색인입니다.
+    """
+    def __init__(self):
+        self.docs = {}           # 문서 번호 → 문서 (key, fields, category_paths, book_url, img_url, weeks)
+        self.doc_ids = {}        # 책 키 → 문서 번호
+        self.postings = {}       # n-gram → 문서 번호 집합
+        self.week_versions = {}  # "2026-W01" → week 파일 sha256
+        self.next_doc_id = 0
+
+    # --- 색인 갱신 ---
+
+    def _index_doc(self, doc_id, doc):
+        grams = set()
+        for value in doc["fields"].values():
+            grams |= ngrams(value)
+        for gram in grams:
+            self.postings.setdefault(gram, set()).add(doc_id)
+
+    def _unindex_doc(self, doc_id, doc):
+        grams = set()
+        for value in doc["fields"].values():
+            grams |= ngrams(value)
+        for gram in grams:
+            doc_set = self.postings.get(gram)
+            if doc_set is not None:
+                doc_set.discard(doc_id)
+                if not doc_set:
+                    del self.postings[gram]
+
+    def remove_week(self, year, week):
+        """
+        주차의 기여분을 색인에서 뺍니다. 다른 주차에 남아 있지 않은 문서는 삭제합니다.
+        """
+        week_ref = [year, week]
+        for doc_id in list(self.docs):
+            doc = self.docs[doc_id]
+            if week_ref not in doc["weeks"]:
+                continue
+            doc["weeks"].remove(week_ref)
+            if not doc["weeks"]:
+                self._unindex_doc(doc_id, doc)
+                del self.docs[doc_id]
+                del self.doc_ids[doc["key"]]
+        self.week_versions.pop(f"{year}-W{week:02d}", None)
+
+    def add_week(self, year, week, books, version=None):
+        """
+        주차 도서 목록을 색인합니다. 이미 색인된 주차이면 먼저 지웁니다.
+        같은 책이 여러 주차에 있으면 가장 최근 주차의 필드로 문서를 갱신합니다.
+        """
+        self.remove_week(year, week)
+        week_ref = [year, week]
+        for book in books:
+            key = book_key(book)
+            fields = _book_fields(book)
+            doc_id = self.doc_ids.get(key)
+
+            if doc_id is None:
+                doc_id = self.next_doc_id
+                self.next_doc_id += 1
+                doc = {"key": key, "fields": fields, "category_paths": _category_paths(book),
+                       "book_url": book.get("book_url", ""), "img_url": book.get("img_url", ""), "weeks": [week_ref]}
+                self.docs[doc_id] = doc
+                self.doc_ids[key] = doc_id
+                self._index_doc(doc_id, doc)
+                continue
+
+            doc = self.docs[doc_id]
+            if week_ref not in doc["weeks"]:
+                doc["weeks"].append(week_ref)
+                doc["weeks"].sort(reverse=True)
+            if doc["weeks"][0] == week_ref and doc["fields"] != fields:
+                self._unindex_doc(doc_id, doc)
+                doc["fields"] = fields
+                doc["category_paths"] = _category_paths(book)
+                doc["book_url"] = book.get("book_url", "")
+                doc["img_url"] = book.get("img_url", "")
+                self._index_doc(doc_id, doc)
+
+        if version is not None:
+            self.week_versions[f"{year}-W{week:02d}"] = version
+
+    def sync(self, data_dir=DATA_DIR, checksums=None):
+        """
+        data 디렉토리의 week_*.json과 색인을 맞춥니다. 체크섬이 바뀐 주차만 다시 색인합니다.
+        checksums: {(year, week): sha256}. 생략하면 매니페스트에서, 매니페스트가 없으면 파일에서 계산합니다.
+        반환값: 색인이 바뀌었으면 True
+        """
+        if checksums is None:
+            checksums = current_week_checksums(data_dir)
+
+        seen = set()
+        changed = False
+        for (year, week), checksum in sorted(checksums.items()):
+            label = f"{year}-W{week:02d}"
+            seen.add(label)
+            if self.week_versions.get(label) == checksum:
+                continue
+
+            try:
+                books, _ = load_week(data_dir, year, week)
+            except (OSError, ValueError) as e:
+                logger.error(f"주차 데이터를 읽을 수 없습니다: {label} ({e})")
+                continue
+            self.add_week(year, week, books, checksum)
+            changed = True
+            logger.info(f"검색 색인 갱신: {label} ({len(books)}권)")
+
+        for label in set(self.week_versions) - seen:
+            year, week = label.split("-W")
+            self.remove_week(int(year), int(week))
+            changed = True
+        return changed
+
+    # --- 검색 ---
+
+    def search(self, query, limit=20, year=None, week=None):
+        """
+        검색어의 모든 단어가 (제목/저자/출판사/분류 중 어디든) 부분 문자열로 들어 있는 책을 찾습니다.
+        점수(필드 가중치 합)가 높은 순, 같으면 최근 주차 순으로 정렬합니다.
+        반환값: {"total": int, "items": [{title, author, publisher, categories, book_url, img_url, weeks, score}]}
+        categories는 /api/books와 같이 분류 경로 목록입니다.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return {"total": 0, "items": []}
+
+        # n-gram 역색인으로 후보를 좁힌 뒤 실제 부분 문자열 포함 여부로 확인
+        candidates = None
+        for term in terms:
+            for gram in _query_grams(term):
+                doc_set = self.postings.get(gram)
+                if not doc_set:
+                    return {"total": 0, "items": []}
+                candidates = set(doc_set) if candidates is None else candidates & doc_set
+                if not candidates:
+                    return {"total": 0, "items": []}
+
+        results = []
+        for doc_id in candidates:
+            doc = self.docs[doc_id]
+            if year is not None and not any(y == year and (week is None or w == week) for y, w in doc["weeks"]):
+                continue
+
+            normalized = {name: " ".join(tokenize(value)) for name, value in doc["fields"].items()}
+            score = 0
+            for term in terms:
+                term_score = sum(FIELD_WEIGHTS[name] for name, value in normalized.items() if term in value)
+                if term_score == 0:
+                    break
+                score += term_score
+            else:
+                results.append((score, doc["weeks"][0], doc_id))
+
+        results.sort(key=lambda result: (-result[0], [-part for part in result[1]], result[2]))
+        items = []
+        for score, _, doc_id in results[:limit]:
+            doc = self.docs[doc_id]
+            items.append({
+                **doc["fields"],
+                "categories": doc["category_paths"],
+                "book_url": doc["book_url"],
+                "img_url": doc["img_url"],
+                "weeks": doc["weeks"],
+                "score": score
+            })
+        return {"total": len(results), "items": items}
+
+    # --- 저장/불러오기 ---
+
+    def copy(self):
+        """
+        갱신용 사본. sync()는 사본에만 하고 다 끝난 뒤 참조를 바꾸면, 원본으로 검색 중인 요청은
+        바뀌는 도중의 색인을 보지 않습니다. (문서의 weeks 목록과 역색인 집합은 새로 만듭니다)
+        """
+        index = SearchIndex()
+        index.next_doc_id = self.next_doc_id
+        index.week_versions = dict(self.week_versions)
+        index.docs = {doc_id: {**doc, "weeks": [list(week_ref) for week_ref in doc["weeks"]]}
+                      for doc_id, doc in self.docs.items()}
+        index.doc_ids = dict(self.doc_ids)
+        index.postings = {gram: set(doc_ids) for gram, doc_ids in self.postings.items()}
+        return index
+
+    def to_dict(self):
+        return {
+            "version": INDEX_VERSION,
+            "next_doc_id": self.next_doc_id,
+            "week_versions": self.week_versions,
+            "docs": {str(doc_id): doc for doc_id, doc in self.docs.items()},
+            "postings": {gram: sorted(doc_ids) for gram, doc_ids in self.postings.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        index = cls()
+        index.next_doc_id = data["next_doc_id"]
+        index.week_versions = data["week_versions"]
+        index.docs = {int(doc_id): doc for doc_id, doc in data["docs"].items()}
+        index.doc_ids = {doc["key"]: doc_id for doc_id, doc in index.docs.items()}
+        index.postings = {gram: set(doc_ids) for gram, doc_ids in data["postings"].items()}
+        return index
+
+def current_week_checksums(data_dir=DATA_DIR):
+    """
+    주차별 week 파일 체크섬. 매니페스트가 있으면 그 값을 쓰고, 없으면 파일을 직접 해시합니다.
+    """
+    manifest = load_manifest(data_dir)
+    if manifest is not None:
+        return week_checksums(manifest)
+
+    checksums = {}
+    for name in os.listdir(data_dir):
+        match = WEEK_FILE_PATTERN.match(name)
+        if match:
+            checksums[(int(match.group(1)), int(match.group(2)))] = file_checksum(os.path.join(data_dir, name))
+    for year, week in list_archived_weeks(data_dir):
+        checksums.setdefault((year, week), file_checksum(archive_paths(data_dir, year, week)[0]))
+    return checksums
+
+def save_index(index, data_dir=DATA_DIR):
+    """
+    임시 파일에 쓴 뒤 os.replace로 교체합니다.
+    """
+    atomic_write_json(index_path(data_dir), index.to_dict(), separators=(",", ":"))
+
+def load_index(data_dir=DATA_DIR):
+    """
+    저장된 색인을 읽습니다. 없거나 형식이 다르면 None을 돌려줍니다.
+    """
+    try:
+        with open(index_path(data_dir), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != INDEX_VERSION:
+        return None
+    return SearchIndex.from_dict(data)
+
+def update_search_index(data_dir=DATA_DIR, checksums=None):
+    """
+    저장된 색인을 불러와 바뀐 주차만 다시 색인하고 저장합니다. (스크래퍼/CLI용)
+    """
+    index = load_index(data_dir) or SearchIndex()
+    if index.sync(data_dir, checksums) or not os.path.exists(index_path(data_dir)):
+        save_index(index, data_dir)
+    return index
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    target_dir = sys.argv[1] if len(sys.argv) > 1 else DATA_DIR
+    result = update_search_index(target_dir)
+    print(f"검색 색인 갱신 완료: {index_path(target_dir)} (문서 {len(result.docs)}개, n-gram {len(result.postings)}개)")
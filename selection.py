@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+주목할만한 책 선정 엔진.
+
+관심 분야 키워드를 다중 패턴 매처로 한 번에 찾고,
+선정 순서는 교체 가능한 점수 함수로 정합니다.
+"""
+
+import os
+import re
+
+from book_record import to_json
+
+# 관심 카테고리 정의
+TARGET_CATEGORIES = [
+    "경제", "정치", "인문", "사회", "자기계발", "과학",
+    "경영", "비즈니스", "심리", "철학", "역사", "사회과학"
+]
+
+# 기본 점수 함수 이름 (SCORERS 참고)
+DEFAULT_SCORER = os.environ.get("ALADIN_SELECTION_SCORER", "description")
+
+class KeywordMatcher:
+    """
+    여러 키워드를 텍스트 한 번 순회로 모두 찾는 다중 패턴 매처입니다.
+
+    모든 키워드를 하나의 정규식 교대(긴 키워드 우선)로 컴파일해 C로 구현된
+    정규식 엔진이 텍스트를 한 번만 훑게 합니다. 매칭된 키워드 안에 들어 있는
+    짧은 키워드("사회과학" 안의 "사회", "과학")는 미리 계산한 부분 문자열 관계로
+    보충하므로 Aho-Corasick과 같이 겹치는 키워드를 모두 찾습니다.
+    """
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        normalized = [keyword.lower() for keyword in self.keywords]
+
+        # 키워드 → 번호 목록 (같은 키워드가 여러 번 정의될 수 있음)
+        self._indexes = {}
+        for index, keyword in enumerate(normalized):
+            self._indexes.setdefault(keyword, []).append(index)
+
+        # 키워드가 매칭되면 그 안에 포함된 다른 키워드도 함께 매칭된 것으로 처리
+        self._closure = {}
+        for keyword in self._indexes:
+            self._closure[keyword] = frozenset(
+                index
+                for other, indexes in self._indexes.items() if other in keyword
+                for index in indexes
+            )
+
+        alternatives = sorted(self._indexes, key=len, reverse=True)
+        if alternatives:
+            self._pattern = re.compile("|".join(re.escape(k) for k in alternatives))
+        else:
+            self._pattern = None
+
+    def contains_any(self, text):
+        """
+        text(소문자로 정규화된 문자열)에 키워드가 하나라도 있는지 확인합니다.
+        """
+        return self._pattern is not None and self._pattern.search(text) is not None
+
+    def find(self, text):
+        """
+        text(소문자로 정규화된 문자열)에 등장하는 키워드 번호의 집합을 돌려줍니다.
+        """
+        found = set()
+        if self._pattern is None:
+            return found
+        # 매칭 시작 위치 바로 다음부터 다시 찾아 일부가 겹치는 키워드도 놓치지 않습니다
+        position = 0
+        while True:
+            match = self._pattern.search(text, position)
+            if match is None:
+                return found
+            found |= self._closure[match.group()]
+            position = match.start() + 1
+
+class BookFeatures:
+    """
+    한 권의 책에 대해 한 번만 계산하는 정규화 텍스트와 키워드 매칭 결과입니다.
+    """
+    __slots__ = ("book", "title", "description", "publisher", "description_length", "score")
+
+    def __init__(self, book):
+        self.book = book
+        self.title = book.get("title", "").lower()
+        self.description = book.get("description", "").lower() + book.get("short_description", "").lower()
+        self.publisher = book.get("publisher", "").lower()
+        self.description_length = len(book.get("description", ""))
+        self.score = None
+
+    def is_target(self, matcher):
+        """
+        제목, 설명, 출판사 중 하나에 관심 분야 키워드가 있는지 확인합니다.
+        """
+        return (matcher.contains_any(self.title) or
+                matcher.contains_any(self.description) or
+                matcher.contains_any(self.publisher))
+
+    def content_matches(self, matcher):
+        """
+        제목과 설명에 등장하는 키워드 번호의 집합 (분야 태그용)
+        """
+        return matcher.find(self.title) | matcher.find(self.description)
+
+_DEFAULT_MATCHER = KeywordMatcher(TARGET_CATEGORIES)
+
+def score_description_richness(features):
+    """
+    소개 글이 길수록 높은 점수 (기존 선정 기준)
+    """
+    return features.description_length
+
+def score_recency(features):
+    """
+    최근에 수집된 책일수록 높은 점수 (동점이면 소개 글 길이)
+    """
+    return (features.book.get("scrape_date", ""), features.description_length)
+
+def score_category_path_weight(features):
+    """
+    분류 경로(category_paths)에 관심 분야가 많이 포함될수록 높은 점수 (동점이면 소개 글 길이)
+    """
+    weight = 0
+    for path in features.book.get("category_paths") or []:
+        if _DEFAULT_MATCHER.contains_any(path.lower()):
+            weight += 1
+    return (weight, features.description_length)
+
+SCORERS = {
+    "description": score_description_richness,
+    "recency": score_recency,
+    "category_path": score_category_path_weight,
+}
+
+def select_interesting_books(books, count=30, score=None, categories=None):
+    """
+    경제, 정치, 인문, 사회, 자기계발, 과학 분야의 책 중에서
+    가장 흥미로운 책 30권을 선정합니다.
+
+    score: 점수 함수(BookFeatures → 정렬 가능한 값) 또는 SCORERS의 이름
+    categories: 관심 카테고리 목록 (기본값: TARGET_CATEGORIES)
+    """
+    if score is None:
+        score = DEFAULT_SCORER
+    if isinstance(score, str):
+        score = SCORERS.get(score, score_description_richness)
+
+    if categories is None:
+        categories = TARGET_CATEGORIES
+        matcher = _DEFAULT_MATCHER
+    else:
+        matcher = KeywordMatcher(categories)
+
+    # 책마다 정규화와 키워드 매칭은 한 번만 수행
+    all_features = [BookFeatures(book) for book in books]
+    for features in all_features:
+        features.score = score(features)
+
+    def score_key(features):
+        return features.score
+
+    # 카테고리 키워드가 제목, 설명, 출판사에 포함된 책만 필터링
+    candidates = [features for features in all_features if features.is_target(matcher)]
+
+    # 필터링된 책이 count보다 적으면 나머지 책 중 점수가 높은 순으로 추가
+    if len(candidates) < count:
+        selected_ids = {id(features) for features in candidates}
+        remaining = [features for features in all_features if id(features) not in selected_ids]
+        remaining.sort(key=score_key, reverse=True)
+        candidates.extend(remaining[:count - len(candidates)])
+
+    # 점수 기준으로 정렬 후 상위 count개 선택
+    candidates.sort(key=score_key, reverse=True)
+    selected = candidates[:count]
+
+    # 선택된 책의 사본에 카테고리 정보 추가 (제목/설명 기준, 정의된 순서 유지)
+    # 입력 목록(캐시된 레코드일 수 있음)은 바꾸지 않음
+    selected_books = []
+    for features in selected:
+        book_categories = [categories[index] for index in sorted(features.content_matches(matcher))]
+        book = dict(to_json(features.book))
+        book["categories"] = book_categories if book_categories else ["기타"]
+        selected_books.append(book)
+
+    return selected_books
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vercel 배포용 정적 내보내기.
+
+주차 데이터는 새 데이터 파일을 커밋할 때만 바뀌므로, 페이지와 API 응답을 미리 만들어 정적 파일로
+배포하고 Flask(api/index.py)는 내보낸 파일이 없는 요청의 대체 경로로만 사용합니다.
+
+dist/index.html                           최신 주차 페이지 (/)
+dist/weeks/2026/01/index.html             주차별 페이지 (/weeks/2026/01/)
+dist/api/books.json, featured.json        최신 주차 API 응답 (/api/books, /api/featured)
+dist/api/weeks/2026/01/books.json         주차별 API 응답 (/api/weeks/2026/01/books.json)
+dist/static/css/style.css 등               static/ 복사본 (페이지가 Flask를 거치지 않고 읽도록)
+dist/export_state.json                    파일별 입력 해시 (증분 생성용)
+
+파일마다 입력(주차 데이터 체크섬, 주차 목록, 템플릿, 현재 주차)의 해시를 기록해 두고,
+입력이 바뀐 파일만 다시 만듭니다. dist/는 커밋하지 않고 Vercel 빌드 단계(vercel.json의
+buildCommand)에서 만듭니다. 압축은 Vercel이 응답할 때 하므로 미리 압축한 파일은 쓰지 않습니다.
+
+사용법:
+    python static_export.py [출력 디렉토리] [--force]
+"""
+
+import os
+import sys
+import json
+import hashlib
+import logging
+import datetime
+
+from atomic_io import atomic_write_bytes, atomic_write_json
+from manifest import load_manifest, build_manifest
+
+logger = logging.getLogger("aladin_export")
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_DIR = os.path.join(BASE_DIR, "dist")
+STATE_FILENAME = "export_state.json"
+STATE_VERSION = 2
+
+# 페이지 렌더링 결과에 영향을 주는 템플릿
+TEMPLATE_PATHS = [os.path.join(BASE_DIR, "templates", "index.html")]
+
+# 페이지가 읽는 CSS/JS (dist/static/으로 그대로 복사)
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+
+# 이전 버전이 본문 옆에 쓰던 미리 압축한 파일 (남아 있으면 지움)
+LEGACY_COMPRESSED_SUFFIXES = (".gz", ".br")
+
+def week_page_path(year, week):
+    return os.path.join("weeks", str(year), f"{week:02d}", "index.html")
+
+def week_api_path(year, week, kind):
+    return os.path.join("api", "weeks", str(year), f"{week:02d}", f"{kind}.json")
+
+def _hash(value):
+    canonical = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def _template_hash():
+    digest = hashlib.sha256()
+    for path in TEMPLATE_PATHS:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def _file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def static_files(static_dir=STATIC_DIR):
+    """
+    static/ 아래 파일의 (dist 기준 상대 경로, 원본 경로) 목록
+    """
+    files = []
+    for root, _, names in os.walk(static_dir):
+        for name in sorted(names):
+            path = os.path.join(root, name)
+            files.append((os.path.join("static", os.path.relpath(path, static_dir)), path))
+    return sorted(files)
+
+def load_state(output_dir):
+    try:
+        with open(os.path.join(output_dir, STATE_FILENAME), 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state.get("files", {}) if state.get("version") == STATE_VERSION else {}
+
+def plan_export(manifest, today=None):
+    """
+    내보낼 파일 목록: 상대 경로 → (입력 해시, (종류, 연도, 주차))
+    종류: "page", "books", "featured" (연도/주차가 None이면 최신 주차)
+    static/ 파일은 ("static", 원본 경로, None)으로 내용을 그대로 복사합니다.
+    """
+    today = today or datetime.date.today()
+    current = tuple(today.isocalendar()[:2])
+    template = _template_hash()
+
+    sources = {(entry["year"], entry["week"]): [entry.get("week_sha256"), entry.get("featured_sha256")]
+               for entry in manifest["weeks"]}
+    # 주차 선택기에 모든 주차가 나오므로 주차가 추가/삭제되면 모든 페이지가 바뀜
+    available = sorted(sources)
+
+    def page_key(year, week):
+        # 현재 주차 이후 주차의 비활성화 여부는 올해 이후 페이지에만 영향을 줌
+        return _hash(["page", template, available, sources[(year, week)],
+                      list(current) if year >= current[0] else None])
+
+    plan = {}
+    for year, week in available:
+        plan[week_page_path(year, week)] = (page_key(year, week), ("page", year, week))
+        for kind in ("books", "featured"):
+            plan[week_api_path(year, week, kind)] = (_hash([kind, sources[(year, week)]]), (kind, year, week))
+
+    latest = manifest.get("latest")
+    if latest and (latest["year"], latest["week"]) in sources:
+        year, week = latest["year"], latest["week"]
+        plan["index.html"] = (_hash(["latest", page_key(year, week), manifest.get("last_scrape")]), ("page", None, None))
+        for kind in ("books", "featured"):
+            plan[os.path.join("api", f"{kind}.json")] = (_hash(["latest", kind, sources[(year, week)]]), (kind, None, None))
+
+    for relpath, source in static_files():
+        plan[relpath] = (_hash(["static", _file_hash(source)]), ("static", source, None))
+    return plan
+
+def write_artifact(output_dir, relpath, body):
+    """
+    본문을 씁니다. 반환값: 쓴 파일의 상대 경로 목록
+    """
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    path = os.path.join(output_dir, relpath)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    atomic_write_bytes(path, body)
+    for suffix in LEGACY_COMPRESSED_SUFFIXES:
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    return [relpath]
+
+def render_artifact(web, flask_app, kind, year, week, today):
+    """
+    웹 앱 모듈(app.py)로 페이지(HTML 문자열)나 API 본문(JSON 바이트)을 만듭니다.
+    """
+    with flask_app.test_request_context('/'):
+        if kind == "page":
+            current_year, current_week, _ = today.isocalendar()
+            selected = (year, week) if year is not None else None
+            return web.render_index(selected, current_year, current_week)
+
+        if year is None:
+            books = web.get_latest_books() if kind == "books" else web.get_latest_interesting_books()
+        else:
+            all_books, featured_books = web.get_books_by_week(year, week)
+            books = all_books if kind == "books" else featured_books
+        # Flask API(jsonify)와 같은 바이트로 직렬화
+        return web.jsonify(books).get_data()
+
+def export_site(output_dir=OUTPUT_DIR, force=False, today=None):
+    """
+    입력이 바뀐 파일만 다시 만들고, 더 이상 없는 주차의 파일은 지웁니다.
+    반환값: {"written": 다시 만든 파일 수, "skipped": 그대로 둔 파일 수, "removed": 지운 파일 수}
+    """
+    import app as web
+
+    flask_app = web.create_app()
+    today = today or datetime.date.today()
+    manifest = load_manifest(web.DATA_DIR) or build_manifest(web.DATA_DIR)
+    plan = plan_export(manifest, today)
+    previous = {} if force else load_state(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+
+    files = {}
+    stats = {"written": 0, "skipped": 0, "removed": 0}
+    for relpath, (key, spec) in sorted(plan.items()):
+        entry = previous.get(relpath)
+        if entry and entry["key"] == key and all(os.path.exists(os.path.join(output_dir, f)) for f in entry["files"]):
+            files[relpath] = entry
+            stats["skipped"] += 1
+            continue
+        if spec[0] == "static":
+            with open(spec[1], 'rb') as f:
+                body = f.read()
+        else:
+            body = render_artifact(web, flask_app, *spec, today)
+        files[relpath] = {"key": key, "files": write_artifact(output_dir, relpath, body)}
+        stats["written"] += 1
+        logger.info(f"내보내기: {relpath}")
+
+    for relpath, entry in previous.items():
+        if relpath in files:
+            continue
+        for name in entry["files"]:
+            path = os.path.join(output_dir, name)
+            if os.path.exists(path):
+                os.remove(path)
+                stats["removed"] += 1
+        logger.info(f"삭제: {relpath}")
+
+    # 바뀐 파일이 없으면 상태 파일도 그대로 둠 (커밋에 불필요한 변경이 생기지 않도록)
+    if files == previous and os.path.exists(os.path.join(output_dir, STATE_FILENAME)):
+        return stats
+    atomic_write_json(os.path.join(output_dir, STATE_FILENAME), {
+        "version": STATE_VERSION,
+        "generated_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "manifest_generation": manifest.get("generation"),
+        "files": files
+    })
+    return stats
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    target_dir = args[0] if args else OUTPUT_DIR
+    result = export_site(target_dir, force="--force" in sys.argv)
+    print(f"정적 내보내기 완료: {target_dir} (생성 {result['written']}개, 유지 {result['skipped']}개, 삭제 {result['removed']}개)")
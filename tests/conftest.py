@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+
+# 저장소 루트의 평면 모듈(app.py, scraper.py 등)을 import할 수 있도록
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+
+import pytest
+
+@pytest.fixture
+def write_week(tmp_path):
+    """
+    tmp_path에 주차 파일(week/interesting_week)을 쓰는 함수
+    """
+    def write(year, week, books, featured=None):
+        with open(tmp_path / f"week_{year}_W{week:02d}.json", 'w', encoding='utf-8') as f:
+            json.dump(books, f, ensure_ascii=False)
+        if featured is not None:
+            with open(tmp_path / f"interesting_week_{year}_W{week:02d}.json", 'w', encoding='utf-8') as f:
+                json.dump(featured, f, ensure_ascii=False)
+    return write
+
+@pytest.fixture
+def web(tmp_path, monkeypatch):
+    """
+    tmp_path를 data 디렉토리로 쓰는 웹 앱 모듈. 캐시는 테스트마다 새로 만들고 app.log는 쓰지 않습니다.
+    """
+    import app as web_module
+    monkeypatch.setattr(web_module, "APP_LOG_FILE", "")
+    monkeypatch.setattr(web_module, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(web_module, "data_cache", web_module.JsonFileCache(max_entries=8))
+    monkeypatch.setattr(web_module, "response_cache", web_module.ResponseBodyCache(max_entries=8))
+    monkeypatch.setattr(web_module, "week_indexes", web_module.WeekIndexCache(max_entries=4))
+    monkeypatch.setattr(web_module, "week_archives", web_module.WeekArchiveCache(max_entries=4))
+    monkeypatch.setattr(web_module, "_manifest_view", None)
+    monkeypatch.setattr(web_module, "_search_index", None)
+    monkeypatch.setattr(web_module, "get_book_store", lambda: None)
+    return web_module
+
+@pytest.fixture
+def client(web):
+    return web.create_app().test_client()
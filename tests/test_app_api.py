@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+def make_book(item_id, title):
+    return {
+        "title": title,
+        "publisher": "출판사",
+        "price": "15,000원",
+        "book_url": f"https://www.aladin.co.kr/shop/wproduct.aspx?ItemId={item_id}",
+        "category_paths": ["국내도서>인문학"],
+    }
+
+@pytest.fixture
+def fixture_week(write_week):
+    books = [make_book("100", "첫 번째 책"), make_book("101", "두 번째 책"), make_book("102", "세 번째 책")]
+    write_week(2026, 1, books, featured=books[:1])
+    return books
+
+def test_query_books_returns_404_for_missing_week(client, fixture_week):
+    response = client.get('/api/v1/books?year=2025&week=10')
+
+    assert response.status_code == 404
+    assert client.get('/api/weeks/2025/10/books.json').status_code == 404
+
+def test_query_books_returns_existing_week(client, fixture_week):
+    response = client.get('/api/v1/books?year=2026&week=1&limit=2&fields=title')
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert (body["year"], body["week"], body["total"]) == (2026, 1, 3)
+    assert body["items"] == [{"title": "첫 번째 책"}, {"title": "두 번째 책"}]
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+import threading
+
+import app as web
+
+class FakeScraper:
+    class ScrapeCancelled(Exception):
+        pass
+
+def test_concurrent_first_callers_share_one_queue(monkeypatch):
+    monkeypatch.setattr(web, "_scrape_jobs", None)
+    created = []
+
+    class RecordingQueue:
+        def __init__(self, run, cancelled):
+            created.append(self)
+
+    monkeypatch.setattr(web, "ScrapeJobQueue", RecordingQueue)
+    barrier = threading.Barrier(8)
+    results = []
+
+    def first_refresh():
+        barrier.wait()
+        results.append(web.get_scrape_jobs(FakeScraper))
+
+    threads = [threading.Thread(target=first_refresh) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(queue is created[0] for queue in results)
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+import time
+import threading
+
+from atomic_io import data_dir_lock, file_lock
+
+def test_same_path_shares_one_lock(tmp_path):
+    assert data_dir_lock(str(tmp_path)) is data_dir_lock(str(tmp_path))
+    assert file_lock(str(tmp_path / "a.lock")) is not file_lock(str(tmp_path / "b.lock"))
+
+def test_threads_in_one_process_are_serialized(tmp_path):
+    inside = []
+    overlaps = []
+
+    def write():
+        with data_dir_lock(str(tmp_path)):
+            inside.append(1)
+            if len(inside) > 1:
+                overlaps.append(len(inside))
+            time.sleep(0.02)
+            inside.pop()
+
+    threads = [threading.Thread(target=write) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert overlaps == []
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import csv
+import io
+import json
+
+import pytest
+
+from book_export import csv_lines, export_lines, iter_export_rows, parse_week_spec
+from book_query import BookQuery
+from book_registry import BookRegistry, save_registry
+
+def make_book(item_id, publisher="민음사", price="15,000원", paths=("국내도서>인문학>철학",)):
+    return {
+        "title": f"책 {item_id}",
+        "publisher": publisher,
+        "price": price,
+        "book_url": f"https://www.aladin.co.kr/shop/wproduct.aspx?ItemId={item_id}",
+        "category_paths": list(paths),
+    }
+
+@pytest.fixture
+def export_dir(tmp_path, write_week):
+    """
+    2026-W01(책 목록 형식), 2026-W02(레지스트리 참조 형식), 2026-W03
+    """
+    write_week(2026, 1, [make_book("100"), make_book("101", publisher="창비")], [])
+
+    registry = BookRegistry()
+    week_data = registry.week_file_data(2026, 2, [make_book("200", price="9,000원"), make_book("201")])
+    save_registry(registry, str(tmp_path))
+    write_week(2026, 2, week_data, [])
+
+    write_week(2026, 3, [make_book("300", paths=("국내도서>경제경영>재테크",))], [])
+    return str(tmp_path)
+
+@pytest.mark.parametrize("value, expected", [
+    ("2026-W01", (2026, 1)),
+    ("2026W1", (2026, 1)),
+    ("2026-12", (2026, 12)),
+    (" 2026-w53 ", (2026, 53)),
+    ("", None),
+    (None, None),
+])
+def test_parse_week_spec(value, expected):
+    assert parse_week_spec(value) == expected
+
+@pytest.mark.parametrize("value", ["2026-W00", "2026-W54", "26-W01", "2026/01"])
+def test_parse_week_spec_rejects_invalid_weeks(value):
+    with pytest.raises(ValueError):
+        parse_week_spec(value)
+
+def test_rows_cover_inclusive_week_range_and_resolve_refs(export_dir):
+    rows = list(iter_export_rows(BookQuery(), (2026, 2), (2026, 3), export_dir))
+
+    assert [(row["year"], row["week"], row["title"]) for row in rows] == [
+        (2026, 2, "책 200"), (2026, 2, "책 201"), (2026, 3, "책 300")]
+    assert rows[0]["price"] == "9,000원"
+
+def test_rows_without_bounds_cover_every_week(export_dir):
+    rows = list(iter_export_rows(BookQuery(fields=["title"]), data_dir=export_dir))
+
+    assert [row["title"] for row in rows] == ["책 100", "책 101", "책 200", "책 201", "책 300"]
+    assert list(rows[0]) == ["year", "week", "title"]
+
+def test_rows_apply_filters_and_projection(export_dir):
+    query = BookQuery(category="인문학", publisher=" 민음사 ", max_price=10000, fields=["price", "title"])
+
+    rows = list(iter_export_rows(query, data_dir=export_dir))
+
+    assert rows == [{"year": 2026, "week": 2, "price": "9,000원", "title": "책 200"}]
+
+def test_csv_has_header_and_column_order(export_dir):
+    rows = iter_export_rows(BookQuery(fields=["title", "category_paths"]), (2026, 3), None, export_dir)
+
+    lines = list(csv_lines(rows, ["title", "category_paths"]))
+
+    assert lines[0] == "year,week,title,category_paths\r\n"
+    parsed = list(csv.reader(io.StringIO("".join(lines))))
+    assert parsed[1][:3] == ["2026", "3", "책 300"]
+    assert json.loads(parsed[1][3]) == ["국내도서>경제경영>재테크"]
+
+def test_csv_without_fields_uses_every_field():
+    header = next(csv_lines(iter([])))
+
+    assert header.startswith("year,week,title,author,publisher,price,")
+
+def test_export_lines_rejects_unknown_format(export_dir):
+    with pytest.raises(ValueError):
+        export_lines("xml", BookQuery(), data_dir=export_dir)
+
+def test_export_routes_stream_ndjson_and_csv(client, export_dir):
+    response = client.get('/api/export.ndjson?from=2026-W02&to=2026-W02&fields=title')
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert [json.loads(line) for line in response.get_data(as_text=True).splitlines()] == [
+        {"year": 2026, "week": 2, "title": "책 200"}, {"year": 2026, "week": 2, "title": "책 201"}]
+
+    response = client.get('/api/export.csv?from=2026-W03&fields=title,price')
+    assert response.mimetype == "text/csv"
+    assert 'filename="aladin_books.csv"' in response.headers["Content-Disposition"]
+    assert response.get_data(as_text=True) == 'year,week,title,price\r\n2026,3,책 300,"15,000원"\r\n'
+
+def test_export_routes_reject_bad_requests(client, export_dir):
+    assert client.get('/api/export.xml').status_code == 404
+    assert client.get('/api/export.ndjson?from=2026-W60').status_code == 400
+    assert client.get('/api/export.csv?min_price=abc').status_code == 400
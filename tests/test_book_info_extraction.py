@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+
+import pytest
+
+from scraper import extract_book_info_batch, extract_book_info_from_text
+
+# 목록/상세 픽스처(benchmarks/fixtures)의 책 정보 텍스트와 대체 형식 텍스트.
+# expected는 패턴을 미리 컴파일하기 전의 필드별 re.search 구현으로 만든 값입니다.
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "book_info_texts.json")
+
+with open(FIXTURE_PATH, 'r', encoding='utf-8') as f:
+    CASES = json.load(f)
+
+def test_batch_matches_expected_results():
+    results = extract_book_info_batch([case["text"] for case in CASES])
+
+    assert results == [case["expected"] for case in CASES]
+
+@pytest.mark.parametrize("case", CASES, ids=lambda case: case["text"][:20] or "empty")
+def test_single_text_matches_expected_result(case):
+    assert extract_book_info_from_text(case["text"]) == case["expected"]
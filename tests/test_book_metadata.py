@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+import json
+
+from book_metadata import backfill_data_dir
+from book_registry import BookRegistry, load_registry, read_week_file, save_registry
+
+BLOB = "기본정보기본정보208쪽188*254mm395gISBN : 9791191923063주제 분류신간알림 신청국내도서>요리/살림>생활요리접기"
+
+def make_book(item_id, description=BLOB):
+    return {
+        "title": f"책 {item_id}",
+        "book_url": f"https://www.aladin.co.kr/shop/wproduct.aspx?ItemId={item_id}",
+        "description": description,
+        "pages": "페이지 정보 없음",
+        "isbn": "ISBN 정보 없음",
+        "category_info": "분류 정보 없음",
+    }
+
+def test_backfill_enriches_refs_format_weeks(tmp_path):
+    registry = BookRegistry()
+    week_data = registry.week_file_data(2026, 1, [make_book("100"), {"title": "식별자 없는 책", "description": BLOB}])
+    save_registry(registry, str(tmp_path))
+    week_path = tmp_path / "week_2026_W01.json"
+    week_path.write_text(json.dumps(week_data, ensure_ascii=False), encoding="utf-8")
+    old_revision = week_data["refs"][0][1]
+
+    assert backfill_data_dir(str(tmp_path)) == 2
+
+    books = read_week_file(str(week_path))
+    for book in books:
+        assert book["category_paths"] == ["국내도서>요리/살림>생활요리"]
+        assert (book["isbn13"], book["page_count"], book["weight_g"]) == ("9791191923063", 208, 395)
+        assert book["category_info"] == "국내도서>요리/살림>생활요리"
+
+    saved = load_registry(str(tmp_path))
+    assert old_revision not in saved.records
+    assert saved.find({"isbn": "9791191923063"}) == "item:100"
+    assert list(saved.weeks["2026-W01"]) == [json.loads(week_path.read_text(encoding="utf-8"))["refs"][0][1]]
+
+    # 이미 채워진 데이터는 다시 쓰지 않음
+    assert backfill_data_dir(str(tmp_path)) == 0
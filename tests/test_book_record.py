@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from book_record import BookRecord, records_from_json
+from selection import select_interesting_books
+
+def make_book(item_id, title):
+    return {
+        "title": title,
+        "author": "저자 정보 없음",
+        "publisher": "출판사",
+        "book_url": f"https://www.aladin.co.kr/shop/wproduct.aspx?ItemId={item_id}",
+        "description": f"{title} 소개",
+        "category_paths": ["국내도서>경제경영>투자"],
+    }
+
+def test_records_round_trip_and_share_tuples_within_one_load():
+    books = [make_book("100", "경제 입문"), make_book("101", "투자 교과서")]
+
+    records = records_from_json(books)
+
+    assert [record.to_dict() for record in records] == books
+    assert records[0].keys() is records[1].keys()
+    assert records[0].category_paths is records[1].category_paths
+
+def test_records_are_read_only():
+    record = BookRecord.from_dict(make_book("100", "경제 입문"))
+
+    with pytest.raises(TypeError):
+        record["categories"] = ["경제"]
+
+def test_selection_does_not_modify_cached_records():
+    records = records_from_json([make_book("100", "경제 입문"), make_book("101", "요리 교과서")])
+
+    selected = select_interesting_books(records, 2)
+
+    assert all("categories" not in record for record in records)
+    assert {book["title"]: book["categories"] for book in selected} == {"경제 입문": ["경제"], "요리 교과서": ["기타"]}
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import json
+
+from book_registry import BookRegistry, read_week_file, save_registry, load_registry
+
+def make_book(item_id, isbn="ISBN 정보 없음", scrape_date="2026-01-02 05:39:42", description="소개"):
+    return {
+        "title": f"책 {item_id}",
+        "book_url": f"https://www.aladin.co.kr/shop/wproduct.aspx?ItemId={item_id}",
+        "isbn": isbn,
+        "description": description,
+        "scrape_date": scrape_date,
+    }
+
+def test_round_trip_keeps_all_identity_keys():
+    registry = BookRegistry()
+    registry.merge(make_book("100", isbn="9791191923063"), 2026, 1)
+    # 같은 ISBN이 다른 ItemId로 다시 나오면 그 ItemId도 같은 정규 ID로 연결
+    canonical_id, _ = registry.merge(make_book("200", isbn="9791191923063"), 2026, 2)
+
+    restored = BookRegistry.from_dict(json.loads(json.dumps(registry.to_dict())))
+
+    assert restored.keys == registry.keys
+    assert restored.find(make_book("200")) == canonical_id
+    assert restored.find(make_book("100")) == canonical_id
+
+def test_week_refs_resolve_through_registry(tmp_path):
+    books = [make_book("100"), make_book("101"), {"title": "식별자 없는 책"}]
+    registry = BookRegistry()
+    week_data = registry.week_file_data(2026, 1, books)
+    save_registry(registry, str(tmp_path))
+    path = tmp_path / "week_2026_W01.json"
+    path.write_text(json.dumps(week_data, ensure_ascii=False), encoding="utf-8")
+
+    assert read_week_file(str(path)) == books
+    assert all("description" not in json.dumps(ref) for ref in week_data["refs"][:2])
+
+def test_refetch_prunes_replaced_revisions(tmp_path):
+    registry = BookRegistry()
+    registry.week_file_data(2026, 1, [make_book("100", scrape_date="2026-01-01 00:00:00")])
+    registry.prune_records()
+    for day in range(2, 6):
+        previous = registry.week_revisions(2026, 1)
+        registry.week_file_data(2026, 1, [make_book("100", scrape_date=f"2026-01-0{day} 00:00:00")])
+        registry.prune_records(keep=previous)
+
+    # 현재 주차 파일의 revision과 교체 직전 파일의 revision만 남음
+    assert len(registry.records) == 2
+    save_registry(registry, str(tmp_path))
+    reloaded = load_registry(str(tmp_path))
+    assert reloaded.week_revisions(2026, 1) == registry.week_revisions(2026, 1)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+import threading
+
+import pytest
+import requests
+
+from crawl_frontier import CrawlFrontier, page_url, listing_key, parse_list_urls
+
+LIST_A = "https://www.aladin.co.kr/shop/book/wletslookNewBook.aspx?CID=1"
+LIST_B = "https://www.aladin.co.kr/shop/book/wletslookNewBook.aspx?CID=2"
+
+def book(item_id, title=None):
+    return {"book_url": "https://www.aladin.co.kr/shop/wproduct.aspx?ItemId=%s" % item_id,
+            "title": title or "책 %s" % item_id}
+
+class FakeSite:
+    """
+    URL별로 미리 정한 목록 항목(또는 예외)을 돌려주는 가짜 사이트. 파서는 받은 값을 그대로 돌려줍니다.
+    정하지 않은 URL은 빈 페이지입니다.
+    """
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+        self.lock = threading.Lock()
+
+    def fetch(self, url):
+        with self.lock:
+            self.requested.append(url)
+        result = self.pages.get(url, [])
+        if isinstance(result, requests.RequestException):
+            raise result
+        return result
+
+    @staticmethod
+    def parse(result):
+        if isinstance(result, BaseException):
+            raise result
+        return list(result)
+
+def make_frontier(site, list_urls, max_pages=5):
+    return CrawlFrontier(list_urls, fetch=site.fetch, parse=site.parse, max_pages=max_pages, max_workers=2)
+
+def item_ids(listed_books):
+    return [listing_key(listed)[1] for listed in listed_books]
+
+def test_page_url_keeps_first_page_and_replaces_page_param():
+    assert page_url(LIST_A, 1) == LIST_A
+    assert page_url(LIST_A, 3) == LIST_A + "&page=3"
+    assert page_url(LIST_A + "&page=2", 4) == LIST_A + "&page=4"
+
+def test_parse_list_urls_splits_on_commas_and_spaces():
+    assert parse_list_urls("%s, %s  " % (LIST_A, LIST_B)) == [LIST_A, LIST_B]
+
+def test_listing_key_falls_back_to_url_then_title():
+    assert listing_key(book("100")) == ("item", "100")
+    assert listing_key({"book_url": "https://example.com/x", "title": "t"}) == ("url", "https://example.com/x")
+    assert listing_key({"title": "t"}) == ("title", "t")
+
+def test_stops_on_empty_page():
+    site = FakeSite({LIST_A: [book("1"), book("2")], page_url(LIST_A, 2): [book("3")]})
+    assert item_ids(make_frontier(site, [LIST_A]).crawl()) == ["1", "2", "3"]
+    assert site.requested == [LIST_A, page_url(LIST_A, 2), page_url(LIST_A, 3)]
+
+def test_stops_when_page_repeats_last_page():
+    # 마지막 페이지를 넘어선 요청에 마지막 페이지를 다시 주는 경우
+    site = FakeSite({LIST_A: [book("1")], page_url(LIST_A, 2): [book("2")], page_url(LIST_A, 3): [book("2")]})
+    assert item_ids(make_frontier(site, [LIST_A]).crawl()) == ["1", "2"]
+    assert len(site.requested) == 3
+
+def test_stops_at_max_pages():
+    site = FakeSite({page_url(LIST_A, page): [book(str(page))] for page in range(1, 10)})
+    assert item_ids(make_frontier(site, [LIST_A], max_pages=2).crawl()) == ["1", "2"]
+    assert len(site.requested) == 2
+
+def test_dedups_item_ids_across_listings_in_listing_order():
+    site = FakeSite({
+        LIST_A: [book("1"), book("2")],
+        LIST_B: [book("2", "다른 제목"), book("3")],
+        page_url(LIST_B, 2): [book("1"), book("4")],
+    })
+    listed_books = make_frontier(site, [LIST_A, LIST_B]).crawl()
+    assert item_ids(listed_books) == ["1", "2", "3", "4"]
+    assert listed_books[1]["title"] == "책 2"
+
+def test_parse_failure_keeps_other_listings():
+    site = FakeSite({
+        LIST_A: [book("1")],
+        page_url(LIST_A, 2): ValueError("목록 구조가 바뀜"),
+        LIST_B: [book("2")],
+    })
+    assert item_ids(make_frontier(site, [LIST_A, LIST_B]).crawl()) == ["1", "2"]
+    # 실패한 목록은 다음 페이지를 요청하지 않음
+    assert page_url(LIST_A, 3) not in site.requested
+
+def test_fetch_failure_keeps_other_listings():
+    site = FakeSite({LIST_A: requests.ConnectionError("연결 끊김"), LIST_B: [book("2")]})
+    assert item_ids(make_frontier(site, [LIST_A, LIST_B]).crawl()) == ["2"]
+
+def test_raises_first_error_when_every_page_fails():
+    site = FakeSite({LIST_A: requests.ConnectionError("연결 끊김"), LIST_B: ValueError("파싱 실패")})
+    with pytest.raises(requests.ConnectionError):
+        make_frontier(site, [LIST_A, LIST_B]).crawl()
+
+def test_cancel_event_stops_before_requesting():
+    site = FakeSite({LIST_A: [book("1")]})
+    cancel_event = threading.Event()
+    cancel_event.set()
+    assert make_frontier(site, [LIST_A]).crawl(cancel_event=cancel_event) == []
+    assert site.requested == []
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+import pytest
+import requests
+
+from http_client import HttpClient, AdaptiveRateLimiter, CircuitBreaker, CircuitOpenError
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+
+class FakeSession:
+    """
+    미리 정한 결과(예외 또는 응답)를 차례로 돌려주는 세션
+    """
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = 0
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls += 1
+        result = self.results.pop(0)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    def close(self):
+        pass
+
+def make_client(results):
+    client = HttpClient(
+        max_retries=0,
+        limiter_factory=lambda: AdaptiveRateLimiter(rate=1e9, min_rate=1e9, max_rate=1e9, burst=1e9),
+        breaker_factory=lambda: CircuitBreaker(failure_threshold=1, reset_seconds=0))
+    client.session = FakeSession(results)
+    return client
+
+@pytest.mark.parametrize("error", [
+    requests.TooManyRedirects("redirects"),
+    requests.exceptions.ContentDecodingError("decoding"),
+    requests.exceptions.InvalidURL("invalid"),
+    requests.exceptions.ChunkedEncodingError("chunked"),
+])
+def test_non_timeout_error_during_trial_does_not_wedge_breaker(error):
+    url = "http://example.test/item"
+    client = make_client([requests.ConnectionError("down"), error, FakeResponse()])
+    _, breaker = client.host_policy(url)
+
+    with pytest.raises(requests.ConnectionError):
+        client.request(url)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # reset_seconds=0이므로 다음 요청이 half-open 시험 요청이 됨
+    with pytest.raises(type(error)):
+        client.request(url)
+    assert not breaker._trial_in_flight
+
+    assert client.request(url).status_code == 200
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_unrelated_exception_releases_trial():
+    url = "http://example.test/item"
+    client = make_client([requests.ConnectionError("down"), KeyboardInterrupt(), FakeResponse()])
+    _, breaker = client.host_policy(url)
+
+    with pytest.raises(requests.ConnectionError):
+        client.request(url)
+    with pytest.raises(KeyboardInterrupt):
+        client.request(url)
+
+    assert client.request(url).status_code == 200
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_open_breaker_rejects_without_request():
+    client = make_client([requests.ConnectionError("down")])
+    _, breaker = client.host_policy("http://example.test/")
+    breaker.reset_seconds = 60
+
+    with pytest.raises(requests.ConnectionError):
+        client.request("http://example.test/")
+    with pytest.raises(CircuitOpenError):
+        client.request("http://example.test/")
+    assert client.session.calls == 1
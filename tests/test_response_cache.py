@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+from response_cache import ResponseBodyCache
+
+def test_body_is_built_once_per_version():
+    cache = ResponseBodyCache(max_entries=2)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return b'{"ok": true}', "application/json"
+
+    first = cache.get_or_build("books", 1, build)
+    second = cache.get_or_build("books", 1, build)
+    cache.get_or_build("books", 2, build)
+
+    assert first is second
+    assert len(builds) == 2
+    assert cache.stats() == {"hits": 1, "misses": 2, "entries": 1}
+
+def test_none_body_is_returned_without_caching():
+    cache = ResponseBodyCache(max_entries=2)
+
+    assert cache.get_or_build("missing", 1, lambda: (None, "text/html")) is None
+    assert cache.stats()["entries"] == 0
+    cached = cache.get_or_build("missing", 1, lambda: ("<p>ok</p>", "text/html"))
+    assert cached.bodies["identity"] == "<p>ok</p>".encode('utf-8')
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+from search_index import SearchIndex
+
+def make_book(item_id, title, paths):
+    return {
+        "title": title,
+        "author": "저자",
+        "publisher": "출판사",
+        "book_url": f"https://www.aladin.co.kr/shop/wproduct.aspx?ItemId={item_id}",
+        "category_paths": paths,
+    }
+
+def test_search_returns_category_paths_as_list():
+    index = SearchIndex()
+    paths = ["국내도서>경제경영>투자", "국내도서>경제경영>재테크"]
+    index.add_week(2026, 1, [make_book("100", "주식 투자 입문", paths)])
+
+    item = index.search("재테크")["items"][0]
+
+    assert item["categories"] == paths
+    assert item["weeks"] == [[2026, 1]]
+
+def test_copy_is_updated_without_touching_original():
+    index = SearchIndex()
+    index.add_week(2026, 1, [make_book("100", "주식 투자 입문", [])])
+    postings_before = {gram: set(doc_ids) for gram, doc_ids in index.postings.items()}
+
+    updated = index.copy()
+    updated.add_week(2026, 2, [make_book("100", "주식 투자 입문", []), make_book("200", "요리 교과서", [])])
+    updated.remove_week(2026, 1)
+
+    assert index.postings == postings_before
+    assert index.search("주식")["items"][0]["weeks"] == [[2026, 1]]
+    assert index.search("요리")["total"] == 0
+    assert updated.search("주식")["items"][0]["weeks"] == [[2026, 2]]
+    assert updated.search("요리")["total"] == 1
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import datetime
+
+from static_export import STATIC_DIR, export_site
+
+def test_export_copies_static_files_and_tracks_them(web, write_week, tmp_path):
+    book = {"title": "책", "book_url": "https://www.aladin.co.kr/shop/wproduct.aspx?ItemId=100"}
+    write_week(2026, 1, [book], [book])
+    output_dir = tmp_path / "dist"
+    today = datetime.date(2026, 1, 2)
+
+    first = export_site(str(output_dir), today=today)
+    second = export_site(str(output_dir), today=today)
+
+    assert (output_dir / "static" / "css" / "style.css").read_bytes() == open(os.path.join(STATIC_DIR, "css", "style.css"), 'rb').read()
+    assert (output_dir / "static" / "js" / "script.js").exists()
+    assert '/static/css/style.css' in (output_dir / "index.html").read_text(encoding='utf-8')
+    with open(output_dir / "export_state.json", 'r', encoding='utf-8') as f:
+        files = json.load(f)["files"]
+    assert {"static/css/style.css", "static/js/script.js"} <= set(files)
+    assert not list(output_dir.rglob("*.gz"))
+    assert (first["written"], second["written"], second["skipped"]) == (8, 0, 8)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import datetime
+
+from week_archive import (BLOCK_SIZE, WeekArchive, archive_closed_weeks, archive_paths, load_week,
+                          write_archive)
+
+def make_book(item_id, title=None):
+    return {
+        "title": title or f"책 {item_id}",
+        "author": "저자",
+        "book_url": f"https://www.aladin.co.kr/shop/wproduct.aspx?ItemId={item_id}",
+        "description": f"책 {item_id}의 긴 소개 글",
+        "scrape_date": "2026-01-02 05:39:42",
+    }
+
+def test_round_trip_reads_single_books_across_blocks(tmp_path):
+    books = [make_book(str(100 + number)) for number in range(BLOCK_SIZE * 2 + 3)]
+    # 같은 내용의 책은 레코드 하나로 저장
+    books.append(dict(books[0]))
+
+    write_archive(str(tmp_path), 2026, 1, books, [])
+    archive = WeekArchive(str(tmp_path), 2026, 1)
+
+    assert len(archive) == len(books)
+    assert archive.books() == books
+    assert archive.get(BLOCK_SIZE + 1) == books[BLOCK_SIZE + 1]
+    assert archive.page(BLOCK_SIZE - 1, BLOCK_SIZE + 2) == books[BLOCK_SIZE - 1:BLOCK_SIZE + 2]
+    assert archive.positions[-1] == archive.positions[0]
+    assert not any(name.endswith(".tmp") for name in os.listdir(os.path.dirname(archive.data_path)))
+
+def test_featured_books_reference_week_records_with_extra_fields(tmp_path):
+    books = [make_book("100"), make_book("101")]
+    selected = {**books[1], "categories": ["경제"]}
+    # week 목록에 없는 책은 레코드를 따로 저장
+    outside = make_book("300")
+
+    write_archive(str(tmp_path), 2026, 1, books, [selected, outside])
+    archive = WeekArchive(str(tmp_path), 2026, 1)
+
+    assert archive.featured() == [selected, outside]
+    assert archive.featured_refs[0] == {"ref": 1, "extra": {"categories": ["경제"]}}
+    assert archive.featured_refs[1] == {"ref": 2, "extra": {}}
+    with open(archive_paths(str(tmp_path), 2026, 1)[1], 'r', encoding='utf-8') as f:
+        assert json.load(f)["record_count"] == 3
+
+def test_load_week_falls_back_to_archive(tmp_path, write_week):
+    books = [make_book("100"), make_book("101")]
+    featured = [{**books[0], "categories": ["인문"]}]
+    write_week(2026, 1, books, featured)
+    write_week(2026, 2, [make_book("200")], [])
+
+    archived = archive_closed_weeks(str(tmp_path), today=datetime.date(2026, 1, 5))
+
+    assert archived == [(2026, 1)]
+    assert not (tmp_path / "week_2026_W01.json").exists()
+    assert (tmp_path / "week_2026_W02.json").exists()
+    assert load_week(str(tmp_path), 2026, 1) == (books, featured)
+    with open(tmp_path / "manifest.json", 'r', encoding='utf-8') as f:
+        assert sorted((entry["year"], entry["week"]) for entry in json.load(f)["weeks"]) == [(2026, 1), (2026, 2)]
+    assert (tmp_path / "search_index.json").exists()
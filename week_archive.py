@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+지난 주차를 위한 압축 아카이브 형식.
+
+data/archive/week_2026_W01.ndjson.z  레코드 블록 파일: 책 레코드를 한 줄에 하나씩(NDJSON) 쓰되
+                                     BLOCK_SIZE개 줄마다 zlib으로 따로 압축해 이어 붙입니다
+data/archive/week_2026_W01.idx.json  오프셋 색인: 블록별 (오프셋, 길이), 목록 위치 → 레코드 번호,
+                                     주목할만한 책 → 레코드 번호 참조 (+ 선정 때 붙은 분야 태그)
+
+같은 내용의 레코드는 한 번만 저장하고, interesting_week 파일의 책은 week 파일의 레코드를
+참조하므로 설명 글이 두 번 저장되지 않습니다. 한 권이나 한 페이지를 읽을 때는 필요한 블록만
+압축을 풉니다.
+
+사용법 (현재 주차를 제외한 지난 주차를 아카이브로 옮기기):
+    python week_archive.py [데이터 디렉토리] [--keep-json]
+"""
+
+import os
+import re
+import sys
+import json
+import zlib
+import logging
+import datetime
+import threading
+from collections import OrderedDict
+
+from atomic_io import atomic_write_bytes, atomic_write_json, data_dir_lock
+from book_registry import read_week_file, load_registry, save_registry
+
+logger = logging.getLogger("aladin_archive")
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+ARCHIVE_DIRNAME = "archive"
+ARCHIVE_VERSION = 1
+
+# 블록당 레코드 수 (작을수록 한 권 읽기가 싸고, 클수록 압축률이 좋음)
+BLOCK_SIZE = 8
+COMPRESS_LEVEL = 9
+
+# 압축을 푼 블록을 아카이브마다 몇 개까지 메모리에 둘지
+BLOCK_CACHE_SIZE = 4
+
+WEEK_FILE_PATTERN = re.compile(r'^week_(\d{4})_W(\d{2})\.json$')
+ARCHIVE_INDEX_PATTERN = re.compile(r'^week_(\d{4})_W(\d{2})\.idx\.json$')
+
+def archive_dir(data_dir=DATA_DIR):
+    return os.path.join(data_dir, ARCHIVE_DIRNAME)
+
+def archive_paths(data_dir, year, week):
+    """
+    주차 아카이브의 (레코드 블록 파일, 오프셋 색인 파일) 경로
+    """
+    base = os.path.join(archive_dir(data_dir), f"week_{year}_W{week:02d}")
+    return f"{base}.ndjson.z", f"{base}.idx.json"
+
+def is_archived(data_dir, year, week):
+    return os.path.exists(archive_paths(data_dir, year, week)[1])
+
+def list_archived_weeks(data_dir=DATA_DIR):
+    """
+    아카이브된 (연도, 주차) 목록
+    """
+    directory = archive_dir(data_dir)
+    if not os.path.isdir(directory):
+        return []
+    weeks = []
+    for name in os.listdir(directory):
+        match = ARCHIVE_INDEX_PATTERN.match(name)
+        if match:
+            weeks.append((int(match.group(1)), int(match.group(2))))
+    return sorted(weeks)
+
+def _canonical(record):
+    return json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+def _book_key(book):
+    return book.get("book_url") or book.get("title")
+
+def write_archive(data_dir, year, week, books, featured_books):
+    """
+    주차 데이터를 아카이브 형식으로 씁니다. 반환값: 레코드 블록 파일 크기(바이트)
+    """
+    records = []        # 레코드 번호 → JSON 줄 (원래 필드 순서 유지)
+    record_ids = {}     # 정규화한 JSON → 레코드 번호 (같은 내용은 한 번만 저장)
+    parsed = []         # 레코드 번호 → 딕셔너리
+    positions = []      # 목록 위치 → 레코드 번호
+
+    def add_record(record):
+        canonical = _canonical(record)
+        record_id = record_ids.get(canonical)
+        if record_id is None:
+            record_id = len(records)
+            record_ids[canonical] = record_id
+            records.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            parsed.append(record)
+        return record_id
+
+    records_by_key = {}
+    for book in books:
+        record_id = add_record(book)
+        positions.append(record_id)
+        records_by_key.setdefault(_book_key(book), []).append(record_id)
+
+    # 주목할만한 책은 week 레코드의 필드를 모두 포함하면 (레코드 참조 + 달라진/추가된 필드)로 저장
+    featured = []
+    for book in featured_books:
+        reference = None
+        for record_id in records_by_key.get(_book_key(book), []):
+            base = parsed[record_id]
+            if all(key in book for key in base) and list(book)[:len(base)] == list(base):
+                extra = {key: value for key, value in book.items() if key not in base or base[key] != value}
+                reference = {"ref": record_id, "extra": extra}
+                break
+        if reference is None:
+            reference = {"ref": add_record(book), "extra": {}}
+        featured.append(reference)
+
+    blocks = []
+    compressed_blocks = []
+    offset = 0
+    for start in range(0, len(records), BLOCK_SIZE):
+        chunk = ("\n".join(records[start:start + BLOCK_SIZE]) + "\n").encode('utf-8')
+        compressed = zlib.compress(chunk, COMPRESS_LEVEL)
+        compressed_blocks.append(compressed)
+        blocks.append([offset, len(compressed)])
+        offset += len(compressed)
+
+    data_path, index_path = archive_paths(data_dir, year, week)
+    os.makedirs(os.path.dirname(data_path), exist_ok=True)
+    atomic_write_bytes(data_path, b"".join(compressed_blocks))
+
+    scrape_dates = [book.get("scrape_date") for book in books if book.get("scrape_date")]
+
+    # 색인을 마지막에 써서, 색인이 있으면 블록 파일도 완전하다는 것을 보장
+    atomic_write_json(index_path, {
+        "version": ARCHIVE_VERSION,
+        "year": year,
+        "week": week,
+        "last_scrape": max(scrape_dates) if scrape_dates else None,
+        "block_size": BLOCK_SIZE,
+        "record_count": len(records),
+        "blocks": blocks,
+        "positions": positions,
+        "featured": featured
+    }, separators=(",", ":"))
+    return offset
+
+class WeekArchive:
+    """
+    아카이브 하나의 지연 로딩 리더입니다. 색인만 먼저 읽고, 레코드는 필요한 블록만 압축을 풉니다.
+    """
+    def __init__(self, data_dir, year, week):
+        self.year = year
+        self.week = week
+        self.data_path, self.index_path = archive_paths(data_dir, year, week)
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get("version") != ARCHIVE_VERSION:
+            raise ValueError(f"지원하지 않는 아카이브 버전입니다: {self.index_path}")
+        self.last_scrape = index.get("last_scrape")
+        self.block_size = index["block_size"]
+        self.blocks = index["blocks"]
+        self.positions = index["positions"]
+        self.featured_refs = index["featured"]
+        self._block_cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.positions)
+
+    def _block(self, block_no):
+        with self._lock:
+            lines = self._block_cache.get(block_no)
+            if lines is not None:
+                self._block_cache.move_to_end(block_no)
+                return lines
+
+        offset, length = self.blocks[block_no]
+        with open(self.data_path, 'rb') as f:
+            f.seek(offset)
+            lines = zlib.decompress(f.read(length)).decode('utf-8').split("\n")
+
+        with self._lock:
+            self._block_cache[block_no] = lines
+            while len(self._block_cache) > BLOCK_CACHE_SIZE:
+                self._block_cache.popitem(last=False)
+        return lines
+
+    def record(self, record_id):
+        """
+        레코드 번호의 책 딕셔너리 (매번 새 딕셔너리)
+        """
+        block_no, line_no = divmod(record_id, self.block_size)
+        return json.loads(self._block(block_no)[line_no])
+
+    def get(self, position):
+        """
+        목록 위치의 책 한 권
+        """
+        return self.record(self.positions[position])
+
+    def page(self, start, stop):
+        """
+        목록 위치 [start, stop) 범위의 책
+        """
+        return [self.record(record_id) for record_id in self.positions[start:stop]]
+
+    def books(self):
+        return self.page(0, len(self.positions))
+
+    def featured(self):
+        """
+        주목할만한 책 목록 (참조한 레코드 + 선정 때 붙은 필드)
+        """
+        books = []
+        for reference in self.featured_refs:
+            book = self.record(reference["ref"])
+            book.update(reference["extra"])
+            books.append(book)
+        return books
+
+def load_week(data_dir, year, week, registry=None):
+    """
+    주차의 (전체 도서, 주목할만한 책)을 JSON 파일 또는 아카이브에서 읽습니다. 없으면 ([], [])
+    참조 목록 형식의 week 파일은 registry(없으면 data_dir의 레지스트리)로 풉니다.
+    """
+    week_path = os.path.join(data_dir, f"week_{year}_W{week:02d}.json")
+    featured_path = os.path.join(data_dir, f"interesting_week_{year}_W{week:02d}.json")
+    if os.path.exists(week_path) or os.path.exists(featured_path):
+        books, featured = [], []
+        if os.path.exists(week_path):
+            books = read_week_file(week_path, data_dir, registry)
+        if os.path.exists(featured_path):
+            with open(featured_path, 'r', encoding='utf-8') as f:
+                featured = json.load(f)
+        return books, featured
+
+    if is_archived(data_dir, year, week):
+        archive = WeekArchive(data_dir, year, week)
+        return archive.books(), archive.featured()
+    return [], []
+
+def archive_week(data_dir, year, week, remove_json=True):
+    """
+    주차 JSON 파일을 아카이브로 옮기고, 다시 읽어 원본과 같은지 확인한 뒤 JSON 파일을 지웁니다.
+    반환값: (원본 JSON 크기, 아카이브 크기) 바이트
+    """
+    week_path = os.path.join(data_dir, f"week_{year}_W{week:02d}.json")
+    featured_path = os.path.join(data_dir, f"interesting_week_{year}_W{week:02d}.json")
+    books, featured = load_week(data_dir, year, week)
+
+    write_archive(data_dir, year, week, books, featured)
+
+    archive = WeekArchive(data_dir, year, week)
+    if archive.books() != books or archive.featured() != featured:
+        raise ValueError(f"아카이브 검증 실패: {year}년 {week}주차")
+
+    original_size = sum(os.path.getsize(path) for path in (week_path, featured_path) if os.path.exists(path))
+    archive_size = os.path.getsize(archive.data_path) + os.path.getsize(archive.index_path)
+    if remove_json:
+        for path in (week_path, featured_path):
+            if os.path.exists(path):
+                os.remove(path)
+    return original_size, archive_size
+
+def archive_closed_weeks(data_dir=DATA_DIR, remove_json=True, today=None):
+    """
+    현재 ISO 주차보다 이전인 주차 JSON 파일을 모두 아카이브로 옮기고, 레지스트리, 매니페스트,
+    검색 색인을 아카이브에 맞춥니다. 스크래퍼와 같은 data 쓰기 잠금 안에서 실행합니다.
+    반환값: 아카이브한 (연도, 주차) 목록
+    """
+    today = today or datetime.date.today()
+    current = tuple(today.isocalendar()[:2])
+
+    archived = []
+    with data_dir_lock(data_dir):
+        for name in sorted(os.listdir(data_dir)):
+            match = WEEK_FILE_PATTERN.match(name)
+            if not match:
+                continue
+            year, week = int(match.group(1)), int(match.group(2))
+            if (year, week) >= current:
+                continue
+            original_size, archive_size = archive_week(data_dir, year, week, remove_json)
+            logger.info(f"아카이브 완료: {year}년 {week}주차 ({original_size:,}바이트 → {archive_size:,}바이트)")
+            archived.append((year, week))
+
+        if not archived:
+            return archived
+
+        # JSON 파일을 지운 주차는 더 이상 레지스트리 레코드를 참조하지 않음 (아카이브는 레코드를 직접 저장)
+        if remove_json:
+            registry = load_registry(data_dir)
+            for year, week in archived:
+                registry.unpin_week(year, week)
+            registry.prune_records()
+            if registry.dirty:
+                save_registry(registry, data_dir)
+
+        # 매니페스트와 검색 색인이 아카이브를 가리키도록 갱신 (두 모듈이 이 모듈을 import하므로 여기서 import)
+        from manifest import build_manifest, week_checksums
+        from search_index import update_search_index
+        update_search_index(data_dir, week_checksums(build_manifest(data_dir)))
+    return archived
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    target_dir = args[0] if args else DATA_DIR
+    result = archive_closed_weeks(target_dir, remove_json="--keep-json" not in sys.argv)
+    print(f"{len(result)}개 주차 아카이브 완료")